@@ -0,0 +1,212 @@
+# backend/app/compression.py
+
+from typing import Dict, List, Optional
+import gzip
+import threading
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..settings import (
+    RESPONSE_BROTLI_QUALITY,
+    RESPONSE_COMPRESSION_ENCODINGS,
+    RESPONSE_COMPRESSION_MIN_BYTES,
+    RESPONSE_GZIP_LEVEL,
+)
+
+# Server preference order
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+
+def accepted_encodings(accept_encoding: str, supported=SUPPORTED_ENCODINGS) -> List[str]:
+    """
+    Encodings from an Accept-Encoding header that the client accepts
+    (q > 0), in our preference order.
+    """
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token] = q
+    return [
+        encoding for encoding in supported
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+
+
+def enabled_encodings() -> List[str]:
+    return [
+        e for e in RESPONSE_COMPRESSION_ENCODINGS
+        if e in SUPPORTED_ENCODINGS and (e != "br" or brotli is not None)
+    ]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """The enabled encoding the client prefers, or None for identity."""
+    enabled = enabled_encodings()
+    for encoding in accepted_encodings(accept_encoding):
+        if encoding in enabled:
+            return encoding
+    return None
+
+
+def compress_bytes(
+    data: bytes,
+    encoding: str,
+    *,
+    gzip_level: int = RESPONSE_GZIP_LEVEL,
+    brotli_quality: int = RESPONSE_BROTLI_QUALITY,
+) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=RESPONSE_BROTLI_QUALITY)
+            self._gz = None
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(RESPONSE_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._br is not None:
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._br is not None:
+            return self._br.finish()
+        return self._gz.flush()
+
+
+class CompressionMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.responses: Dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def record(self, encoding: str, size_in: int, size_out: int) -> None:
+        with self._lock:
+            self.responses[encoding] = self.responses.get(encoding, 0) + 1
+            self.bytes_in += size_in
+            self.bytes_out += size_out
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "responses": dict(self.responses),
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "ratio": self.bytes_out / self.bytes_in if self.bytes_in else None,
+            }
+
+
+compression_metrics = CompressionMetrics()
+
+
+def _is_json(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+class CompressionMiddleware:
+    """
+    Brotli/gzip for JSON responses, negotiated from Accept-Encoding.
+    Bodies under RESPONSE_COMPRESSION_MIN_BYTES and responses that already
+    carry a Content-Encoding (e.g. the cached content document) pass
+    through untouched. Streamed JSON bodies are compressed chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = RESPONSE_COMPRESSION_MIN_BYTES) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+        size_in = size_out = 0
+
+        async def wrapped_send(message: Message) -> None:
+            nonlocal start, compressor, passthrough, size_in, size_out
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None and passthrough:
+                await send(message)
+                return
+
+            if start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if (
+                    "content-encoding" in headers
+                    or not _is_json(headers.get("content-type", ""))
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start)
+                    start = None
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    compressed = compress_bytes(body, encoding)
+                    headers["Content-Length"] = str(len(compressed))
+                    compression_metrics.record(encoding, len(body), len(compressed))
+                    await send(start)
+                    start = None
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                del headers["Content-Length"]
+                compressor = _StreamCompressor(encoding)
+                await send(start)
+                start = None
+
+            if passthrough or compressor is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            size_in += len(body)
+            size_out += len(chunk)
+            if not more_body:
+                compression_metrics.record(encoding, size_in, size_out)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, wrapped_send)
@@ -0,0 +1,158 @@
+# backend/app/instrumentation.py
+
+from typing import Iterable
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..database import async_engine
+from ..db_pool import pool_metrics, pool_status
+from ..metrics import HTTP_DURATION, HTTP_IN_FLIGHT, HTTP_REQUESTS, Collected, registry
+from ..query_profiler import profile_queries
+from .compression import compression_metrics
+from .services.audit_log import download_audits
+from .services.content_cache import content_cache
+
+logger = logging.getLogger(__name__)
+
+# Label for requests no route matched (404s for arbitrary paths), so
+# scanners cannot blow up the number of series
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the route that handled the request. FastAPI leaves the
+    router's own APIRoute in scope["route"] (without the include prefix, e.g.
+    /content/{section}); the prefixed template is on its route context.
+    """
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(context, "path_format", None) or getattr(scope.get("route"), "path", None)
+    return path or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Per-route request counts and latency (time to the last body byte), plus
+    in-flight requests. Routes are labelled by their template
+    (/api/content/{section}), not the concrete path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            path = route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method, path, str(status))
+            HTTP_DURATION.observe(time.perf_counter() - started, method, path)
+
+
+class QueryProfilerMiddleware:
+    """
+    Opt-in (DB_PROFILE_QUERIES): profiles the SQL each request runs, adds
+    X-DB-Queries and Server-Timing headers (queries until the response
+    starts; a streamed body's queries only reach the N+1 log) and logs
+    statements repeated often enough to look like N+1 loops.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Queries"] = str(profile.count)
+                    headers.append("Server-Timing", profile.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        for shape, count in profile.repeated():
+            logger.warning(
+                "Possible N+1 in %s %s: %d x %s",
+                scope["method"], route_template(scope), count, shape,
+            )
+
+
+def _app_stats() -> Iterable[Collected]:
+    """
+    Scrape-time view of the counters the services already keep.
+    """
+    cache = content_cache.stats()
+    yield ("content_cache_requests_total", "counter", "Content cache lookups by result.", [
+        ({"result": "hit"}, cache["hits"]),
+        ({"result": "miss"}, cache["misses"]),
+        ({"result": "not_modified"}, cache["not_modified"]),
+    ])
+    yield ("content_cache_hit_ratio", "gauge", "Content cache hits / (hits + misses).", [
+        ({}, cache["hit_ratio"]),
+    ])
+    yield ("content_cache_invalidations_total", "counter", "Content cache invalidations.", [
+        ({}, cache["invalidations"]),
+    ])
+
+    compression = compression_metrics.snapshot()
+    yield ("response_compression_total", "counter", "Responses compressed by the middleware.", [
+        ({"encoding": encoding}, count) for encoding, count in compression["responses"].items()
+    ])
+    yield ("response_compression_bytes_total", "counter", "Bytes before/after compression.", [
+        ({"direction": "in"}, compression["bytes_in"]),
+        ({"direction": "out"}, compression["bytes_out"]),
+    ])
+
+    audits = download_audits.stats()
+    yield ("download_audits_queued", "gauge", "Download audits waiting to be written.", [
+        ({}, audits["queued"] + audits["pending"]),
+    ])
+    yield ("download_audits_written_total", "counter", "Download audits written.", [
+        ({}, audits["written"]),
+    ])
+
+    pool = pool_status(async_engine.pool)
+    events = pool_metrics.snapshot()
+    yield ("db_pool_connections", "gauge", "Pool connections by state.", [
+        ({"state": "checked_in"}, pool.get("checked_in", 0)),
+        ({"state": "checked_out"}, pool.get("checked_out", 0)),
+    ])
+    yield ("db_pool_waiting", "gauge", "Checkouts waiting for a connection.", [
+        ({}, events["waiting"]),
+    ])
+    yield ("db_pool_checkout_wait_seconds_total", "counter", "Time spent getting connections.", [
+        ({}, events["wait_seconds_total"]),
+    ])
+    yield ("db_pool_events_total", "counter", "Pool events.", [
+        ({"event": name}, events[name])
+        for name in ("checkouts", "connects", "invalidations", "timeouts", "overflow_connects")
+    ])
+
+
+def install_collectors() -> None:
+    registry.add_collector(_app_stats)
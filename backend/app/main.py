@@ -1,45 +1,129 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
-from ..settings import FRONTEND_ORIGINS, PUBLIC_MEDIA_ROOT
-from ..database import Base, engine
+from ..settings import (
+    DB_PROFILE_QUERIES,
+    FRONTEND_ORIGINS,
+    MEDIA_SCRUB_INTERVAL_SECONDS,
+    METRICS_ENABLED,
+    MIGRATE_ON_STARTUP,
+    PUBLIC_MEDIA_ROOT,
+)
+from ..metrics import registry
+from ..storage import ensure_media_roots
 from .routes import content as content_routes
 from .routes import contact as contact_routes
 from .routes import careers as careers_routes
 from .routes import media as media_routes
 from .routes import admin_applications as admin_applications_routes
+from .routes import admin_database as admin_database_routes
+from .compression import CompressionMiddleware
+from .instrumentation import MetricsMiddleware, QueryProfilerMiddleware, install_collectors
+from .static_files import PrecompressedStaticFiles
+from .services.audit_log import download_audits
+from .services.content_snapshot import ensure_snapshot
+from .services.image_variants import shutdown_image_pool
+from .services.integrity import run_scrubber
 
-# Create tables at startup (simple bootstrapping; Alembic later if you want)
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Business Website API")
 
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=FRONTEND_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+async def _migrate() -> None:
+    # Imported here: only needed (with the sync DB driver) when opted in
+    from ..database import get_sync_engine
+    from ..migrations import run_migrations
+
+    await asyncio.to_thread(run_migrations, get_sync_engine(), logger.info)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes run once per deployment (python -m backend.scripts.migrate),
+    # so a normal worker start does no DDL and no schema round-trips.
+    if MIGRATE_ON_STARTUP:
+        await _migrate()
+    ensure_media_roots()
+    if MIGRATE_ON_STARTUP:
+        # What the migrate step does after migrating: write the first snapshot
+        await ensure_snapshot()
+    await download_audits.start()
+    scrubber = None
+    if MEDIA_SCRUB_INTERVAL_SECONDS > 0:
+        scrubber = asyncio.create_task(run_scrubber(MEDIA_SCRUB_INTERVAL_SECONDS))
+    yield
+    if scrubber is not None:
+        scrubber.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await scrubber
+    await download_audits.stop()
+    shutdown_image_pool()
+
+
+def create_app() -> FastAPI:
+    """
+    Build the API application. Nothing here touches the database or the
+    filesystem; that happens in `lifespan` when the server starts.
+
+        uvicorn --factory backend.app.main:create_app
+    """
+    app = FastAPI(title="Business Website API", lifespan=lifespan)
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=FRONTEND_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Brotli/gzip for JSON responses
+    app.add_middleware(CompressionMiddleware)
+
+    # Per-request SQL counts/timings and N+1 warnings (dev/staging)
+    if DB_PROFILE_QUERIES:
+        app.add_middleware(QueryProfilerMiddleware)
+
+    # Outermost, so latency covers compression and CORS too
+    if METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+        install_collectors()
 
+    @app.get("/health")
+    async def health_check():
+        return {"status": "ok"}
 
-@app.get("/health")
-async def health_check():
-    return {"status": "ok"}
+    if METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            """
+            Prometheus text exposition for this worker.
+            """
+            return Response(
+                registry.render(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
 
+    # Routers – everything under /api/*
+    app.include_router(content_routes.router, prefix="/api")
+    app.include_router(contact_routes.router, prefix="/api")
+    app.include_router(careers_routes.router, prefix="/api")
+    app.include_router(media_routes.router, prefix="/api")
+    app.include_router(admin_applications_routes.router)
+    app.include_router(admin_database_routes.router)
 
-# Routers – everything under /api/*
-app.include_router(content_routes.router, prefix="/api")
-app.include_router(contact_routes.router, prefix="/api")
-app.include_router(careers_routes.router, prefix="/api")
-app.include_router(media_routes.router, prefix="/api")
-app.include_router(admin_applications_routes.router)
+    # Public media (hero images, icons, resumes if you expose them);
+    # serves .br/.gz siblings written at upload time when the client accepts them.
+    # The directory is created in lifespan, so it is not checked here.
+    app.mount(
+        "/media",
+        PrecompressedStaticFiles(directory=str(PUBLIC_MEDIA_ROOT), check_dir=False),
+        name="media",
+    )
 
-# Public media (hero images, icons, resumes if you expose them)
-app.mount(
-    "/media",
-    StaticFiles(directory=str(PUBLIC_MEDIA_ROOT)),
-    name="media",
-)
\ No newline at end of file
+    return app
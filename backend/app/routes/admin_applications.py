@@ -1,31 +1,193 @@
 # backend/app/routes/admin_applications.py
-from fastapi import APIRouter, Depends, Header, HTTPException
-from sqlalchemy.orm import Session
+import asyncio
+import base64
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from ...database import get_db
-from ...models import CareerApplication, MediaAsset
-from ...settings import ADMIN_API_KEY
+from ...models import CareerApplication
+from ..services.application_export import (
+    EXPORT_FORMATS,
+    export_query,
+    export_rows,
+    gzip_stream,
+)
+from ..services.application_search import search_applications
+from ..services.audit_log import download_audits
+from ..services.resume_bundle import (
+    build_manifest,
+    find_bundle_entries,
+    stat_entries,
+    stream_resume_zip,
+)
+from ...settings import (
+    ADMIN_API_KEY,
+    ADMIN_APPLICATIONS_MAX_PAGE_SIZE,
+    ADMIN_APPLICATIONS_PAGE_SIZE,
+    RESUME_BUNDLE_MAX_FILES,
+)
 
 router = APIRouter(prefix="/api/admin", tags=["admin-applications"])
 
+LIST_COLUMNS = (
+    CareerApplication.id,
+    CareerApplication.full_name,
+    CareerApplication.email,
+    CareerApplication.phone,
+    CareerApplication.position,
+    CareerApplication.created_at,
+    CareerApplication.resume_file_id,
+)
+
 def verify_admin_api_key(x_api_key: str | None = Header(default=None)) -> None:
     if x_api_key != ADMIN_API_KEY:
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
+def encode_cursor(created_at: datetime, app_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{app_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        created_at, app_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(app_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get("/applications", dependencies=[Depends(verify_admin_api_key)])
-def list_applications(db: Session = Depends(get_db)):
-    apps = (
-        db.query(CareerApplication)
-        .order_by(CareerApplication.created_at.desc())
-        .all()
+async def list_applications(
+    cursor: str | None = None,
+    limit: int = Query(default=ADMIN_APPLICATIONS_PAGE_SIZE, ge=1, le=ADMIN_APPLICATIONS_MAX_PAGE_SIZE),
+    position: str | None = None,
+    role: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Newest applications first, one page at a time. Pass `next_cursor` from
+    the previous page as `cursor`; each page is an index range scan on
+    (created_at, id), so its cost does not grow with the page number.
+    `position` is an exact (indexed) match, `role` a substring match.
+    Use /applications/export to stream everything at once.
+    """
+    stmt = select(*LIST_COLUMNS)
+    if position:
+        stmt = stmt.where(CareerApplication.position == position)
+    if role:
+        stmt = stmt.where(CareerApplication.position.ilike(f"%{role}%"))
+    if cursor:
+        stmt = stmt.where(
+            tuple_(CareerApplication.created_at, CareerApplication.id)
+            < tuple_(*decode_cursor(cursor))
+        )
+    stmt = stmt.order_by(
+        CareerApplication.created_at.desc(), CareerApplication.id.desc()
+    ).limit(limit + 1)
+
+    # One bounded page (at most limit + 1 rows) held in memory as plain row
+    # mappings; no ORM objects are built for a listing
+    rows = (await db.execute(stmt)).mappings().all()
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/applications/export", dependencies=[Depends(verify_admin_api_key)])
+async def export_applications(
+    request: Request,
+    format: str = Query(default="csv", pattern="^(csv|ndjson)$"),
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    position: str | None = None,
+    role: str | None = None,
+):
+    """
+    Stream every matching application, oldest first, as CSV or NDJSON.
+    Gzipped on the fly when the client sends Accept-Encoding: gzip.
+    """
+    stmt = export_query(
+        created_from=created_from,
+        created_to=created_to,
+        position=position,
+        role=role,
+    )
+    body = export_rows(stmt, format)
+    headers = {
+        "Content-Disposition": f'attachment; filename="applications.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in request.headers.get("accept-encoding", "").lower():
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=EXPORT_FORMATS[format], headers=headers)
+
+@router.get("/applications/resumes", dependencies=[Depends(verify_admin_api_key)])
+async def download_resume_bundle(
+    ids: list[int] = Query(default=[]),
+    position: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    x_api_key: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream a ZIP of the resumes for the selected applications (by ID list,
+    exact position and/or created_at range) plus a manifest.csv mapping
+    applications to archive entries. Audited as one batch.
+    """
+    if not (ids or position or created_from or created_to):
+        raise HTTPException(
+            status_code=400,
+            detail="Select applications by ids, position or date range.",
+        )
+
+    entries = await find_bundle_entries(
+        db,
+        ids=ids,
+        position=position,
+        created_from=created_from,
+        created_to=created_to,
+        limit=RESUME_BUNDLE_MAX_FILES,
+    )
+    if len(entries) > RESUME_BUNDLE_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Selection exceeds {RESUME_BUNDLE_MAX_FILES} resumes; narrow it down.",
+        )
+    await asyncio.to_thread(stat_entries, entries)
+
+    await download_audits.record_many(
+        [e.asset_id for e in entries if e.size_bytes is not None],
+        f"admin_api:{x_api_key[:4]}... (bundle)" if x_api_key else "unknown",
+    )
+
+    label = position or ("selection" if ids else "applications")
+    filename = f"resumes-{''.join(c if c.isalnum() else '-' for c in label)}.zip"
+    return StreamingResponse(
+        stream_resume_zip(entries, build_manifest(entries)),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get("/applications/search", dependencies=[Depends(verify_admin_api_key)])
+async def search_applications_endpoint(
+    q: str = Query(min_length=1),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=ADMIN_APPLICATIONS_PAGE_SIZE, ge=1),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Relevance-ranked search over name, email, position and message
+    (FTS5 on SQLite, full-text + trigram indexes on Postgres).
+    """
+    return await search_applications(
+        db,
+        q,
+        page=page,
+        page_size=min(page_size, ADMIN_APPLICATIONS_MAX_PAGE_SIZE),
     )
-    return [
-        {
-            "id": a.id,
-            "full_name": a.full_name,
-            "email": a.email,
-            "position": a.position,
-            "created_at": a.created_at,
-            "resume_file_id": a.resume_file_id,
-        }
-        for a in apps
-    ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+# backend/app/routes/admin_database.py
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from ...database import async_engine
+from ...db_pool import pool_metrics, pool_status
+from ...settings import ADMIN_API_KEY, WEB_CONCURRENCY
+
+router = APIRouter(prefix="/api/admin", tags=["admin-database"])
+
+
+def verify_admin_api_key(x_api_key: str | None = Header(default=None)) -> None:
+    if x_api_key != ADMIN_API_KEY:
+        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+
+
+async def _server_max_connections() -> Optional[int]:
+    if async_engine.dialect.name != "postgresql":
+        return None
+    try:
+        async with async_engine.connect() as conn:
+            return int((await conn.execute(text("SHOW max_connections"))).scalar_one())
+    except DBAPIError:
+        return None
+
+
+@router.get("/db/pool", dependencies=[Depends(verify_admin_api_key)])
+async def get_pool_metrics() -> Dict[str, Any]:
+    """
+    Admin-only: this worker's connection pool gauges and event counters,
+    plus what WEB_CONCURRENCY workers need against Postgres max_connections.
+    """
+    status = pool_status(async_engine.pool)
+    per_worker = status.get("max_connections")
+    return {
+        "pool": status,
+        "events": pool_metrics.snapshot(),
+        "workers": WEB_CONCURRENCY,
+        "connections_needed": per_worker * WEB_CONCURRENCY if per_worker is not None else None,
+        "server_max_connections": await _server_max_connections(),
+    }
+
+
+@router.post("/db/pool/reset", dependencies=[Depends(verify_admin_api_key)])
+async def reset_pool_metrics() -> Dict[str, str]:
+    """
+    Admin-only: zero this worker's pool event counters (e.g. before a load test).
+    """
+    pool_metrics.reset()
+    return {"detail": "Pool metrics reset"}
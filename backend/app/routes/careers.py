@@ -1,11 +1,18 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Header
-from sqlalchemy.orm import Session
+import asyncio
+
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Header, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import get_db
 from ...models import MediaAsset, CareerApplication
-from ...schemas import CareerApplicationResponse, CareerApplicationAdmin
-from ...storage import save_file_local
+from ...schemas import (
+    CareerApplicationResponse,
+    CareerPositionSearchResponse,
+)
+from ...storage import delete_stored_file, restore_blob_file, save_file_local
 from ...settings import PRIVATE_MEDIA_ROOT, ADMIN_API_KEY
+from ..services.careers_index import careers_index
+from ..services.media_service import add_blob_reference
 
 router = APIRouter(tags=["careers"])
 
@@ -13,6 +20,29 @@ def verify_admin_api_key(x_api_key: str = Header(default=None)) -> None:
     if x_api_key != ADMIN_API_KEY:
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
+@router.get("/careers/positions", response_model=CareerPositionSearchResponse)
+async def search_positions(
+    q: str | None = None,
+    team: list[str] = Query(default=[]),
+    work_mode: list[str] = Query(default=[], alias="workMode"),
+    level: list[str] = Query(default=[]),
+    tags: list[str] = Query(default=[]),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100, alias="pageSize"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Public endpoint: filter, search and paginate open positions, with facet counts.
+    Backed by an in-memory index rebuilt once per content version.
+    """
+    index = await careers_index.get(db)
+    return index.search(
+        q=q,
+        filters={"team": team, "workMode": work_mode, "level": level, "tags": tags},
+        page=page,
+        page_size=page_size,
+    )
+
 @router.post("/careers/apply", response_model=CareerApplicationResponse)
 async def apply_career(
     full_name: str = Form(...),
@@ -21,7 +51,7 @@ async def apply_career(
     position: str = Form(...),
     message: str = Form(None),
     resume: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     allowed_types = {
         "application/pdf",
@@ -51,7 +81,8 @@ async def apply_career(
         created_by=f"careers_form:{email}",
     )
     db.add(media)
-    db.flush()
+    duplicate = await add_blob_reference(db, media)
+    await db.flush()
 
     application = CareerApplication(
         full_name=full_name,
@@ -62,7 +93,10 @@ async def apply_career(
         resume_file_id=media.id,
     )
     db.add(application)
-    db.commit()
+    await db.commit()
+    await restore_blob_file(resume, media.storage_path, "private")
+    if duplicate:
+        await asyncio.to_thread(delete_stored_file, duplicate, "private")
 
     print(
         " New career application:",
@@ -72,25 +106,10 @@ async def apply_career(
             "phone": phone,
             "position": position,
             "resume_file_id": media.id,
-            "resume_path": str(PRIVATE_MEDIA_ROOT / storage_path),
+            "resume_path": str(PRIVATE_MEDIA_ROOT / media.storage_path),
             "size_bytes": size_bytes,
             "sha256": sha256_hash,
         },
     )
 
     return CareerApplicationResponse(detail="Application received successfully.")
-
-@router.get(
-    "/admin/applications",
-    response_model=list[CareerApplicationAdmin],
-    dependencies=[Depends(verify_admin_api_key)],
-)
-def list_applications(
-    role: str | None = None,
-    db: Session = Depends(get_db),
-):
-    query = db.query(CareerApplication)
-    if role:
-        query = query.filter(CareerApplication.position.ilike(f"%{role}%"))
-    apps = query.order_by(CareerApplication.created_at.desc()).all()
-    return apps
\ No newline at end of file
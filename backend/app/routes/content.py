@@ -1,19 +1,34 @@
 # backend/app/routes/content.py
 
-from typing import Any, Dict, List, Literal
-import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Literal, Optional
+import hashlib
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import get_db
 from ..services.content_service import (
+    ContentVersionConflict,
     load_content_from_db,
+    load_version_content,
+    patch_content_in_db,
     save_content_to_db,
     ADMIN_API_KEY,
 )
+from ..compression import compression_metrics, enabled_encodings, negotiate_encoding
+from ..services.content_cache import SelectionKey, content_cache
+from ..services.json_patch import JsonPatchError, JsonPatchTestFailed
+from ..services.json_pointer import JsonPointerError
 from ...models import ContentVersion
+from ...settings import (
+    CONTENT_CACHE_MAX_AGE,
+    CONTENT_STALE_WHILE_REVALIDATE,
+    RESPONSE_COMPRESSION_MIN_BYTES,
+)
 
 HomeLayoutVariant = Literal["classic", "sleek"]
 
@@ -28,80 +43,345 @@ def verify_admin_api_key(x_api_key: str | None = Header(default=None)) -> None:
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
 
+def if_match_version(if_match: str | None = Header(default=None)) -> Optional[int]:
+    """
+    Parse an `If-Match: "<version>"` precondition (the ETag of any
+    representation of that version). Absent or `*` means the write is not
+    conditional; a weak or non-version tag can never match.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.split(",")[0].strip()
+    if tag.startswith('"') and tag.endswith('"') and len(tag) >= 2:
+        tag = tag[1:-1].split("-")[0]
+    if not tag.isdigit():
+        raise HTTPException(status_code=412, detail="Precondition failed: If-Match does not name a version")
+    return int(tag)
+
+
+def _conflict(exc: ContentVersionConflict, expected_version: Optional[int]) -> HTTPException:
+    # 412 when the client's If-Match lost; 409 when blind retries ran out
+    status_code = 412 if expected_version is not None else 409
+    headers = {"ETag": f'"{exc.current}"'} if exc.current is not None else None
+    return HTTPException(status_code=status_code, detail=str(exc), headers=headers)
+
+
+def _cache_control() -> str:
+    value = f"public, max-age={CONTENT_CACHE_MAX_AGE}"
+    if CONTENT_STALE_WHILE_REVALIDATE > 0:
+        value += f", stale-while-revalidate={CONTENT_STALE_WHILE_REVALIDATE}"
+    return value
+
+
+def _as_utc(value: datetime) -> datetime:
+    # created_at is stored as naive UTC (datetime.utcnow)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+WHOLE_DOCUMENT: SelectionKey = (None, (), None)
+
+
+def content_etag(
+    version: int,
+    selection: SelectionKey = WHOLE_DOCUMENT,
+    encoding: Optional[str] = None,
+) -> str:
+    """
+    Strong ETag for one representation of a content version. Sections,
+    fields/pointer selections and each content-coding get their own tag
+    (`"<version>-<selection hash>-br"`); the whole uncompressed document
+    is plain `"<version>"`, the tag writes return and If-Match expects.
+    """
+    tag = str(version)
+    if selection != WHOLE_DOCUMENT:
+        tag += "-" + hashlib.sha256(repr(selection).encode()).hexdigest()[:12]
+    if encoding is not None:
+        tag += f"-{encoding}"
+    return f'"{tag}"'
+
+
+def content_validators(
+    version: int,
+    created_at: Optional[datetime],
+    etag: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    ETag / Last-Modified / Cache-Control headers for a given content version.
+    A version's JSON never changes, so its ETags are strong validators.
+    """
+    headers = {
+        "ETag": etag or content_etag(version),
+        "Cache-Control": _cache_control(),
+        "Vary": "Accept-Encoding",
+    }
+    if created_at is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(created_at), usegmt=True)
+    return headers
+
+
+def not_modified_etag(
+    request: Request,
+    version: int,
+    created_at: Optional[datetime],
+    selection: SelectionKey = WHOLE_DOCUMENT,
+) -> Optional[str]:
+    """
+    Evaluate If-None-Match (preferred) or If-Modified-Since against a
+    version. Returns the ETag for the 304, or None if the client's copy is
+    stale. If-None-Match uses the weak comparison (RFC 9110 13.1.2): `W/`
+    is ignored, and a tag for any content-coding of this same selection
+    matches, since the client already holds that representation.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [content_etag(version, selection)] + [
+            content_etag(version, selection, encoding) for encoding in enabled_encodings()
+        ]
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == "*":
+                return etags[0]
+            if candidate in etags:
+                return candidate
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and created_at is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if _as_utc(created_at) <= since:
+            return content_etag(version, selection)
+    return None
+
+
+def _parse_fields(fields: Optional[str]) -> tuple:
+    if not fields:
+        return ()
+    return tuple(name.strip() for name in fields.split(",") if name.strip())
+
+
+async def _serve_content(
+    request: Request,
+    db: AsyncSession,
+    section: Optional[str] = None,
+    fields: Optional[str] = None,
+    pointer: Optional[str] = None,
+) -> Response:
+    """
+    Shared read path for the whole document, a section, or a selection.
+    Conditional requests for the current version get a 304 without the
+    document being loaded or serialized; compressed bodies are cached per
+    version and encoding, so CompressionMiddleware leaves them alone.
+    """
+    if fields and pointer is not None:
+        raise HTTPException(status_code=400, detail="Use either fields or pointer, not both")
+    selection: SelectionKey = (section, _parse_fields(fields), pointer)
+
+    stamp = await content_cache.latest_stamp(db)
+    # The whole document always exists; anything narrower has to resolve
+    # (or 404) before a 304 can be given
+    if stamp is not None and selection == WHOLE_DOCUMENT:
+        etag = not_modified_etag(request, *stamp)
+        if etag is not None:
+            content_cache.record_not_modified()
+            return Response(status_code=304, headers=content_validators(*stamp, etag=etag))
+
+    cached = await content_cache.get(db, stamp)
+    try:
+        body = cached.render(*selection)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Section not found")
+    except JsonPointerError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+    if selection != WHOLE_DOCUMENT:
+        etag = not_modified_etag(request, cached.version, cached.created_at, selection)
+        if etag is not None:
+            content_cache.record_not_modified()
+            return Response(
+                status_code=304,
+                headers=content_validators(cached.version, cached.created_at, etag=etag),
+            )
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    if encoding is not None and len(body) >= RESPONSE_COMPRESSION_MIN_BYTES:
+        body = cached.render_encoded(encoding, *selection)
+        headers = content_validators(
+            cached.version, cached.created_at, etag=content_etag(cached.version, selection, encoding)
+        )
+        headers["Content-Encoding"] = encoding
+    else:
+        headers = content_validators(
+            cached.version, cached.created_at, etag=content_etag(cached.version, selection)
+        )
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/content", response_model=Dict[str, Any])
-def get_content(db: Session = Depends(get_db)):
+async def get_content(
+    request: Request,
+    fields: Optional[str] = Query(default=None, description="Comma-separated top-level sections"),
+    pointer: Optional[str] = Query(default=None, description="RFC 6901 JSON pointer"),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Public endpoint: frontend uses this to render the site.
+    Served from the version-keyed content cache as pre-serialized bytes.
+    """
+    return await _serve_content(request, db, fields=fields, pointer=pointer)
+
+
+@router.get("/admin/content/cache", response_model=Dict[str, Any])
+async def get_content_cache_stats(_: None = Depends(verify_admin_api_key)):
+    """
+    Admin: hit/miss counters for the public content cache, plus
+    response compression totals for this worker.
     """
-    return load_content_from_db(db)
+    return {**content_cache.stats(), "compression": compression_metrics.snapshot()}
 
 
 @router.put("/content")
-def update_content(
+async def update_content(
     new_content: Dict[str, Any],
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
     _: None = Depends(verify_admin_api_key),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Admin-only: replace entire content with a new version.
+    Send `If-Match: "<version>"` to fail with 412 instead of overwriting
+    someone else's publish.
     """
-    version = save_content_to_db(db, new_content)
+    try:
+        version = await save_content_to_db(db, new_content, expected_version=expected_version)
+    except ContentVersionConflict as exc:
+        raise _conflict(exc, expected_version)
+    response.headers["ETag"] = f'"{version}"'
     return {"detail": f"Content updated. New version {version}"}
 
 
+@router.patch("/content")
+async def patch_content(
+    response: Response,
+    patch: Any = Body(...),
+    content_type: str | None = Header(default=None),
+    expected_version: Optional[int] = Depends(if_match_version),
+    _: None = Depends(verify_admin_api_key),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Admin-only: apply a partial update to the latest version.
+    `application/merge-patch+json` (RFC 7386) or `application/json-patch+json`
+    (RFC 6902); with plain JSON an array is a JSON Patch, an object a merge patch.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type == "application/merge-patch+json":
+        merge = True
+    elif media_type == "application/json-patch+json":
+        merge = False
+    else:
+        merge = not isinstance(patch, list)
+
+    try:
+        version = await patch_content_in_db(
+            db, patch, merge=merge, expected_version=expected_version
+        )
+    except ContentVersionConflict as exc:
+        raise _conflict(exc, expected_version)
+    except JsonPatchTestFailed as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    except JsonPatchError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    response.headers["ETag"] = f'"{version}"'
+    return {"detail": f"Content updated. New version {version}", "version": version}
+
+
 @router.get("/content/versions", response_model=List[Dict[str, Any]])
-def list_versions(db: Session = Depends(get_db)):
+async def list_versions(db: AsyncSession = Depends(get_db)):
     """
     Admin-only listing of versions (you can secure this later).
     """
-    versions = (
-        db.query(ContentVersion)
+    result = await db.execute(
+        select(
+            ContentVersion.id,
+            ContentVersion.version,
+            ContentVersion.is_keyframe,
+            ContentVersion.created_at,
+        )
         .order_by(ContentVersion.version.desc())
-        .all()
     )
+    versions = result.all()
 
     return [
         {
             "id": v.id,
             "version": v.version,
+            "is_keyframe": v.is_keyframe is not False,
             "created_at": v.created_at,
         }
         for v in versions
     ]
 
 
+@router.get("/content/{section}")
+async def get_content_section(
+    section: str,
+    request: Request,
+    fields: Optional[str] = Query(default=None, description="Comma-separated keys to keep"),
+    pointer: Optional[str] = Query(default=None, description="RFC 6901 JSON pointer within the section"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Public endpoint: one section (hero, about, services, careers, contact),
+    served from a slice pre-serialized once per content version.
+    """
+    return await _serve_content(request, db, section=section, fields=fields, pointer=pointer)
+
+
 @router.post("/content/rollback/{version}")
-def rollback_content(
+async def rollback_content(
     version: int,
+    response: Response,
+    expected_version: Optional[int] = Depends(if_match_version),
     _: None = Depends(verify_admin_api_key),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Admin-only: rollback to a specific version by copying its JSON into a new version.
     """
-    target = (
-        db.query(ContentVersion)
-        .filter(ContentVersion.version == version)
-        .first()
-    )
+    target = await load_version_content(db, version)
 
-    if not target:
+    if target is None:
         raise HTTPException(status_code=404, detail="Version not found")
 
-    new_version = save_content_to_db(db, json.loads(target.content_json))
+    try:
+        new_version = await save_content_to_db(db, target, expected_version=expected_version)
+    except ContentVersionConflict as exc:
+        raise _conflict(exc, expected_version)
+    response.headers["ETag"] = f'"{new_version}"'
     return {
         "detail": f"Rolled back to version {version}. New version {new_version} created."
     }
     
 @router.get("/admin/home-layout", response_model=HomeLayoutUpdate)
-def get_home_layout(
+async def get_home_layout(
     _: None = Depends(verify_admin_api_key),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Admin: get the current homepage layout variant.
     """
-    content = load_content_from_db(db)
+    content = await load_content_from_db(db)
     hero = content.get("hero") or {}
     layout = hero.get("layoutVariant", "classic")
     if layout not in ("classic", "sleek"):
@@ -110,20 +390,24 @@ def get_home_layout(
 
 
 @router.put("/admin/home-layout", response_model=HomeLayoutUpdate)
-def update_home_layout(
+async def update_home_layout(
     update: HomeLayoutUpdate,
+    expected_version: Optional[int] = Depends(if_match_version),
     _: None = Depends(verify_admin_api_key),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Admin: update only the homepage layout variant, preserving the rest of the content.
     """
-    content = load_content_from_db(db)
-    hero = content.get("hero") or {}
-    hero["layoutVariant"] = update.layoutVariant
-    content["hero"] = hero
-
-    # Save as a new ContentVersion row
-    save_content_to_db(db, content)
+    # Server-side merge patch: no full read-modify-write of the document
+    try:
+        await patch_content_in_db(
+            db,
+            {"hero": {"layoutVariant": update.layoutVariant}},
+            merge=True,
+            expected_version=expected_version,
+        )
+    except ContentVersionConflict as exc:
+        raise _conflict(exc, expected_version)
 
     return update
\ No newline at end of file
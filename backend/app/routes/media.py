@@ -1,13 +1,31 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Header, Depends
+import asyncio
+import base64
+from urllib.parse import quote
+
+from fastapi import APIRouter, UploadFile, File, HTTPException, Header, Depends, Response
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, exists, select
 
 from ...database import get_db
-from ...models import MediaAsset, DownloadAudit
-from ...schemas import MediaUploadResponse
-from ...storage import save_file_local
-from ...settings import ADMIN_API_KEY, PRIVATE_MEDIA_ROOT
+from ...models import CareerApplication, MediaAsset, MediaIntegrityCheck, DownloadAudit
+from ...schemas import MediaUploadResponse, MediaVariant
+from ...storage import delete_stored_file, restore_blob_file, save_file_local
+from ..services.audit_log import download_audits
+from ..services.image_variants import (
+    create_image_variants,
+    delete_image_variants,
+    remove_variant_files,
+    srcset_metadata,
+)
+from ..services.integrity import verify_file
+from ..services.media_service import add_blob_reference, release_asset_file, unreferenced_paths
+from ...settings import (
+    ADMIN_API_KEY,
+    PRIVATE_MEDIA_ACCEL_PREFIX,
+    PRIVATE_MEDIA_ROOT,
+    PUBLIC_MEDIA_BASE_URL,
+)
 
 router = APIRouter(tags=["media"])  # main.py mounts with prefix="/api"
 
@@ -36,7 +54,7 @@ ALLOWED_PUBLIC_MEDIA_TYPES = {
 async def upload_public_media(
     file: UploadFile = File(...),
     kind: str = "hero_image",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     if file.content_type not in ALLOWED_PUBLIC_MEDIA_TYPES:
         raise HTTPException(
@@ -44,7 +62,7 @@ async def upload_public_media(
             detail="Unsupported file type for public media.",
         )
 
-    storage_path, public_url, size_bytes, sha256_hash = await save_file_local(
+    storage_path, _, size_bytes, sha256_hash = await save_file_local(
         file=file,
         visibility="public",
         kind=kind,
@@ -61,28 +79,133 @@ async def upload_public_media(
         created_by="admin",
     )
     db.add(asset)
-    db.commit()
-    db.refresh(asset)
+    duplicate = await add_blob_reference(db, asset)
+    await db.commit()
+    await restore_blob_file(file, asset.storage_path, "public")
+    if duplicate:
+        await asyncio.to_thread(delete_stored_file, duplicate, "public")
+
+    # Resized renditions are rendered in a process pool, off the event loop
+    variants = await create_image_variants(db, asset)
+    if variants:
+        await db.commit()
 
     return MediaUploadResponse(
         id=asset.id,
         kind=asset.kind,
-        url=public_url or None,
-        storage_path=storage_path,
+        url=f"{PUBLIC_MEDIA_BASE_URL}/{asset.storage_path}",
+        storage_path=asset.storage_path,
+        width=asset.width,
+        height=asset.height,
+        variants=[
+            MediaVariant(
+                id=v.id,
+                url=f"{PUBLIC_MEDIA_BASE_URL}/{v.storage_path}",
+                mime_type=v.mime_type,
+                width=v.width,
+                height=v.height,
+                size_bytes=v.size_bytes,
+            )
+            for v in variants
+        ],
+        srcset=srcset_metadata(variants),
     )
 
 
+@router.delete(
+    "/admin/media/{asset_id}",
+    dependencies=[Depends(verify_admin_api_key)],
+)
+async def delete_media_asset(
+    asset_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Admin-only: delete a media asset. The file on disk is removed only when
+    no other asset shares it (content-addressed blobs are reference counted).
+    """
+    # Buffered download audits count as references too
+    await download_audits.flush()
+
+    asset = await db.get(MediaAsset, asset_id)
+    if not asset:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    in_use = await db.scalar(
+        select(
+            exists().where(CareerApplication.resume_file_id == asset.id)
+            | exists().where(DownloadAudit.asset_id == asset.id)
+        )
+    )
+    if in_use:
+        raise HTTPException(
+            status_code=409,
+            detail="Asset is referenced by an application or download audit.",
+        )
+
+    remove_paths = await release_asset_file(db, asset)
+    visibility = "public" if asset.is_public else "private"
+    had_variants = await delete_image_variants(db, asset)
+    await db.execute(delete(MediaIntegrityCheck).where(MediaIntegrityCheck.asset_id == asset.id))
+    await db.delete(asset)
+    await db.commit()
+
+    remove_paths = await unreferenced_paths(db, remove_paths, asset.is_public)
+    for path in remove_paths:
+        await asyncio.to_thread(delete_stored_file, path, visibility)
+    if had_variants:
+        await asyncio.to_thread(remove_variant_files, asset_id)
+    return {"detail": "Asset deleted.", "file_removed": bool(remove_paths)}
+
+
+@router.get(
+    "/admin/media/integrity",
+    dependencies=[Depends(verify_admin_api_key)],
+)
+async def list_integrity_problems(db: AsyncSession = Depends(get_db)):
+    """
+    Admin-only: assets the background scrubber flagged as corrupt or missing.
+    """
+    rows = await db.execute(
+        select(MediaIntegrityCheck, MediaAsset.kind, MediaAsset.storage_path)
+        .join(MediaAsset, MediaAsset.id == MediaIntegrityCheck.asset_id)
+        .where(MediaIntegrityCheck.status != "ok")
+        .order_by(MediaIntegrityCheck.checked_at.desc())
+    )
+    return [
+        {
+            "asset_id": check.asset_id,
+            "kind": kind,
+            "storage_path": storage_path,
+            "status": check.status,
+            "checked_at": check.checked_at,
+        }
+        for check, kind, storage_path in rows
+    ]
+
+
+@router.get(
+    "/admin/media/audit-writer",
+    dependencies=[Depends(verify_admin_api_key)],
+)
+async def audit_writer_stats():
+    """
+    Admin-only: download audit buffer and flush metrics.
+    """
+    return download_audits.stats()
+
+
 @router.get(
     "/admin/files/{file_id}",
     dependencies=[Depends(verify_admin_api_key)],
 )
-def download_private_file(
+async def download_private_file(
     file_id: int,
     x_api_key: str = Header(default=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     stmt = select(MediaAsset).where(MediaAsset.id == file_id)
-    asset = db.execute(stmt).scalar_one_or_none()
+    asset = (await db.execute(stmt)).scalar_one_or_none()
     if not asset:
         raise HTTPException(status_code=404, detail="File not found")
 
@@ -99,29 +222,40 @@ def download_private_file(
     # Optional: verify integrity on download
     # (can be disabled if you think it's overkill)
     if asset.sha256_hash:
-        import hashlib
-
-        h = hashlib.sha256()
-        with file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        current_hash = h.hexdigest()
-        if current_hash != asset.sha256_hash:
+        # Re-hashed (in a thread) only if the file changed since last verified
+        if not await verify_file(file_path, asset.sha256_hash):
             raise HTTPException(
                 status_code=500,
                 detail="File hash mismatch. Stored file may be corrupted.",
             )
 
-    # Audit log
-    audit = DownloadAudit(
-        asset_id=asset.id,
-        downloaded_by=f"admin_api:{x_api_key[:4]}..." if x_api_key else "unknown",
+    # Audit log (buffered; written in batches off the request path)
+    await download_audits.record(
+        asset.id,
+        f"admin_api:{x_api_key[:4]}..." if x_api_key else "unknown",
     )
-    db.add(audit)
-    db.commit()
 
+    filename = f"{asset.kind}-{asset.id}{file_path.suffix}"
+    media_type = asset.mime_type or "application/octet-stream"
+    headers = {}
+    if asset.sha256_hash:
+        # The content hash is a strong validator, so If-Range works exactly
+        headers["ETag"] = f'"{asset.sha256_hash}"'
+        digest = base64.b64encode(bytes.fromhex(asset.sha256_hash)).decode("ascii")
+        headers["Repr-Digest"] = f"sha-256=:{digest}:"
+
+    if PRIVATE_MEDIA_ACCEL_PREFIX:
+        # nginx streams the file (with Range support) from an internal location
+        headers["X-Accel-Redirect"] = (
+            f"{PRIVATE_MEDIA_ACCEL_PREFIX.rstrip('/')}/{quote(asset.storage_path)}"
+        )
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return Response(status_code=200, media_type=media_type, headers=headers)
+
+    # FileResponse answers Range / If-Range with 206 / 416 itself
     return FileResponse(
         path=str(file_path),
-        media_type=asset.mime_type or "application/octet-stream",
-        filename=f"{asset.kind}-{asset.id}{file_path.suffix}",
-    )
\ No newline at end of file
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+    )
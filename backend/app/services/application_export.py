@@ -0,0 +1,100 @@
+# backend/app/services/application_export.py
+
+from datetime import datetime
+from typing import AsyncIterator, Optional
+import csv
+import io
+import json
+import zlib
+
+from sqlalchemy import Select, select
+
+from ...database import AsyncSessionLocal
+from ...models import CareerApplication
+
+EXPORT_COLUMNS = (
+    CareerApplication.id,
+    CareerApplication.created_at,
+    CareerApplication.full_name,
+    CareerApplication.email,
+    CareerApplication.phone,
+    CareerApplication.position,
+    CareerApplication.message,
+    CareerApplication.resume_file_id,
+)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+
+def export_query(
+    *,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    position: Optional[str] = None,
+    role: Optional[str] = None,
+) -> Select:
+    stmt = select(*EXPORT_COLUMNS)
+    if created_from:
+        stmt = stmt.where(CareerApplication.created_at >= created_from)
+    if created_to:
+        stmt = stmt.where(CareerApplication.created_at < created_to)
+    if position:
+        stmt = stmt.where(CareerApplication.position == position)
+    if role:
+        stmt = stmt.where(CareerApplication.position.ilike(f"%{role}%"))
+    return stmt.order_by(CareerApplication.created_at, CareerApplication.id)
+
+
+def _csv_chunk(rows, header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow([c.key for c in EXPORT_COLUMNS])
+    for row in rows:
+        writer.writerow(
+            [v.isoformat() if isinstance(v, datetime) else v for v in row]
+        )
+    return buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunk(rows) -> bytes:
+    keys = [c.key for c in EXPORT_COLUMNS]
+    lines = []
+    for row in rows:
+        record = dict(zip(keys, row))
+        record["created_at"] = record["created_at"].isoformat()
+        lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+
+async def export_rows(stmt: Select, fmt: str) -> AsyncIterator[bytes]:
+    """
+    Yield the export one batch at a time. Uses its own session and a
+    server-side cursor, so memory stays flat however many rows match.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        first = True
+        async for rows in result.partitions():
+            if fmt == "csv":
+                yield _csv_chunk(rows, header=first)
+            else:
+                yield _ndjson_chunk(rows)
+            first = False
+        if first and fmt == "csv":
+            yield _csv_chunk([], header=True)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
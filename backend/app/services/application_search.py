@@ -0,0 +1,239 @@
+# backend/app/services/application_search.py
+
+from typing import Any, Dict, List
+import logging
+import re
+
+from sqlalchemy import DateTime, func, literal, or_, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models import CareerApplication
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "career_applications_fts"
+
+# Searchable text of one application. Postgres only uses the expression
+# indexes below when a query repeats this expression verbatim.
+PG_DOCUMENT = (
+    "(coalesce(full_name, '') || ' ' || coalesce(email, '') || ' ' || "
+    "coalesce(position, '') || ' ' || coalesce(message, ''))"
+)
+
+RESULT_COLUMNS = "a.id, a.full_name, a.email, a.phone, a.position, a.created_at, a.resume_file_id"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        full_name, email, position, message,
+        content='career_applications', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON career_applications BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, full_name, email, position, message)
+        VALUES (new.id, new.full_name, new.email, new.position, new.message);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON career_applications BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, full_name, email, position, message)
+        VALUES ('delete', old.id, old.full_name, old.email, old.position, old.message);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON career_applications BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, full_name, email, position, message)
+        VALUES ('delete', old.id, old.full_name, old.email, old.position, old.message);
+        INSERT INTO {FTS_TABLE}(rowid, full_name, email, position, message)
+        VALUES (new.id, new.full_name, new.email, new.position, new.message);
+    END
+    """,
+]
+
+_POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_career_applications_search_tsv
+    ON career_applications USING gin (to_tsvector('simple', {PG_DOCUMENT}))
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_career_applications_search_trgm
+    ON career_applications USING gin ({PG_DOCUMENT} gin_trgm_ops)
+    """,
+    # Also serves the listing's `role` substring filter (ILIKE '%role%')
+    """
+    CREATE INDEX IF NOT EXISTS ix_career_applications_position_trgm
+    ON career_applications USING gin (position gin_trgm_ops)
+    """,
+]
+
+
+def _install_sqlite(conn: Connection) -> None:
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+    for statement in _SQLITE_DDL:
+        conn.execute(text(statement))
+    if not exists:
+        # Index the applications stored before the table existed
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def install_application_search(engine: Engine) -> None:
+    """
+    Create the search structures for the engine's dialect: an FTS5 table
+    kept in sync by triggers on SQLite, full-text and trigram indexes on
+    Postgres. Idempotent; cheap once everything exists.
+    """
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                _install_sqlite(conn)
+            elif dialect == "postgresql":
+                for statement in _POSTGRES_DDL:
+                    conn.execute(text(statement))
+    except OperationalError:
+        # e.g. SQLite built without FTS5; search falls back to substring scans
+        logger.warning("Application search index unavailable on %s", dialect, exc_info=True)
+
+
+def _terms(q: str) -> List[str]:
+    return _TERM_RE.findall(q.lower())
+
+
+def _fts_query(terms: List[str]) -> str:
+    # Every term must match; the last one as a prefix (search-as-you-type)
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+async def _has_fts_table(db: AsyncSession) -> bool:
+    row = await db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    )
+    return row.first() is not None
+
+
+async def _search_sqlite(db: AsyncSession, terms: List[str], limit: int, offset: int):
+    params = {"match": _fts_query(terms), "limit": limit, "offset": offset}
+    total = await db.scalar(
+        text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"),
+        params,
+    )
+    # bm25() is lower-is-better; negate it so rank is higher-is-better
+    rows = await db.execute(
+        text(
+            f"""
+            SELECT {RESULT_COLUMNS}, -bm25({FTS_TABLE}, 4.0, 2.0, 3.0, 1.0) AS rank
+            FROM {FTS_TABLE}
+            JOIN career_applications AS a ON a.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH :match
+            ORDER BY rank DESC, a.created_at DESC, a.id DESC
+            LIMIT :limit OFFSET :offset
+            """
+        ).columns(created_at=DateTime()),
+        params,
+    )
+    return total, rows.mappings().all()
+
+
+async def _search_postgres(db: AsyncSession, q: str, limit: int, offset: int):
+    params = {"q": q, "limit": limit, "offset": offset}
+    # Full-text match for whole words, trigram word similarity for typos and
+    # fragments; each side of the OR is served by its own GIN index.
+    where = (
+        f"to_tsvector('simple', {PG_DOCUMENT}) @@ websearch_to_tsquery('simple', :q) "
+        f"OR :q <% {PG_DOCUMENT}"
+    )
+    total = await db.scalar(
+        text(f"SELECT count(*) FROM career_applications WHERE {where}"), params
+    )
+    rows = await db.execute(
+        text(
+            f"""
+            SELECT {RESULT_COLUMNS},
+                   ts_rank_cd(to_tsvector('simple', {PG_DOCUMENT}),
+                              websearch_to_tsquery('simple', :q))
+                   + word_similarity(:q, {PG_DOCUMENT}) AS rank
+            FROM career_applications AS a
+            WHERE {where}
+            ORDER BY rank DESC, a.created_at DESC, a.id DESC
+            LIMIT :limit OFFSET :offset
+            """
+        ).columns(created_at=DateTime()),
+        params,
+    )
+    return total, rows.mappings().all()
+
+
+async def _search_fallback(db: AsyncSession, terms: List[str], limit: int, offset: int):
+    columns = (
+        CareerApplication.full_name,
+        CareerApplication.email,
+        CareerApplication.position,
+        CareerApplication.message,
+    )
+    conditions = [or_(*(c.ilike(f"%{term}%") for c in columns)) for term in terms]
+    total = await db.scalar(
+        select(func.count()).select_from(CareerApplication).where(*conditions)
+    )
+    rows = await db.execute(
+        select(
+            CareerApplication.id,
+            CareerApplication.full_name,
+            CareerApplication.email,
+            CareerApplication.phone,
+            CareerApplication.position,
+            CareerApplication.created_at,
+            CareerApplication.resume_file_id,
+            literal(0.0).label("rank"),
+        )
+        .where(*conditions)
+        .order_by(CareerApplication.created_at.desc(), CareerApplication.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return total, rows.mappings().all()
+
+
+async def search_applications(
+    db: AsyncSession,
+    q: str,
+    *,
+    page: int = 1,
+    page_size: int = 20,
+) -> Dict[str, Any]:
+    """
+    Relevance-ranked search over applicant name, email, position and
+    message. Returns {total, page, page_size, items}; each item carries
+    its `rank` (higher is better).
+    """
+    terms = _terms(q)
+    offset = (page - 1) * page_size
+    if not terms:
+        total, rows = 0, []
+    else:
+        dialect = db.bind.dialect.name
+        if dialect == "postgresql":
+            total, rows = await _search_postgres(db, q, page_size, offset)
+        elif dialect == "sqlite" and await _has_fts_table(db):
+            total, rows = await _search_sqlite(db, terms, page_size, offset)
+        else:
+            total, rows = await _search_fallback(db, terms, page_size, offset)
+
+    return {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "items": [dict(row) for row in rows],
+    }
@@ -0,0 +1,268 @@
+# backend/app/services/audit_log.py
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from ...database import AsyncSessionLocal
+from ...models import DownloadAudit
+from ...settings import (
+    DOWNLOAD_AUDIT_BATCH_SIZE,
+    DOWNLOAD_AUDIT_FLUSH_SECONDS,
+    DOWNLOAD_AUDIT_QUEUE_SIZE,
+    DOWNLOAD_AUDIT_SPILL_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+AuditRow = Dict[str, Any]
+
+
+class DownloadAuditWriter:
+    """
+    Buffers download audit rows in a bounded queue and writes them with one
+    bulk INSERT per batch, so downloads do not wait on an audit commit.
+
+    A batch is flushed when it reaches `batch_size` rows or `flush_seconds`
+    after its first row. When the queue is full, `record()` waits for room
+    rather than dropping events. Rows still unwritten at shutdown are
+    appended to the spill file and replayed on the next `start()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = DOWNLOAD_AUDIT_BATCH_SIZE,
+        flush_seconds: float = DOWNLOAD_AUDIT_FLUSH_SECONDS,
+        queue_size: int = DOWNLOAD_AUDIT_QUEUE_SIZE,
+        spill_path: str = DOWNLOAD_AUDIT_SPILL_PATH,
+    ) -> None:
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.queue_size = queue_size
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[AuditRow] = []
+        self._flush_lock = asyncio.Lock()
+        self._stats_lock = threading.Lock()
+        self.recorded = 0
+        self.written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.skipped = 0
+        self.queue_full_waits = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.largest_batch = 0
+        self.flush_seconds_total = 0.0
+
+    # ----- Producer side -----
+
+    async def record(self, asset_id: int, downloaded_by: Optional[str]) -> None:
+        await self.record_many([asset_id], downloaded_by)
+
+    async def record_many(self, asset_ids: List[int], downloaded_by: Optional[str]) -> None:
+        """
+        Record one download event covering several assets (e.g. a resume
+        bundle); the rows share a timestamp and land in the same batch.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {"asset_id": asset_id, "downloaded_at": now, "downloaded_by": downloaded_by}
+            for asset_id in asset_ids
+        ]
+        if not rows:
+            return
+        with self._stats_lock:
+            self.recorded += len(rows)
+
+        if self._queue is None:
+            # Writer not running (scripts, tests without lifespan): write now
+            await self._write(rows)
+            return
+
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                with self._stats_lock:
+                    self.queue_full_waits += 1
+                await self._queue.put(row)
+
+    # ----- Writer side -----
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._flush_lock = asyncio.Lock()
+        await self._replay_spill()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the writer, flush what is buffered, and spill anything that
+        could not be written.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+        self._drain_queue()
+        self._queue = None
+        await self.flush()
+        if self._pending:
+            self._spill(self._pending)
+            self._pending = []
+
+    def _drain_queue(self) -> None:
+        while self._queue is not None and not self._queue.empty():
+            self._pending.append(self._queue.get_nowait())
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._pending.append(await self._queue.get())
+
+            deadline = time.monotonic() + self.flush_seconds
+            while len(self._pending) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    self._pending.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            if not await self.flush():
+                # Database unavailable: keep the rows and back off
+                await asyncio.sleep(self.flush_seconds)
+
+    async def flush(self) -> bool:
+        """
+        Write everything buffered so far. Returns False if the write failed
+        (the rows stay buffered for the next attempt).
+        """
+        async with self._flush_lock:
+            self._drain_queue()
+            while self._pending:
+                batch = self._pending[: self.batch_size]
+                started = time.perf_counter()
+                try:
+                    await self._write(batch)
+                except Exception:
+                    logger.exception("Writing %d download audits failed", len(batch))
+                    with self._stats_lock:
+                        self.failed_flushes += 1
+                    return False
+                del self._pending[: len(batch)]
+                with self._stats_lock:
+                    self.flushes += 1
+                    self.largest_batch = max(self.largest_batch, len(batch))
+                    self.flush_seconds_total += time.perf_counter() - started
+            return True
+
+    async def _write(self, rows: List[AuditRow]) -> None:
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(insert(DownloadAudit), rows)
+                await db.commit()
+                written = len(rows)
+            except IntegrityError:
+                # An asset was deleted after its download was recorded;
+                # write the rest of the batch row by row.
+                await db.rollback()
+                written = 0
+                for row in rows:
+                    try:
+                        async with db.begin_nested():
+                            await db.execute(insert(DownloadAudit), [row])
+                        written += 1
+                    except IntegrityError:
+                        logger.warning("Skipping audit for missing asset %s", row["asset_id"])
+                await db.commit()
+        with self._stats_lock:
+            self.written += written
+            self.skipped += len(rows) - written
+
+    # ----- Spill file -----
+
+    def _spill(self, rows: List[AuditRow]) -> None:
+        if self.spill_path is None:
+            logger.error("Dropping %d unwritten download audits (no spill file)", len(rows))
+            return
+        with self.spill_path.open("a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({**row, "downloaded_at": row["downloaded_at"].isoformat()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        with self._stats_lock:
+            self.spilled += len(rows)
+        logger.warning("Spilled %d download audits to %s", len(rows), self.spill_path)
+
+    async def _replay_spill(self) -> None:
+        if self.spill_path is None or not self.spill_path.exists():
+            return
+        # Claim the file first so that only one worker replays it
+        claimed = self.spill_path.with_name(f"{self.spill_path.name}.{os.getpid()}")
+        try:
+            os.replace(self.spill_path, claimed)
+        except FileNotFoundError:
+            return
+
+        rows = []
+        with claimed.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    row["downloaded_at"] = datetime.fromisoformat(row["downloaded_at"])
+                    rows.append(row)
+        self._pending.extend(rows)
+        if await self.flush():
+            with self._stats_lock:
+                self.replayed += len(rows)
+            logger.info("Replayed %d spilled download audits", len(rows))
+        else:
+            # Database still unavailable: put the unwritten rows back
+            self._spill(self._pending)
+            self._pending = []
+        claimed.unlink()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "running": self._task is not None,
+                "queued": self._queue.qsize() if self._queue is not None else 0,
+                "pending": len(self._pending),
+                "recorded": self.recorded,
+                "written": self.written,
+                "skipped": self.skipped,
+                "flushes": self.flushes,
+                "failed_flushes": self.failed_flushes,
+                "largest_batch": self.largest_batch,
+                "avg_flush_ms": (
+                    self.flush_seconds_total / self.flushes * 1000 if self.flushes else 0.0
+                ),
+                "queue_full_waits": self.queue_full_waits,
+                "spilled": self.spilled,
+                "replayed": self.replayed,
+            }
+
+
+download_audits = DownloadAuditWriter()
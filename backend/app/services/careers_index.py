@@ -0,0 +1,188 @@
+# backend/app/services/careers_index.py
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import re
+import threading
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .content_cache import CachedContent, content_cache
+
+# Position fields that can be filtered on and that get facet counts
+FACET_FIELDS = ("team", "workMode", "level", "tags")
+
+# Position fields that feed the free-text index
+TEXT_FIELDS = ("title", "summary", "tags", "team", "location", "level", "tagline")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _values(position: Dict[str, Any], name: str) -> List[str]:
+    raw = position.get(name)
+    if raw is None:
+        return []
+    if isinstance(raw, list):
+        return [str(v) for v in raw if v is not None]
+    return [str(raw)]
+
+
+@dataclass
+class CareersIndex:
+    """
+    Inverted index over content["careers"]["positions"] for one content version.
+    """
+
+    version: int
+    positions: List[Dict[str, Any]]
+    # facet -> normalized value -> position ids
+    facets: Dict[str, Dict[str, Set[int]]] = field(default_factory=dict)
+    # facet -> normalized value -> display value (first spelling seen)
+    labels: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # token -> position ids
+    postings: Dict[str, Set[int]] = field(default_factory=dict)
+    # sorted vocabulary, for prefix matching on the last query term
+    vocabulary: List[str] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, version: int, positions: List[Dict[str, Any]]) -> "CareersIndex":
+        index = cls(version=version, positions=positions)
+        for name in FACET_FIELDS:
+            index.facets[name] = {}
+            index.labels[name] = {}
+
+        for pid, position in enumerate(positions):
+            for name in FACET_FIELDS:
+                for value in _values(position, name):
+                    key = value.lower()
+                    index.facets[name].setdefault(key, set()).add(pid)
+                    index.labels[name].setdefault(key, value)
+            for name in TEXT_FIELDS:
+                for value in _values(position, name):
+                    for token in tokenize(value):
+                        index.postings.setdefault(token, set()).add(pid)
+
+        index.vocabulary = sorted(index.postings)
+        return index
+
+    def _prefix_ids(self, prefix: str) -> Set[int]:
+        ids: Set[int] = set()
+        start = bisect_left(self.vocabulary, prefix)
+        for token in self.vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            ids |= self.postings[token]
+        return ids
+
+    def _text_ids(self, q: str) -> Optional[Set[int]]:
+        terms = tokenize(q)
+        if not terms:
+            return None
+        result: Optional[Set[int]] = None
+        for i, term in enumerate(terms):
+            # The last term may still be being typed, so match it as a prefix.
+            ids = self._prefix_ids(term) if i == len(terms) - 1 else self.postings.get(term, set())
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
+    def _facet_ids(self, name: str, values: Iterable[str]) -> Optional[Set[int]]:
+        values = [v for v in values if v]
+        if not values:
+            return None
+        ids: Set[int] = set()
+        for value in values:
+            ids |= self.facets[name].get(value.lower(), set())
+        return ids
+
+    def search(
+        self,
+        *,
+        q: Optional[str] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Filter positions (OR within a facet, AND across facets and text),
+        paginate, and count facet values. Facet counts for a field ignore
+        that field's own filter so the UI can offer the other options.
+        """
+        filters = filters or {}
+        everything = set(range(len(self.positions)))
+
+        constraints: Dict[str, Optional[Set[int]]] = {
+            name: self._facet_ids(name, filters.get(name, [])) for name in FACET_FIELDS
+        }
+        text_ids = self._text_ids(q) if q else None
+
+        def matching(skip: Optional[str] = None) -> Set[int]:
+            ids = everything if text_ids is None else text_ids
+            for name, allowed in constraints.items():
+                if name != skip and allowed is not None:
+                    ids = ids & allowed
+            return ids
+
+        matched = sorted(matching())
+        start = (page - 1) * page_size
+        page_ids = matched[start:start + page_size]
+
+        facet_counts: Dict[str, Dict[str, int]] = {}
+        for name in FACET_FIELDS:
+            base = matching(skip=name) if constraints[name] is not None else None
+            if base is None:
+                base = set(matched)
+            counts: List[Tuple[str, int]] = []
+            for key, ids in self.facets[name].items():
+                count = len(ids & base)
+                if count:
+                    counts.append((self.labels[name][key], count))
+            counts.sort(key=lambda item: (-item[1], item[0]))
+            facet_counts[name] = dict(counts)
+
+        return {
+            "version": self.version,
+            "total": len(matched),
+            "page": page,
+            "pageSize": page_size,
+            "positions": [self.positions[pid] for pid in page_ids],
+            "facets": facet_counts,
+        }
+
+
+class CareersIndexCache:
+    """
+    Holds the index for the latest content version; rebuilt only when the
+    content cache reports a different version.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._index: Optional[CareersIndex] = None
+        self.builds = 0
+
+    async def get(self, db: AsyncSession) -> CareersIndex:
+        cached: CachedContent = await content_cache.get(db)
+        index = self._index
+        if index is not None and index.version == cached.version:
+            return index
+
+        careers = cached.content.get("careers") or {}
+        positions = careers.get("positions") if isinstance(careers, dict) else None
+        index = CareersIndex.build(
+            cached.version,
+            [p for p in positions or [] if isinstance(p, dict)],
+        )
+        with self._lock:
+            self._index = index
+            self.builds += 1
+        return index
+
+
+careers_index = CareersIndexCache()
@@ -0,0 +1,219 @@
+# backend/app/services/content_cache.py
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+import json
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models import ContentVersion
+from ...settings import CONTENT_BROTLI_QUALITY, CONTENT_GZIP_LEVEL
+from ..compression import compress_bytes
+from .json_pointer import resolve_pointer
+
+# Upper bound on memoized fields=/pointer= renderings kept per version
+MAX_SELECTIONS_PER_VERSION = 128
+
+
+def serialize_content(content: Any) -> bytes:
+    """
+    Serialize a content payload the same way FastAPI's JSONResponse does,
+    so cached bytes are identical to what the route used to return.
+    """
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def select_fields(value: Any, fields: Tuple[str, ...]) -> Any:
+    """
+    Keep only `fields` of an object, or of every object in a list.
+    """
+    if isinstance(value, dict):
+        return {key: value[key] for key in fields if key in value}
+    if isinstance(value, list):
+        return [select_fields(item, fields) for item in value]
+    return value
+
+
+SelectionKey = Tuple[Optional[str], Tuple[str, ...], Optional[str]]
+
+
+@dataclass(frozen=True)
+class CachedContent:
+    version: int
+    created_at: Optional[datetime]
+    content: Dict[str, Any]
+    body: bytes
+    # Pre-serialized top-level sections (hero, about, services, ...)
+    sections: Dict[str, bytes] = field(default_factory=dict)
+    # Memoized fields=/pointer= renderings for this version
+    selections: Dict[SelectionKey, bytes] = field(default_factory=dict)
+    # Memoized compressed renderings, keyed by selection and encoding
+    encoded: Dict[Tuple[SelectionKey, str], bytes] = field(default_factory=dict)
+
+    def render(
+        self,
+        section: Optional[str] = None,
+        fields: Tuple[str, ...] = (),
+        pointer: Optional[str] = None,
+    ) -> bytes:
+        """
+        Serialized bytes for the whole document, one section, or a selection
+        within either. Raises KeyError for an unknown section and
+        JsonPointerError for a pointer that does not resolve.
+        """
+        if not fields and pointer is None:
+            return self.body if section is None else self.sections[section]
+
+        key: SelectionKey = (section, fields, pointer)
+        body = self.selections.get(key)
+        if body is not None:
+            return body
+
+        value: Any = self.content if section is None else self.content[section]
+        if pointer is not None:
+            value = resolve_pointer(value, pointer)
+        if fields:
+            value = select_fields(value, fields)
+        body = serialize_content(value)
+        if len(self.selections) < MAX_SELECTIONS_PER_VERSION:
+            self.selections[key] = body
+        return body
+
+    def render_encoded(
+        self,
+        encoding: str,
+        section: Optional[str] = None,
+        fields: Tuple[str, ...] = (),
+        pointer: Optional[str] = None,
+    ) -> bytes:
+        """
+        render() compressed with `encoding` ("br" or "gzip"). Compressed once
+        per version at the best level, then served from memory.
+        """
+        key = ((section, fields, pointer), encoding)
+        body = self.encoded.get(key)
+        if body is not None:
+            return body
+
+        body = compress_bytes(
+            self.render(section, fields, pointer),
+            encoding,
+            gzip_level=CONTENT_GZIP_LEVEL,
+            brotli_quality=CONTENT_BROTLI_QUALITY,
+        )
+        if len(self.encoded) < 2 * MAX_SELECTIONS_PER_VERSION:
+            self.encoded[key] = body
+        return body
+
+
+ContentStamp = Tuple[int, Optional[datetime]]
+
+
+class ContentCache:
+    """
+    In-process cache of the latest content document, keyed by version number.
+
+    A hit costs one probe for the latest (version, created_at) pair, answered
+    from the index on content_versions.version without touching content_json;
+    only a miss loads and parses the full row.
+    The probe also keeps multiple workers coherent: a publish in another
+    process simply shows up as a newer version here.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entry: Optional[CachedContent] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.not_modified = 0
+
+    @staticmethod
+    async def latest_stamp(db: AsyncSession) -> Optional[ContentStamp]:
+        """
+        Cheap "is there a newer version?" check: the latest version number and
+        its created_at, used both for cache validation and HTTP validators.
+        """
+        result = await db.execute(
+            select(ContentVersion.version, ContentVersion.created_at)
+            .order_by(ContentVersion.version.desc())
+            .limit(1)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def peek(self) -> Optional[CachedContent]:
+        return self._entry
+
+    async def get(self, db: AsyncSession, stamp: Optional[ContentStamp] = None) -> CachedContent:
+        """
+        Return the cached latest document, reloading it if a newer version exists.
+        Pass `stamp` when the caller already probed the latest version.
+        """
+        # Imported here to avoid a circular import with content_service,
+        # which invalidates this cache on every save.
+        from .content_service import load_latest_record
+
+        if stamp is None:
+            stamp = await self.latest_stamp(db)
+        entry = self._entry
+        if entry is not None and stamp is not None and entry.version == stamp[0]:
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        record, content = await load_latest_record(db)
+        entry = CachedContent(
+            version=record.version,
+            created_at=record.created_at,
+            content=content,
+            body=serialize_content(content),
+            sections={key: serialize_content(value) for key, value in content.items()},
+        )
+        with self._lock:
+            self.misses += 1
+            current = self._entry
+            if current is None or current.version <= entry.version:
+                self._entry = entry
+        return entry
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entry = None
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        entry = self._entry
+        total = self.hits + self.misses
+        return {
+            "version": entry.version if entry else None,
+            "size_bytes": len(entry.body) if entry else 0,
+            "encoded_size_bytes": {
+                encoding: len(body)
+                for (key, encoding), body in entry.encoded.items()
+                if key == (None, (), None)
+            } if entry else {},
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "not_modified": self.not_modified,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+        }
+
+
+content_cache = ContentCache()
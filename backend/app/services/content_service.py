@@ -1,13 +1,29 @@
 # backend/app/services/content_service.py
 
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import copy
 import json
+import logging
 import os
+import threading
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from ...database import SessionLocal  # only if you need it directly
 from ...models import ContentVersion
+from ...settings import (
+    CONTENT_KEYFRAME_INTERVAL,
+    CONTENT_RECONSTRUCTION_CACHE_SIZE,
+    CONTENT_WRITE_RETRIES,
+)
+from .content_cache import content_cache
+from .content_snapshot import publish_snapshot, withdraw_snapshot
+from .json_patch import JsonPatchError, apply_merge_patch, apply_patch, make_patch
+
+logger = logging.getLogger(__name__)
 
 # Simple admin API key
 ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "changeme-admin-key")
@@ -546,42 +562,293 @@ def get_default_content() -> Dict[str, Any]:
     }
 
 
-def load_content_from_db(db: Session) -> Dict[str, Any]:
+class _ReconstructionCache:
     """
-    Get the latest content version. If none exists, seed with defaults.
+    Small LRU of fully reconstructed documents, so reading a recent version
+    (or saving on top of the latest one) does not replay its delta chain.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._lock = threading.Lock()
+        self._docs: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+    def get(self, version: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            doc = self._docs.get(version)
+            if doc is not None:
+                self._docs.move_to_end(version)
+            return doc
+
+    def nearest_below(self, version: int, floor: int) -> Optional[int]:
+        with self._lock:
+            candidates = [v for v in self._docs if floor < v < version]
+        return max(candidates) if candidates else None
+
+    def put(self, version: int, doc: Dict[str, Any]) -> None:
+        if self._size <= 0:
+            return
+        with self._lock:
+            self._docs[version] = doc
+            self._docs.move_to_end(version)
+            while len(self._docs) > self._size:
+                self._docs.popitem(last=False)
+
+
+_reconstructed = _ReconstructionCache(CONTENT_RECONSTRUCTION_CACHE_SIZE)
+
+
+def _is_keyframe_clause():
+    # Rows written before delta storage have is_keyframe NULL and hold full copies
+    return or_(ContentVersion.is_keyframe.is_(True), ContentVersion.is_keyframe.is_(None))
+
+
+async def _reconstruct(db: AsyncSession, version: int) -> Dict[str, Any]:
+    """
+    Rebuild a version from its nearest keyframe (or cached version) by
+    replaying the deltas in between. The returned dict must not be mutated.
     """
-    latest: Optional[ContentVersion] = (
-        db.query(ContentVersion).order_by(ContentVersion.version.desc()).first()
+    cached = _reconstructed.get(version)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(ContentVersion.version, ContentVersion.content_json)
+        .where(ContentVersion.version <= version, _is_keyframe_clause())
+        .order_by(ContentVersion.version.desc())
+        .limit(1)
+    )
+    keyframe = result.first()
+    if keyframe is None:
+        raise LookupError(f"No keyframe at or before version {version}")
+
+    start_version = keyframe.version
+    doc = None
+    nearest = _reconstructed.nearest_below(version, start_version)
+    if nearest is not None:
+        cached = _reconstructed.get(nearest)
+        if cached is not None:
+            # Copied once here; the deltas below are applied to it in place
+            doc = copy.deepcopy(cached)
+            start_version = nearest
+    if doc is None:
+        doc = json.loads(keyframe.content_json)
+
+    if start_version < version:
+        deltas = await db.scalars(
+            select(ContentVersion.content_json)
+            .where(
+                ContentVersion.version > start_version,
+                ContentVersion.version <= version,
+            )
+            .order_by(ContentVersion.version.asc())
+        )
+        for delta in deltas.all():
+            doc = apply_patch(doc, json.loads(delta), in_place=True)
+
+    _reconstructed.put(version, doc)
+    return doc
+
+
+async def load_version_content(db: AsyncSession, version: int) -> Optional[Dict[str, Any]]:
+    """
+    Get the document for a specific version, or None if it does not exist.
+    """
+    exists = await db.scalar(
+        select(ContentVersion.id).where(ContentVersion.version == version).limit(1)
+    )
+    if exists is None:
+        return None
+    return copy.deepcopy(await _reconstruct(db, version))
+
+
+async def load_latest_record(db: AsyncSession) -> Tuple[ContentVersion, Dict[str, Any]]:
+    """
+    Get the latest ContentVersion row and its parsed document.
+    If none exists, seed with defaults.
+    """
+    latest: Optional[ContentVersion] = await db.scalar(
+        select(ContentVersion)
+        .options(load_only(ContentVersion.id, ContentVersion.version, ContentVersion.created_at))
+        .order_by(ContentVersion.version.desc())
+        .limit(1)
     )
 
     if latest is None:
         default = get_default_content()
-        seed = ContentVersion(version=1, content_json=json.dumps(default))
+        seed = ContentVersion(version=1, content_json=json.dumps(default), is_keyframe=True)
         db.add(seed)
-        db.commit()
-        db.refresh(seed)
-        return default
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Another worker seeded version 1 first; use theirs.
+            await db.rollback()
+            return await load_latest_record(db)
+        content_cache.invalidate()
+        return seed, default
 
-    return json.loads(latest.content_json)
+    return latest, copy.deepcopy(await _reconstruct(db, latest.version))
 
 
-def save_content_to_db(db: Session, new_content: Dict[str, Any]) -> int:
+async def load_content_from_db(db: AsyncSession) -> Dict[str, Any]:
     """
-    Save a new version of the content and return version number.
+    Get the latest content version. If none exists, seed with defaults.
     """
-    latest: Optional[ContentVersion] = (
-        db.query(ContentVersion).order_by(ContentVersion.version.desc()).first()
-    )
+    _, content = await load_latest_record(db)
+    return content
 
-    new_version = 1 if latest is None else latest.version + 1
+
+class ContentVersionConflict(Exception):
+    """
+    Raised when a write was based on a version that is no longer the latest.
+    """
+
+    def __init__(self, expected: Optional[int], current: Optional[int]) -> None:
+        super().__init__(
+            f"Content has changed: expected version {expected}, latest is {current}"
+        )
+        self.expected = expected
+        self.current = current
+
+
+async def _latest_version(db: AsyncSession) -> Optional[int]:
+    return await db.scalar(select(func.max(ContentVersion.version)))
+
+
+async def _insert_version(
+    db: AsyncSession,
+    base_version: Optional[int],
+    new_content: Dict[str, Any],
+) -> int:
+    """
+    Insert `new_content` as `base_version + 1`.
+
+    The unique index on content_versions.version is the only arbiter between
+    concurrent writers: whoever commits first wins, the other gets
+    ContentVersionConflict. No lock is taken.
+    """
+    full = json.dumps(new_content)
+    payload = full
+    if base_version is None:
+        new_version = 1
+        is_keyframe = True
+    else:
+        new_version = base_version + 1
+        last_keyframe = await db.scalar(
+            select(func.max(ContentVersion.version)).where(_is_keyframe_clause())
+        ) or 0
+        is_keyframe = new_version - last_keyframe >= CONTENT_KEYFRAME_INTERVAL
+        if not is_keyframe:
+            base = await _reconstruct(db, base_version)
+            delta = json.dumps(make_patch(base, new_content))
+            if len(delta) < len(full):
+                payload = delta
+            else:
+                is_keyframe = True
 
     record = ContentVersion(
         version=new_version,
-        content_json=json.dumps(new_content),
+        content_json=payload,
+        is_keyframe=is_keyframe,
     )
 
     db.add(record)
-    db.commit()
-    db.refresh(record)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise ContentVersionConflict(base_version, await _latest_version(db))
+
+    _reconstructed.put(new_version, copy.deepcopy(new_content))
+    # Rollback and home-layout updates also land here.
+    content_cache.invalidate()
+    try:
+        await publish_snapshot(db)
+    except Exception:
+        # nginx only falls back to the API when no snapshot file exists, so
+        # take the now-stale `current` away rather than leave it served
+        logger.exception("Writing the static snapshot of content version %s failed", new_version)
+        try:
+            withdraw_snapshot(new_version)
+        except OSError:
+            logger.exception("Removing the stale content snapshot failed")
 
     return new_version
+
+
+async def _write_version(
+    db: AsyncSession,
+    build: Callable[[Optional[int]], Awaitable[Dict[str, Any]]],
+    expected_version: Optional[int],
+) -> int:
+    """
+    Build the next document from the latest version and insert it.
+
+    With `expected_version` (an If-Match precondition) a conflict is raised
+    immediately. Without one, the write is rebuilt on top of the new latest
+    version up to CONTENT_WRITE_RETRIES times.
+    """
+    retries = 0 if expected_version is not None else CONTENT_WRITE_RETRIES
+    while True:
+        latest = await _latest_version(db)
+        if expected_version is not None and latest != expected_version:
+            raise ContentVersionConflict(expected_version, latest)
+        try:
+            return await _insert_version(db, latest, await build(latest))
+        except ContentVersionConflict:
+            if retries <= 0:
+                raise
+            retries -= 1
+
+
+async def save_content_to_db(
+    db: AsyncSession,
+    new_content: Dict[str, Any],
+    *,
+    expected_version: Optional[int] = None,
+) -> int:
+    """
+    Save a new version of the content and return version number.
+
+    Stored as a JSON Patch against the previous version, except every
+    CONTENT_KEYFRAME_INTERVAL versions (or when the patch would not be
+    smaller), when the full document is written as a keyframe.
+    Raises ContentVersionConflict if `expected_version` is not the latest.
+    """
+
+    async def build(_latest: Optional[int]) -> Dict[str, Any]:
+        return new_content
+
+    return await _write_version(db, build, expected_version)
+
+
+async def patch_content_in_db(
+    db: AsyncSession,
+    patch: Any,
+    *,
+    merge: bool,
+    expected_version: Optional[int] = None,
+) -> int:
+    """
+    Apply a JSON Merge Patch (merge=True) or JSON Patch to the latest
+    version on the server and save the result as a new version.
+    Raises JsonPatchError if the patch does not apply and
+    ContentVersionConflict if `expected_version` is not the latest.
+    """
+    if await _latest_version(db) is None:
+        await load_latest_record(db)
+
+    async def build(latest: Optional[int]) -> Dict[str, Any]:
+        if latest is None:
+            current = get_default_content()
+        else:
+            current = await _reconstruct(db, latest)
+        if merge:
+            updated = apply_merge_patch(current, patch)
+        else:
+            updated = apply_patch(current, patch)
+        if not isinstance(updated, dict):
+            raise JsonPatchError("Patched content must be a JSON object")
+        return updated
+
+    return await _write_version(db, build, expected_version)
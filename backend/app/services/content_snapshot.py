@@ -0,0 +1,169 @@
+# backend/app/services/content_snapshot.py
+#
+# Static snapshots of the published content document for nginx:
+#
+#   <CONTENT_SNAPSHOT_DIR>/versions/<n>/content.json[.gz|.br]
+#   <CONTENT_SNAPSHOT_DIR>/versions/<n>/sections/<section>.json[.gz|.br]
+#   <CONTENT_SNAPSHOT_DIR>/current -> versions/<n>
+#
+# A version directory is written under a temporary name and renamed into
+# place, then `current` is swapped with an atomic symlink replace, so nginx
+# never sees a half-written document.
+
+from datetime import timezone
+from pathlib import Path
+from typing import Optional
+import asyncio
+import logging
+import os
+import re
+import shutil
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...database import AsyncSessionLocal
+from ...precompress import ENCODING_SUFFIXES
+from ...settings import CONTENT_SNAPSHOT_DIR, CONTENT_SNAPSHOT_KEEP, RESPONSE_COMPRESSION_MIN_BYTES
+from ..compression import enabled_encodings
+from .content_cache import CachedContent, content_cache
+
+logger = logging.getLogger(__name__)
+
+# Sections that would shadow other GET /api/content/<name> routes
+RESERVED_SECTIONS = {"versions"}
+_SECTION_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def snapshot_root() -> Optional[Path]:
+    return Path(CONTENT_SNAPSHOT_DIR) if CONTENT_SNAPSHOT_DIR else None
+
+
+def current_snapshot_version(root: Path) -> Optional[int]:
+    try:
+        target = os.readlink(root / "current")
+    except OSError:
+        return None
+    name = Path(target).name
+    if not name.isdigit() or not (root / target).is_dir():
+        return None
+    return int(name)
+
+
+def _write(path: Path, body: bytes, encoded, mtime: Optional[float]) -> None:
+    path.write_bytes(body)
+    for encoding, data in encoded.items():
+        path.with_name(path.name + ENCODING_SUFFIXES[encoding]).write_bytes(data)
+    if mtime is not None:
+        # nginx derives Last-Modified/ETag from the file; match the version
+        for p in [path, *(path.with_name(path.name + s) for s in ENCODING_SUFFIXES.values())]:
+            if p.exists():
+                os.utime(p, (mtime, mtime))
+
+
+def _encoded(cached: CachedContent, body: bytes, section: Optional[str]):
+    if len(body) < RESPONSE_COMPRESSION_MIN_BYTES:
+        return {}
+    return {
+        encoding: cached.render_encoded(encoding, section)
+        for encoding in enabled_encodings()
+    }
+
+
+def write_snapshot(root: Path, cached: CachedContent) -> Path:
+    """
+    Write the snapshot directory for `cached.version` (replacing any
+    existing one), point `current` at it unless a newer version is already
+    current, and prune old versions. Blocking; run it in a thread.
+    """
+    versions = root / "versions"
+    versions.mkdir(parents=True, exist_ok=True)
+    mtime = None
+    if cached.created_at is not None:
+        # created_at is stored as naive UTC (datetime.utcnow)
+        created_at = cached.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        mtime = created_at.timestamp()
+
+    tmp = versions / f".tmp-{cached.version}-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    (tmp / "sections").mkdir(parents=True)
+    _write(tmp / "content.json", cached.body, _encoded(cached, cached.body, None), mtime)
+    for section, body in cached.sections.items():
+        if section in RESERVED_SECTIONS or not _SECTION_NAME.match(section):
+            continue
+        _write(tmp / "sections" / f"{section}.json", body, _encoded(cached, body, section), mtime)
+
+    dest = versions / str(cached.version)
+    if dest.exists():
+        old = versions / f".old-{cached.version}-{os.getpid()}"
+        os.replace(dest, old)
+        os.replace(tmp, dest)
+        shutil.rmtree(old, ignore_errors=True)
+    else:
+        os.replace(tmp, dest)
+
+    current = current_snapshot_version(root)
+    if current is None or current <= cached.version:
+        link = root / f".current-{os.getpid()}"
+        link.unlink(missing_ok=True)
+        os.symlink(f"versions/{cached.version}", link)
+        os.replace(link, root / "current")
+        current = cached.version
+
+    _prune(versions, keep=max(1, CONTENT_SNAPSHOT_KEEP), current=current)
+    return dest
+
+
+def _prune(versions: Path, keep: int, current: int) -> None:
+    numbered = sorted(
+        (int(p.name) for p in versions.iterdir() if p.name.isdigit()),
+        reverse=True,
+    )
+    for version in numbered[keep:]:
+        if version != current:
+            shutil.rmtree(versions / str(version), ignore_errors=True)
+
+
+async def publish_snapshot(db: AsyncSession, *, force: bool = False) -> Optional[int]:
+    """
+    Write the latest content version as a static snapshot and return its
+    version, or None if snapshots are disabled. Without `force`, nothing is
+    written when that version is already current on disk.
+    """
+    root = snapshot_root()
+    if root is None:
+        return None
+    cached = await content_cache.get(db)
+    if not force and current_snapshot_version(root) == cached.version:
+        return cached.version
+    await asyncio.to_thread(write_snapshot, root, cached)
+    return cached.version
+
+
+def withdraw_snapshot(version: int) -> None:
+    """
+    Remove `current` if it points at a version older than `version`, so
+    nginx falls through to the API instead of serving a stale document.
+    The next successful publish (or the migrate step's ensure_snapshot) restores it.
+    """
+    root = snapshot_root()
+    if root is None:
+        return
+    current = current_snapshot_version(root)
+    if current is not None and current < version:
+        (root / "current").unlink(missing_ok=True)
+
+
+async def ensure_snapshot() -> None:
+    """
+    Migrate-step hook: write the snapshot if the latest version is not on
+    disk yet (first deploy, or a publish whose snapshot write failed).
+    """
+    if snapshot_root() is None:
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            await publish_snapshot(db)
+    except Exception:
+        logger.exception("Writing the static content snapshot failed")
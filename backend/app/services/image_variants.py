@@ -0,0 +1,164 @@
+# backend/app/services/image_variants.py
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import multiprocessing
+import shutil
+import threading
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...imaging import render_variants
+from ...models import MediaAsset, MediaIntegrityCheck
+from ...settings import (
+    MEDIA_IMAGE_FORMATS,
+    MEDIA_IMAGE_QUALITY,
+    MEDIA_IMAGE_WIDTHS,
+    MEDIA_IMAGE_WORKERS,
+    PUBLIC_MEDIA_BASE_URL,
+)
+from ...storage import media_root
+
+logger = logging.getLogger(__name__)
+
+# Animated GIFs and documents are left alone
+VARIANT_SOURCE_TYPES = {"image/jpeg", "image/png", "image/webp"}
+
+VARIANT_DIR = "variants"
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: workers must not inherit the event loop, DB pools or threads
+            _pool = ProcessPoolExecutor(
+                max_workers=max(1, MEDIA_IMAGE_WORKERS),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def variant_dir(parent_id: int) -> str:
+    return f"{VARIANT_DIR}/{parent_id}"
+
+
+def variant_rows(parent: MediaAsset, rendered: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    media_assets rows for the renditions render_variants() wrote for `parent`.
+    """
+    rel_dir = variant_dir(parent.id)
+    return [
+        {
+            "kind": parent.kind,
+            "storage_path": f"{rel_dir}/{variant['name']}",
+            "storage_bucket": None,
+            "mime_type": variant["mime_type"],
+            "size_bytes": variant["size_bytes"],
+            "sha256_hash": variant["sha256_hash"],
+            "is_public": True,
+            "parent_id": parent.id,
+            "width": variant["width"],
+            "height": variant["height"],
+            "created_by": parent.created_by,
+        }
+        for variant in rendered["variants"]
+    ]
+
+
+async def create_image_variants(db: AsyncSession, parent: MediaAsset) -> List[MediaAsset]:
+    """
+    Render resized renditions of a public image upload (in the process
+    pool) and add them as child MediaAsset rows. `parent` must already have
+    an id. Failures are logged and leave the upload without renditions.
+    """
+    if (
+        not parent.is_public
+        or parent.mime_type not in VARIANT_SOURCE_TYPES
+        or not MEDIA_IMAGE_WIDTHS
+        or not MEDIA_IMAGE_FORMATS
+    ):
+        return []
+
+    root = media_root("public")
+    rel_dir = variant_dir(parent.id)
+    loop = asyncio.get_running_loop()
+    try:
+        rendered = await loop.run_in_executor(
+            _get_pool(),
+            render_variants,
+            str(root / parent.storage_path),
+            str(root / rel_dir),
+            MEDIA_IMAGE_WIDTHS,
+            MEDIA_IMAGE_FORMATS,
+            MEDIA_IMAGE_QUALITY,
+        )
+    except ImportError:
+        logger.warning("Pillow is not installed; skipping image renditions")
+        return []
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); start a fresh pool next time
+        logger.exception("Image worker pool broke while rendering asset %s", parent.id)
+        shutdown_image_pool()
+        return []
+    except Exception:
+        logger.exception("Rendering variants of media asset %s failed", parent.id)
+        return []
+
+    parent.width = rendered["width"]
+    parent.height = rendered["height"]
+    rows = variant_rows(parent, rendered)
+    if not rows:
+        return []
+    # One multi-row INSERT rather than one per rendition
+    return list(
+        (await db.scalars(insert(MediaAsset).values(rows).returning(MediaAsset))).all()
+    )
+
+
+async def delete_image_variants(db: AsyncSession, parent: MediaAsset) -> bool:
+    """
+    Delete the parent's rendition rows inside the caller's transaction.
+    Returns True if there were any; remove their files with
+    remove_variant_files() after committing.
+    """
+    child_ids = (
+        await db.scalars(select(MediaAsset.id).where(MediaAsset.parent_id == parent.id))
+    ).all()
+    if not child_ids:
+        return False
+    await db.execute(delete(MediaIntegrityCheck).where(MediaIntegrityCheck.asset_id.in_(child_ids)))
+    await db.execute(delete(MediaAsset).where(MediaAsset.id.in_(child_ids)))
+    return True
+
+
+def remove_variant_files(parent_id: int) -> None:
+    shutil.rmtree(media_root("public") / variant_dir(parent_id), ignore_errors=True)
+
+
+def srcset_metadata(children: List[MediaAsset]) -> Dict[str, str]:
+    """
+    One srcset string per MIME type, narrowest first, e.g.
+    {"image/webp": "/media/variants/7/480w.webp 480w, ..."}.
+    """
+    srcset: Dict[str, List[str]] = {}
+    for child in sorted(children, key=lambda c: c.width or 0):
+        srcset.setdefault(child.mime_type, []).append(
+            f"{PUBLIC_MEDIA_BASE_URL}/{child.storage_path} {child.width}w"
+        )
+    return {mime: ", ".join(entries) for mime, entries in srcset.items()}
@@ -0,0 +1,218 @@
+# backend/app/services/integrity.py
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+import asyncio
+import fcntl
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import select
+
+from ...database import AsyncSessionLocal
+from ...models import MediaAsset, MediaIntegrityCheck
+from ...settings import (
+    MEDIA_SCRUB_INTERVAL_SECONDS,
+    MEDIA_SCRUB_MAX_BYTES_PER_SECOND,
+    MEDIA_VERIFY_CACHE_SIZE,
+)
+from ...storage import media_root
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# flock()ed by whichever worker (or scrub_media run) is scrubbing
+SCRUB_LOCK_NAME = ".scrub.lock"
+
+# (st_ino, st_size, st_mtime_ns): any rewrite of the file changes at least one
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path: Path) -> FileSignature:
+    st = os.stat(path)
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def sha256_file(path: Path, max_bytes_per_second: int = 0) -> str:
+    """
+    Hash a file, optionally throttled to `max_bytes_per_second` so a scrub
+    does not saturate the disk. Blocking; run it in a thread.
+    """
+    h = hashlib.sha256()
+    started = time.monotonic()
+    read = 0
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+            read += len(chunk)
+            if max_bytes_per_second > 0:
+                ahead = read / max_bytes_per_second - (time.monotonic() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+    return h.hexdigest()
+
+
+class VerificationCache:
+    """
+    Remembers files whose hash has been verified, keyed by path and
+    (inode, size, mtime). An unchanged file is not re-hashed on download.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[FileSignature, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path: Path, signature: FileSignature) -> Optional[str]:
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def remember(self, path: Path, signature: FileSignature, sha256_hex: str) -> None:
+        if self._size <= 0:
+            return
+        key = str(path)
+        with self._lock:
+            self._entries[key] = (signature, sha256_hex)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._entries.pop(str(path), None)
+
+
+verification_cache = VerificationCache(MEDIA_VERIFY_CACHE_SIZE)
+
+
+async def verify_file(path: Path, expected_sha256: str) -> bool:
+    """
+    True if the file still matches `expected_sha256`. Re-hashes (in a
+    thread) only when the file's signature changed since the last check.
+    """
+    signature = await asyncio.to_thread(file_signature, path)
+    cached = verification_cache.lookup(path, signature)
+    if cached is not None:
+        return cached == expected_sha256
+
+    actual = await asyncio.to_thread(sha256_file, path)
+    # Only trust the result if the file did not change while we read it
+    if await asyncio.to_thread(file_signature, path) == signature:
+        verification_cache.remember(path, signature, actual)
+    return actual == expected_sha256
+
+
+async def scrub_media_once(max_bytes_per_second: int = MEDIA_SCRUB_MAX_BYTES_PER_SECOND) -> Dict[str, int]:
+    """
+    Re-verify every asset with a stored hash and record the result in
+    media_integrity_checks. Returns counts per status.
+    """
+    async with AsyncSessionLocal() as db:
+        rows = (
+            await db.execute(
+                select(
+                    MediaAsset.id,
+                    MediaAsset.storage_path,
+                    MediaAsset.is_public,
+                    MediaAsset.sha256_hash,
+                )
+                .where(MediaAsset.sha256_hash.isnot(None))
+                .order_by(MediaAsset.id)
+            )
+        ).all()
+
+        counts = {"ok": 0, "corrupt": 0, "missing": 0}
+        for asset_id, storage_path, is_public, expected in rows:
+            path = media_root("public" if is_public else "private") / storage_path
+            try:
+                signature = await asyncio.to_thread(file_signature, path)
+                actual = await asyncio.to_thread(sha256_file, path, max_bytes_per_second)
+            except FileNotFoundError:
+                status = "missing"
+                verification_cache.forget(path)
+            else:
+                status = "ok" if actual == expected else "corrupt"
+                # Only trust the result if the file did not change while we read it
+                try:
+                    unchanged = await asyncio.to_thread(file_signature, path) == signature
+                except FileNotFoundError:
+                    unchanged = False
+                if unchanged:
+                    verification_cache.remember(path, signature, actual)
+                else:
+                    verification_cache.forget(path)
+
+            counts[status] += 1
+            if status != "ok":
+                logger.warning("Media asset %s is %s (%s)", asset_id, status, path)
+            await db.merge(
+                MediaIntegrityCheck(
+                    asset_id=asset_id,
+                    status=status,
+                    checked_at=datetime.utcnow(),
+                )
+            )
+            await db.commit()
+
+    return counts
+
+
+@contextmanager
+def scrub_lock() -> Iterator[bool]:
+    """
+    Non-blocking exclusive lock shared by all workers and scrub_media runs
+    on this host. Yields whether it was acquired; the kernel releases it if
+    the holder dies.
+    """
+    root = media_root("private")
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / SCRUB_LOCK_NAME, "a") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            acquired = False
+        else:
+            acquired = True
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+async def run_scrubber(interval_seconds: int = MEDIA_SCRUB_INTERVAL_SECONDS) -> None:
+    """
+    Background loop: scrub, then sleep `interval_seconds`. Cancel to stop.
+    Only the worker holding scrub_lock() scrubs; the others retry every
+    interval and take over if it exits.
+    """
+    while True:
+        with scrub_lock() as acquired:
+            if acquired:
+                logger.info("Media scrubber running in worker %s", os.getpid())
+                while True:
+                    try:
+                        counts = await scrub_media_once()
+                        logger.info("Media scrub finished: %s", counts)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        logger.exception("Media scrub failed")
+                    await asyncio.sleep(interval_seconds)
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,238 @@
+# backend/app/services/json_patch.py
+
+from typing import Any, Dict, List
+import copy
+
+from .json_pointer import JsonPointerError, parse_pointer
+
+JsonPatch = List[Dict[str, Any]]
+
+
+class JsonPatchError(ValueError):
+    """Raised when a JSON Patch document is invalid or cannot be applied."""
+
+
+class JsonPatchTestFailed(JsonPatchError):
+    """Raised when a JSON Patch "test" operation does not match."""
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+# ----- Diff -----
+
+def json_equal(a: Any, b: Any) -> bool:
+    """
+    `a == b`, except that values of different types never match: Python has
+    1 == 1.0 == True, but they serialize (and must round-trip) differently.
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(json_equal(value, b[key]) for key, value in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> JsonPatch:
+    """
+    Compute an RFC 6902 patch that turns `old` into `new`.
+
+    Objects are diffed key by key; arrays keep their common prefix/suffix and
+    diff the middle element-wise, so appending or editing one career position
+    yields a single small operation rather than a copy of the whole list.
+    """
+    if json_equal(old, new):
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: JsonPatch = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_lists(old, new, path)
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _diff_lists(old: list, new: list, path: str) -> JsonPatch:
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and json_equal(old[prefix], new[prefix]):
+        prefix += 1
+
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and json_equal(old[len(old) - 1 - suffix], new[len(new) - 1 - suffix])
+    ):
+        suffix += 1
+
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+
+    ops: JsonPatch = []
+    shared = min(len(old_mid), len(new_mid))
+    for offset in range(shared):
+        ops.extend(make_patch(old_mid[offset], new_mid[offset], f"{path}/{prefix + offset}"))
+
+    # Remove surplus items back to front so indices stay valid
+    for offset in range(len(old_mid) - 1, shared - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{prefix + offset}"})
+    for offset in range(shared, len(new_mid)):
+        ops.append({"op": "add", "path": f"{path}/{prefix + offset}", "value": new_mid[offset]})
+    return ops
+
+
+# ----- Apply -----
+
+def _parent(document: Any, pointer: str):
+    try:
+        tokens = parse_pointer(pointer)
+    except JsonPointerError as exc:
+        raise JsonPatchError(str(exc)) from exc
+    if not tokens:
+        return None, None
+
+    target = document
+    for token in tokens[:-1]:
+        if isinstance(target, dict) and token in target:
+            target = target[token]
+        elif isinstance(target, list) and token.isdigit() and int(token) < len(target):
+            target = target[int(token)]
+        else:
+            raise JsonPatchError(f"Path not found: {pointer}")
+    return target, tokens[-1]
+
+
+def _list_index(container: list, token: str, *, allow_end: bool) -> int:
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"Array index out of range: {token}")
+    return index
+
+
+def _get(document: Any, pointer: str) -> Any:
+    parent, token = _parent(document, pointer)
+    if parent is None:
+        return document
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"Path not found: {pointer}")
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[_list_index(parent, token, allow_end=False)]
+    raise JsonPatchError(f"Path not found: {pointer}")
+
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    parent, token = _parent(document, pointer)
+    if parent is None:
+        return value
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Path not found: {pointer}")
+    return document
+
+
+def _remove(document: Any, pointer: str) -> Any:
+    parent, token = _parent(document, pointer)
+    if parent is None:
+        raise JsonPatchError("Cannot remove the document root")
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"Path not found: {pointer}")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, token, allow_end=False))
+    raise JsonPatchError(f"Path not found: {pointer}")
+
+
+def apply_patch(document: Any, patch: JsonPatch, *, in_place: bool = False) -> Any:
+    """
+    Apply an RFC 6902 patch and return the new document.
+    `document` itself is left untouched unless `in_place` is set, for
+    callers replaying several patches onto a copy they own.
+    """
+    if not isinstance(patch, list):
+        raise JsonPatchError("A JSON Patch must be a list of operations")
+
+    result = document if in_place else copy.deepcopy(document)
+    for operation in patch:
+        if not isinstance(operation, dict) or "op" not in operation or "path" not in operation:
+            raise JsonPatchError(f"Invalid operation: {operation!r}")
+        op, path = operation["op"], operation["path"]
+
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise JsonPatchError(f"'{op}' requires a value")
+
+        if op == "add":
+            result = _add(result, path, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            _remove(result, path)
+        elif op == "replace":
+            _get(result, path)
+            parent, token = _parent(result, path)
+            if parent is None:
+                result = copy.deepcopy(operation["value"])
+            elif isinstance(parent, list):
+                parent[_list_index(parent, token, allow_end=False)] = copy.deepcopy(operation["value"])
+            else:
+                parent[token] = copy.deepcopy(operation["value"])
+        elif op == "move":
+            source = operation.get("from")
+            if source is None:
+                raise JsonPatchError("'move' requires from")
+            if path.startswith(source + "/"):
+                raise JsonPatchError("Cannot move a value into one of its children")
+            if source != path:
+                result = _add(result, path, _remove(result, source))
+        elif op == "copy":
+            source = operation.get("from")
+            if source is None:
+                raise JsonPatchError("'copy' requires from")
+            result = _add(result, path, copy.deepcopy(_get(result, source)))
+        elif op == "test":
+            if _get(result, path) != operation["value"]:
+                raise JsonPatchTestFailed(f"Test failed at {path}")
+        else:
+            raise JsonPatchError(f"Unknown operation: {op!r}")
+    return result
+
+
+# ----- Merge Patch -----
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Apply an RFC 7386 JSON Merge Patch and return the new document.
+    Objects merge recursively, null removes a key, anything else replaces.
+    `target` itself is left untouched.
+    """
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+
+    result = copy.deepcopy(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
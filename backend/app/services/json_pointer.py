@@ -0,0 +1,47 @@
+# backend/app/services/json_pointer.py
+
+from typing import Any, List
+
+
+class JsonPointerError(ValueError):
+    """Raised when a JSON pointer is malformed or does not resolve."""
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """
+    Split an RFC 6901 JSON pointer ("/careers/positions/0") into tokens.
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPointerError(f"Invalid JSON pointer: {pointer!r}")
+    return [
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer[1:].split("/")
+    ]
+
+
+def _array_index(token: str, size: int) -> int:
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPointerError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index >= size:
+        raise JsonPointerError(f"Array index out of range: {token}")
+    return index
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    """
+    Return the value at `pointer` inside `document`.
+    """
+    value = document
+    for token in parse_pointer(pointer):
+        if isinstance(value, dict):
+            if token not in value:
+                raise JsonPointerError(f"Path not found: {pointer}")
+            value = value[token]
+        elif isinstance(value, list):
+            value = value[_array_index(token, len(value))]
+        else:
+            raise JsonPointerError(f"Path not found: {pointer}")
+    return value
@@ -0,0 +1,120 @@
+# backend/app/services/media_service.py
+
+from typing import List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models import MediaAsset, MediaBlob
+from ...storage import BLOB_DIR
+
+
+def is_blob_path(storage_path: str) -> bool:
+    return storage_path.startswith(f"{BLOB_DIR}/")
+
+
+async def add_blob_reference(db: AsyncSession, asset: MediaAsset) -> Optional[str]:
+    """
+    Count `asset` as one more reference to its content-addressed blob.
+    Runs inside the caller's transaction; no-op for non-blob paths.
+
+    A blob keeps the path it was first stored under. If the same bytes were
+    uploaded before with another extension, `asset` is pointed at that file
+    and the path just written is returned, for the caller to delete after
+    committing (None when there is nothing to delete).
+    """
+    if not is_blob_path(asset.storage_path):
+        return None
+
+    bump = (
+        update(MediaBlob)
+        .where(MediaBlob.sha256_hash == asset.sha256_hash, MediaBlob.is_public == asset.is_public)
+        .values(ref_count=MediaBlob.ref_count + 1)
+        .returning(MediaBlob.storage_path)
+    )
+    blob_path = (await db.execute(bump)).scalar_one_or_none()
+    if blob_path is None:
+        try:
+            async with db.begin_nested():
+                db.add(
+                    MediaBlob(
+                        sha256_hash=asset.sha256_hash,
+                        is_public=asset.is_public,
+                        storage_path=asset.storage_path,
+                        size_bytes=asset.size_bytes,
+                        ref_count=1,
+                    )
+                )
+            return None
+        except IntegrityError:
+            # A concurrent upload of the same bytes created the row first
+            blob_path = (await db.execute(bump)).scalar_one()
+
+    if blob_path == asset.storage_path:
+        return None
+    written = asset.storage_path
+    asset.storage_path = blob_path
+    # Assets stored before blob paths were shared may still use the file
+    in_use = await db.scalar(
+        select(func.count(MediaAsset.id)).where(
+            MediaAsset.storage_path == written,
+            MediaAsset.is_public == asset.is_public,
+            MediaAsset.id != asset.id,
+        )
+    )
+    return None if in_use else written
+
+
+async def release_asset_file(db: AsyncSession, asset: MediaAsset) -> List[str]:
+    """
+    Drop the asset's reference to its file. Returns the storage paths
+    nothing else uses any more, for the caller to delete from disk after
+    committing.
+    """
+    if not is_blob_path(asset.storage_path):
+        others = await db.scalar(
+            select(func.count(MediaAsset.id)).where(
+                MediaAsset.storage_path == asset.storage_path,
+                MediaAsset.is_public == asset.is_public,
+                MediaAsset.id != asset.id,
+            )
+        )
+        return [] if others else [asset.storage_path]
+
+    blob = await db.scalar(
+        select(MediaBlob)
+        .where(MediaBlob.sha256_hash == asset.sha256_hash, MediaBlob.is_public == asset.is_public)
+        .with_for_update()
+    )
+    if blob is None:
+        return []
+
+    blob.ref_count -= 1
+    if blob.ref_count > 0:
+        return []
+    await db.delete(blob)
+    # Assets stored before blob paths were shared may name another copy
+    return sorted({blob.storage_path, asset.storage_path})
+
+
+async def unreferenced_paths(db: AsyncSession, paths: List[str], is_public: bool) -> List[str]:
+    """
+    Those of `paths` that no blob or asset names. Check again right before
+    deleting what release_asset_file() returned: an upload of the same bytes
+    may have re-created the blob once the release committed.
+    """
+    if not paths:
+        return []
+    blob_paths = await db.scalars(
+        select(MediaBlob.storage_path).where(
+            MediaBlob.storage_path.in_(paths), MediaBlob.is_public == is_public
+        )
+    )
+    asset_paths = await db.scalars(
+        select(MediaAsset.storage_path).where(
+            MediaAsset.storage_path.in_(paths), MediaAsset.is_public == is_public
+        )
+    )
+    in_use = set(blob_paths.all()) | set(asset_paths.all())
+    return [path for path in paths if path not in in_use]
@@ -0,0 +1,211 @@
+# backend/app/services/resume_bundle.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+import csv
+import io
+import os
+import re
+import zipfile
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models import CareerApplication, MediaAsset
+from ...storage import media_root
+
+# Already-compressed formats are stored as-is; deflating them costs CPU for
+# no gain (.docx is itself a ZIP).
+STORED_SUFFIXES = {".pdf", ".docx", ".zip", ".jpg", ".jpeg", ".png", ".webp", ".gif"}
+
+BUNDLE_CHUNK_SIZE = 256 * 1024
+
+MANIFEST_FIELDS = (
+    "application_id",
+    "created_at",
+    "full_name",
+    "email",
+    "position",
+    "resume_file_id",
+    "entry",
+    "size_bytes",
+    "sha256",
+    "status",
+)
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+def _slug(value: str, fallback: str) -> str:
+    return _SLUG_RE.sub("-", value).strip("-")[:60] or fallback
+
+
+@dataclass
+class BundleEntry:
+    application_id: int
+    created_at: datetime
+    full_name: str
+    email: str
+    position: str
+    asset_id: int
+    path: Path
+    sha256_hash: Optional[str]
+    size_bytes: Optional[int] = None
+
+    @property
+    def arcname(self) -> str:
+        return (
+            f"{_slug(self.position, 'position')}/"
+            f"{self.application_id}-{_slug(self.full_name, 'applicant')}{self.path.suffix.lower()}"
+        )
+
+
+async def find_bundle_entries(
+    db: AsyncSession,
+    *,
+    ids: Sequence[int] = (),
+    position: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int,
+) -> List[BundleEntry]:
+    """
+    Applications matching every given selector, oldest first, with the
+    location of their resume. At most `limit` + 1 rows are returned so the
+    caller can tell that the selection was too large.
+    """
+    stmt = (
+        select(
+            CareerApplication.id,
+            CareerApplication.created_at,
+            CareerApplication.full_name,
+            CareerApplication.email,
+            CareerApplication.position,
+            MediaAsset.id,
+            MediaAsset.storage_path,
+            MediaAsset.is_public,
+            MediaAsset.sha256_hash,
+        )
+        .join(MediaAsset, MediaAsset.id == CareerApplication.resume_file_id)
+        .order_by(CareerApplication.created_at, CareerApplication.id)
+        .limit(limit + 1)
+    )
+    if ids:
+        stmt = stmt.where(CareerApplication.id.in_(ids))
+    if position:
+        stmt = stmt.where(CareerApplication.position == position)
+    if created_from:
+        stmt = stmt.where(CareerApplication.created_at >= created_from)
+    if created_to:
+        stmt = stmt.where(CareerApplication.created_at < created_to)
+
+    rows = await db.execute(stmt)
+    return [
+        BundleEntry(
+            application_id=app_id,
+            created_at=created_at,
+            full_name=full_name,
+            email=email,
+            position=position,
+            asset_id=asset_id,
+            path=media_root("public" if is_public else "private") / storage_path,
+            sha256_hash=sha256_hash,
+        )
+        for app_id, created_at, full_name, email, position, asset_id, storage_path, is_public, sha256_hash in rows
+    ]
+
+
+def stat_entries(entries: List[BundleEntry]) -> None:
+    """Fill in size_bytes from disk; missing files keep None. Blocking."""
+    for entry in entries:
+        try:
+            entry.size_bytes = os.stat(entry.path).st_size
+        except FileNotFoundError:
+            entry.size_bytes = None
+
+
+def build_manifest(entries: List[BundleEntry]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(MANIFEST_FIELDS)
+    for entry in entries:
+        present = entry.size_bytes is not None
+        writer.writerow(
+            [
+                entry.application_id,
+                entry.created_at.isoformat(),
+                entry.full_name,
+                entry.email,
+                entry.position,
+                entry.asset_id,
+                entry.arcname if present else "",
+                entry.size_bytes if present else "",
+                entry.sha256_hash or "",
+                "included" if present else "missing",
+            ]
+        )
+    return buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink:
+    """
+    Write-only, unseekable file object. ZipFile then emits data descriptors
+    instead of seeking back, so the archive can be sent as it is written.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_time(value: datetime):
+    return max(value, datetime(1980, 1, 1)).timetuple()[:6]
+
+
+def stream_resume_zip(entries: List[BundleEntry], manifest: bytes) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive (manifest.csv plus every resume found on disk) one
+    chunk at a time; nothing is staged on disk or held in memory beyond a
+    chunk. Blocking; Starlette iterates it in a worker thread.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", allowZip64=True) as archive:
+        info = zipfile.ZipInfo("manifest.csv", date_time=_zip_time(datetime.utcnow()))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        archive.writestr(info, manifest)
+        yield sink.drain()
+
+        for entry in entries:
+            if entry.size_bytes is None:
+                continue
+            info = zipfile.ZipInfo(entry.arcname, date_time=_zip_time(entry.created_at))
+            info.compress_type = (
+                zipfile.ZIP_STORED
+                if entry.path.suffix.lower() in STORED_SUFFIXES
+                else zipfile.ZIP_DEFLATED
+            )
+            info.file_size = entry.size_bytes
+            with entry.path.open("rb") as src, archive.open(info, "w") as dst:
+                for chunk in iter(lambda: src.read(BUNDLE_CHUNK_SIZE), b""):
+                    dst.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+
+    yield sink.drain()
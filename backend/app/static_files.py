@@ -0,0 +1,53 @@
+# backend/app/static_files.py
+
+import mimetypes
+import os
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from ..precompress import ENCODING_SUFFIXES
+from .compression import accepted_encodings
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves a precompressed sibling (<file>.br / <file>.gz)
+    when the client accepts that encoding and the sibling exists.
+    """
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        for encoding in accepted_encodings(
+            request_headers.get("accept-encoding", ""), ENCODING_SUFFIXES
+        ):
+            sibling = f"{full_path}{ENCODING_SUFFIXES[encoding]}"
+            try:
+                sibling_stat = os.stat(sibling)
+            except OSError:
+                continue
+            media_type, _ = mimetypes.guess_type(str(full_path))
+            response = FileResponse(
+                sibling,
+                status_code=status_code,
+                stat_result=sibling_stat,
+                media_type=media_type or "application/octet-stream",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            break
+        else:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+            if any(os.path.exists(f"{full_path}{s}") for s in ENCODING_SUFFIXES.values()):
+                response.headers["Vary"] = "Accept-Encoding"
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
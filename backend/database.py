@@ -1,37 +1,82 @@
 # backend/database.py
-import os
-from typing import Generator
+import threading
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, declarative_base
 
-# Example default – make sure this matches your docker-compose env
-DATABASE_URL = os.getenv(
-    "DATABASE_URL",
-    "postgresql+psycopg2://postgres:postgres@db:5432/postgres",
-)
+from .db_pool import attach_pool_metrics, pool_options
+from .metrics import attach_query_metrics
+from .query_profiler import attach_query_profiler
+from .settings import ASYNC_DATABASE_URL, DATABASE_URL, METRICS_ENABLED
 
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-)
 
-SessionLocal = sessionmaker(
-    autocommit=False,
+def to_async_url(url: str) -> str:
+    """
+    Map a sync DATABASE_URL onto its async driver
+    (psycopg2 -> asyncpg, pysqlite -> aiosqlite).
+    """
+    scheme, sep, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if dialect in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+# Request handling runs on the async engine. Creating it does not connect;
+# the first checkout does. Pool sizing comes from the DB_POOL_* settings.
+_async_url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+async_engine = create_async_engine(_async_url, **pool_options(_async_url))
+attach_pool_metrics(async_engine.sync_engine)
+if METRICS_ENABLED:
+    attach_query_metrics(async_engine.sync_engine)
+# Inert unless a profile is open (DB_PROFILE_QUERIES, or assert_max_queries)
+attach_query_profiler(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
     autoflush=False,
-    bind=engine,
+    expire_on_commit=False,
 )
 
 Base = declarative_base()
 
+_sync_lock = threading.Lock()
+_sync_engine: Optional[Engine] = None
+_sync_sessionmaker: Optional[sessionmaker] = None
+
+
+def get_sync_engine() -> Engine:
+    """
+    Sync engine for migrations and CLI scripts, created on first use so the
+    app never loads the sync driver.
+    """
+    global _sync_engine, _sync_sessionmaker
+    with _sync_lock:
+        if _sync_engine is None:
+            _sync_engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+            _sync_sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=_sync_engine)
+        return _sync_engine
+
+
+def __getattr__(name: str):
+    # `from backend.database import engine, SessionLocal` keeps working for scripts
+    if name == "engine":
+        return get_sync_engine()
+    if name == "SessionLocal":
+        get_sync_engine()
+        return _sync_sessionmaker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI dependency that yields a database session
+    FastAPI dependency that yields an async database session
     and closes it after the request.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -0,0 +1,202 @@
+# backend/db_pool.py
+#
+# Connection pool configuration and metrics for the async engine. Metrics
+# are per worker process: multiply by the number of uvicorn workers when
+# sizing against Postgres max_connections.
+
+import threading
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from .settings import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            # A gauge rather than a counter, so it survives reset()
+            self.open_connections = getattr(self, "open_connections", 0)
+            self.invalidations = 0
+            self.soft_invalidations = 0
+            self.timeouts = 0
+            self.overflow_connects = 0
+            self.waiting = 0
+            self.max_waiting = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def begin_wait(self) -> None:
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def end_wait(self, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self.wait_buckets[i] += 1
+                    break
+            else:
+                self.wait_buckets[-1] += 1
+
+    def opened(self, pool_size) -> None:
+        with self._lock:
+            self.connects += 1
+            self.open_connections += 1
+            if pool_size is not None and self.open_connections > pool_size:
+                # Beyond pool_size; closed again when checked back in
+                self.overflow_connects += 1
+
+    def closed(self) -> None:
+        with self._lock:
+            self.open_connections = max(0, self.open_connections - 1)
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waited = sum(self.wait_buckets)
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "open_connections": self.open_connections,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "timeouts": self.timeouts,
+                "overflow_connects": self.overflow_connects,
+                "waiting": self.waiting,
+                "max_waiting": self.max_waiting,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "wait_seconds_avg": self.wait_seconds_total / waited if waited else 0.0,
+                "wait_histogram": {
+                    **{f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS, self.wait_buckets)},
+                    "le_inf": self.wait_buckets[-1],
+                },
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times how long each checkout takes to get a
+    usable connection: queueing on a full pool, opening a new connection,
+    and the pre-ping.
+    """
+
+    def connect(self):
+        pool_metrics.begin_wait()
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.end_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        except BaseException:
+            pool_metrics.end_wait(time.perf_counter() - start, timed_out=False)
+            raise
+        pool_metrics.end_wait(time.perf_counter() - start, timed_out=False)
+        return connection
+
+
+def pool_options(url: str) -> Dict[str, Any]:
+    """
+    create_async_engine() keyword arguments for the configured pool.
+    In-memory SQLite keeps its single shared connection (StaticPool).
+    """
+    options: Dict[str, Any] = {"pool_pre_ping": DB_POOL_PRE_PING}
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":")):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncPool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return options
+
+
+def attach_pool_metrics(engine: Engine) -> None:
+    """
+    Count pool events on `engine` (the sync_engine of an async engine).
+    Listeners on the engine also cover pools recreated by dispose().
+    """
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record) -> None:
+        pool_metrics.opened(engine.pool.size() if isinstance(engine.pool, AsyncAdaptedQueuePool) else None)
+
+    @event.listens_for(engine, "close")
+    def _close(dbapi_connection, connection_record) -> None:
+        pool_metrics.closed()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        pool_metrics.increment("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record) -> None:
+        pool_metrics.increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _invalidate(dbapi_connection, connection_record, exception) -> None:
+        pool_metrics.increment("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _soft_invalidate(dbapi_connection, connection_record, exception) -> None:
+        pool_metrics.increment("soft_invalidations")
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """
+    Live gauges and configuration of a pool.
+    """
+    status: Dict[str, Any] = {"class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+            recycle=pool._recycle,
+            pre_ping=pool._pre_ping,
+            # Most connections this worker can hold at once
+            max_connections=pool.size() + max(pool._max_overflow, 0),
+        )
+    return status
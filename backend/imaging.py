@@ -0,0 +1,98 @@
+# backend/imaging.py
+#
+# Image resizing for responsive renditions. Runs inside worker processes
+# (see app.services.image_variants), so it only depends on Pillow.
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+# format name -> (Pillow format, MIME type, file extension)
+VARIANT_FORMATS = {
+    "avif": ("AVIF", "image/avif", ".avif"),
+    "webp": ("WEBP", "image/webp", ".webp"),
+    "jpeg": ("JPEG", "image/jpeg", ".jpg"),
+}
+
+_SAVE_OPTIONS = {
+    "AVIF": {},
+    "WEBP": {"method": 4},
+    "JPEG": {"optimize": True, "progressive": True},
+}
+
+
+def _prepare(frame, pil_format: str):
+    from PIL import Image
+
+    has_alpha = "A" in frame.getbands() or "transparency" in frame.info
+    if pil_format == "JPEG":
+        if has_alpha:
+            rgba = frame.convert("RGBA")
+            flat = Image.new("RGB", rgba.size, (255, 255, 255))
+            flat.paste(rgba, mask=rgba.getchannel("A"))
+            return flat
+        return frame if frame.mode in ("RGB", "L") else frame.convert("RGB")
+    if frame.mode not in ("RGB", "RGBA"):
+        return frame.convert("RGBA" if has_alpha else "RGB")
+    return frame
+
+
+def render_variants(
+    source: str,
+    out_dir: str,
+    widths: Sequence[int],
+    formats: Sequence[str],
+    quality: int,
+) -> Dict[str, Any]:
+    """
+    Write resized copies of `source` into `out_dir` as <width>w.<ext>, one
+    per width below the original (never upscaled; an image narrower than
+    every width is only re-encoded) and format Pillow can save.
+    Returns the original size and one dict per file written.
+    """
+    from PIL import Image, ImageOps
+
+    Image.init()
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+        width, height = image.size
+        targets = sorted({w for w in widths if 0 < w < width}) or [width]
+
+        variants: List[Dict[str, Any]] = []
+        for target in targets:
+            target_height = max(1, round(height * target / width))
+            resized = (
+                image.resize((target, target_height), Image.Resampling.LANCZOS)
+                if target != width
+                else image
+            )
+            for name in formats:
+                if name not in VARIANT_FORMATS:
+                    continue
+                pil_format, mime_type, ext = VARIANT_FORMATS[name]
+                if pil_format not in Image.SAVE:
+                    continue
+                dest = out / f"{target}w{ext}"
+                tmp = dest.with_name(dest.name + ".tmp")
+                _prepare(resized, pil_format).save(
+                    tmp, format=pil_format, quality=quality, **_SAVE_OPTIONS[pil_format]
+                )
+                os.replace(tmp, dest)
+                data = dest.read_bytes()
+                variants.append(
+                    {
+                        "name": dest.name,
+                        "width": target,
+                        "height": target_height,
+                        "mime_type": mime_type,
+                        "size_bytes": len(data),
+                        "sha256_hash": hashlib.sha256(data).hexdigest(),
+                    }
+                )
+
+    return {"width": width, "height": height, "variants": variants}
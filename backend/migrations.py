@@ -0,0 +1,132 @@
+# backend/migrations.py
+#
+# Schema migrations, applied once per deployment before the app starts
+# (python -m backend.scripts.migrate). Each step inspects the live schema
+# and only changes what is missing, so re-running them is safe: a new
+# database gets everything from create_all, and the later steps bring
+# databases created by older releases up to date.
+
+from typing import Callable, List, Tuple
+
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.engine import Engine
+
+from .app.services.application_search import install_application_search
+from .database import Base
+from .models import CareerApplication, ContentVersion
+
+
+class MigrationError(Exception):
+    """
+    A step cannot be applied without manual intervention.
+    """
+
+
+def create_tables(engine: Engine) -> List[str]:
+    existing = set(inspect(engine).get_table_names())
+    Base.metadata.create_all(bind=engine)
+    return [
+        f"Created table {name}."
+        for name in Base.metadata.tables
+        if name not in existing
+    ]
+
+
+def add_content_keyframe_column(engine: Engine) -> List[str]:
+    columns = {c["name"] for c in inspect(engine).get_columns("content_versions")}
+    if "is_keyframe" in columns:
+        return []
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE content_versions ADD COLUMN is_keyframe BOOLEAN"))
+    return ["Added content_versions.is_keyframe."]
+
+
+CONTENT_VERSION_INDEX = "ix_content_versions_version"
+
+
+def make_content_version_unique(engine: Engine) -> List[str]:
+    """
+    Concurrent publishers rely on a unique content_versions.version.
+    """
+    indexes = {ix["name"]: ix for ix in inspect(engine).get_indexes("content_versions")}
+    if indexes.get(CONTENT_VERSION_INDEX, {}).get("unique"):
+        return []
+
+    with engine.connect() as conn:
+        duplicates = conn.execute(
+            select(ContentVersion.version, func.count(ContentVersion.id))
+            .group_by(ContentVersion.version)
+            .having(func.count(ContentVersion.id) > 1)
+        ).all()
+    if duplicates:
+        listed = ", ".join(f"version {v} x{n}" for v, n in duplicates)
+        raise MigrationError(
+            f"Duplicate content versions ({listed}); keep one row each and re-run."
+        )
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX IF EXISTS {CONTENT_VERSION_INDEX}"))
+        conn.execute(
+            text(f"CREATE UNIQUE INDEX {CONTENT_VERSION_INDEX} ON content_versions (version)")
+        )
+    return ["Made content_versions.version unique."]
+
+
+def add_application_indexes(engine: Engine) -> List[str]:
+    existing = {ix["name"] for ix in inspect(engine).get_indexes("career_applications")}
+    created = []
+    for index in CareerApplication.__table__.indexes:
+        if index.name.endswith("_created_at_id") and index.name not in existing:
+            index.create(bind=engine)
+            created.append(f"Created index {index.name}.")
+    return created
+
+
+MEDIA_VARIANT_COLUMNS = {
+    "parent_id": "INTEGER REFERENCES media_assets(id)",
+    "width": "INTEGER",
+    "height": "INTEGER",
+}
+
+
+def add_media_variant_columns(engine: Engine) -> List[str]:
+    existing = {c["name"] for c in inspect(engine).get_columns("media_assets")}
+    added = []
+    with engine.begin() as conn:
+        for name, ddl in MEDIA_VARIANT_COLUMNS.items():
+            if name in existing:
+                continue
+            conn.execute(text(f"ALTER TABLE media_assets ADD COLUMN {name} {ddl}"))
+            added.append(f"Added media_assets.{name}.")
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_media_assets_parent_id ON media_assets (parent_id)")
+        )
+    return added
+
+
+def install_search(engine: Engine) -> List[str]:
+    install_application_search(engine)
+    return []
+
+
+MIGRATIONS: List[Tuple[str, Callable[[Engine], List[str]]]] = [
+    ("create_tables", create_tables),
+    ("content_keyframe_column", add_content_keyframe_column),
+    ("content_version_unique", make_content_version_unique),
+    ("application_indexes", add_application_indexes),
+    ("media_variant_columns", add_media_variant_columns),
+    ("application_search", install_search),
+]
+
+
+def run_migrations(engine: Engine, log: Callable[[str], None] = print) -> int:
+    """
+    Apply every step in order and return the number of changes made.
+    Raises MigrationError if a step needs manual intervention.
+    """
+    changes = 0
+    for name, step in MIGRATIONS:
+        for message in step(engine):
+            log(f"[{name}] {message}")
+            changes += 1
+    return changes
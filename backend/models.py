@@ -6,6 +6,8 @@ from sqlalchemy import (
     DateTime,
     JSON,
     ForeignKey,
+    Index,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -16,8 +18,13 @@ from .database import Base
 class ContentVersion(Base):
     __tablename__ = "content_versions"
     id = Column(Integer, primary_key=True, index=True)
-    version = Column(Integer, nullable=False, index=True)
+    # Unique: concurrent publishers race on this index, not on a lock
+    version = Column(Integer, nullable=False, unique=True, index=True)
+    # Full document for keyframes, a JSON Patch against the previous
+    # version otherwise (see content_service.save_content_to_db)
     content_json = Column(JSON, nullable=False)
+    # NULL for rows written before delta storage; those are full copies
+    is_keyframe = Column(Boolean, nullable=True, default=True)
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     created_by = Column(String(128), nullable=True)
@@ -40,14 +47,56 @@ class MediaAsset(Base):
 
     is_public = Column(Boolean, nullable=False, default=False)
 
+    # Resized renditions point at the original upload
+    parent_id = Column(Integer, ForeignKey("media_assets.id"), nullable=True, index=True)
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     created_by = Column(String(128), nullable=True)
 
     applications = relationship("CareerApplication", back_populates="resume_file")
 
 
+class MediaBlob(Base):
+    """
+    One content-addressed file on disk, shared by every MediaAsset with the
+    same bytes and visibility. ref_count is the number of such assets.
+    """
+
+    __tablename__ = "media_blobs"
+    __table_args__ = (
+        UniqueConstraint("sha256_hash", "is_public", name="uq_media_blobs_hash_visibility"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256_hash = Column(String(64), nullable=False)
+    is_public = Column(Boolean, nullable=False, default=False)
+    storage_path = Column(String(512), nullable=False)
+    size_bytes = Column(Integer, nullable=True)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class MediaIntegrityCheck(Base):
+    """
+    Latest scrubber result per asset: "ok", "corrupt" or "missing".
+    """
+
+    __tablename__ = "media_integrity_checks"
+
+    asset_id = Column(Integer, ForeignKey("media_assets.id"), primary_key=True)
+    status = Column(String(16), nullable=False)
+    checked_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class CareerApplication(Base):
     __tablename__ = "career_applications"
+    __table_args__ = (
+        # Keyset pagination of the admin listing, newest first
+        Index("ix_career_applications_created_at_id", "created_at", "id"),
+        Index("ix_career_applications_position_created_at_id", "position", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String(256), nullable=False)
@@ -0,0 +1,100 @@
+# backend/precompress.py
+#
+# Precompressed siblings (<file>.br, <file>.gz) for compressible public
+# media, written once at upload time so serving them costs no CPU.
+
+import gzip
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional; gzip siblings are still written
+    brotli = None
+
+from .settings import MEDIA_PRECOMPRESS_ENCODINGS, MEDIA_PRECOMPRESS_MIN_BYTES
+
+# MIME types worth compressing (images like JPEG/PNG/WebP already are)
+COMPRESSIBLE_TYPES = {
+    "image/svg+xml",
+    "application/pdf",
+    "application/msword",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/plain",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+}
+
+# encoding -> file suffix, in server preference order
+ENCODING_SUFFIXES: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+# A sibling must save at least this fraction of the original to be kept
+MIN_SAVING = 0.1
+
+
+def is_compressible(mime_type: Optional[str]) -> bool:
+    return bool(mime_type) and (
+        mime_type in COMPRESSIBLE_TYPES or mime_type.startswith("text/")
+    )
+
+
+def available_encodings() -> List[str]:
+    return [
+        e for e in MEDIA_PRECOMPRESS_ENCODINGS
+        if e in ENCODING_SUFFIXES and (e != "br" or brotli is not None)
+    ]
+
+
+def sibling_path(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+
+
+# Brotli's top quality runs at ~1 MB/s; large files use a faster level
+BROTLI_MAX_QUALITY_BYTES = 4 * 1024 * 1024
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        quality = 11 if len(data) <= BROTLI_MAX_QUALITY_BYTES else 9
+        return brotli.compress(data, quality=quality)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def write_precompressed(path: Path, *, force: bool = False) -> List[str]:
+    """
+    Write .br / .gz siblings next to `path` (temp file + rename) and return
+    the encodings now available. Siblings that would not save at least
+    MIN_SAVING are not kept. Blocking; run it in a thread.
+    """
+    size = path.stat().st_size
+    if size < MEDIA_PRECOMPRESS_MIN_BYTES:
+        return []
+
+    data = None
+    written = []
+    for encoding in available_encodings():
+        dest = sibling_path(path, encoding)
+        if dest.exists() and not force:
+            written.append(encoding)
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = _compress(data, encoding)
+        if len(compressed) > size * (1 - MIN_SAVING):
+            dest.unlink(missing_ok=True)
+            continue
+        tmp = dest.with_name(dest.name + ".tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, dest)
+        written.append(encoding)
+    return written
+
+
+def remove_precompressed(path: Path) -> None:
+    for encoding in ENCODING_SUFFIXES:
+        sibling_path(path, encoding).unlink(missing_ok=True)
@@ -0,0 +1,136 @@
+# backend/query_profiler.py
+#
+# Per-request SQL profiling on engine events. While profile_queries() is
+# open, every statement the current task runs is counted, timed and grouped
+# by shape (the SQL with whitespace and IN-lists collapsed; never bind
+# values). QueryProfilerMiddleware opens one per request when
+# DB_PROFILE_QUERIES is set; tests use assert_max_queries() to hold an
+# endpoint to a query budget. Outside a profile (background tasks, or
+# profiling off) a statement costs one contextvar lookup.
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+import logging
+import re
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .settings import DB_N_PLUS_ONE_THRESHOLD, DB_SLOW_QUERY_MS
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = r"(?:\?|%s|\$\d+|:\w+|%\(\w+\)s)"
+# Expanded IN (...) lists differ in length per call but are the same query
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("(...)", shape)
+
+
+@dataclass
+class QueryProfile:
+    parent: Optional["QueryProfile"] = None
+    count: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, shape: str, seconds: float) -> None:
+        # Nested profiles (a test budget around a profiled request) all count it
+        profile: Optional[QueryProfile] = self
+        while profile is not None:
+            profile.count += 1
+            profile.seconds += seconds
+            profile.shapes[shape] += 1
+            profile = profile.parent
+
+    def repeated(self, threshold: int = DB_N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """
+        Statement shapes run at least `threshold` times: likely N+1 loops.
+        """
+        if threshold <= 0:
+            return []
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        noun = "query" if self.count == 1 else "queries"
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} {noun}"'
+
+    def summary(self) -> str:
+        lines = [f"{self.count} queries in {self.seconds * 1000:.1f} ms"]
+        lines.extend(f"  {n} x {shape}" for shape, n in self.shapes.most_common())
+        return "\n".join(lines)
+
+
+_current: ContextVar[Optional[QueryProfile]] = ContextVar("query_profile", default=None)
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    profile = QueryProfile(parent=_current.get())
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(
+    limit: int,
+    *,
+    repeat_threshold: int = DB_N_PLUS_ONE_THRESHOLD,
+) -> Iterator[QueryProfile]:
+    """
+    Test helper: fail if the block runs more than `limit` statements, or
+    repeats one statement `repeat_threshold` times (0 = allow):
+
+        with assert_max_queries(2):
+            await client.get("/api/admin/applications", headers=admin)
+    """
+    with profile_queries() as profile:
+        yield profile
+    problems = []
+    if profile.count > limit:
+        problems.append(f"expected at most {limit} queries, ran {profile.count}")
+    for shape, n in profile.repeated(repeat_threshold):
+        problems.append(f"possible N+1: {n} x {shape}")
+    if problems:
+        raise AssertionError("\n".join(problems + [profile.summary()]))
+
+
+def attach_query_profiler(engine: Engine) -> None:
+    """
+    Record statements run on `engine` (the sync_engine of an async engine)
+    into the current task's QueryProfile, and log slow ones.
+    """
+    slow_seconds = DB_SLOW_QUERY_MS / 1000 if DB_SLOW_QUERY_MS > 0 else None
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _current.get() is not None:
+            conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        profile = _current.get()
+        if profile is None or not conn.info.get("profile_started"):
+            return
+        seconds = time.perf_counter() - conn.info["profile_started"].pop()
+        shape = statement_shape(statement)
+        if slow_seconds is not None and seconds >= slow_seconds:
+            logger.warning("Slow query (%.1f ms): %s", seconds * 1000, shape)
+        profile.record(shape, seconds)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("profile_started"):
+            conn.info["profile_started"].pop()
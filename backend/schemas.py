@@ -21,6 +21,14 @@ class ContactResponse(BaseModel):
 class CareerApplicationResponse(BaseModel):
     detail: str
 
+class CareerPositionSearchResponse(BaseModel):
+    version: int
+    total: int
+    page: int
+    pageSize: int
+    positions: List[Dict[str, Any]]
+    facets: Dict[str, Dict[str, int]]
+
 class CareerApplicationAdmin(BaseModel):
     id: int
     full_name: str
@@ -49,8 +57,22 @@ class ContentVersionInfo(BaseModel):
 
 # ----- Media -----
 
+class MediaVariant(BaseModel):
+    id: int
+    url: str
+    mime_type: str
+    width: int
+    height: int
+    size_bytes: int
+
 class MediaUploadResponse(BaseModel):
     id: int
     kind: str
     url: Optional[str]
-    storage_path: str
\ No newline at end of file
+    storage_path: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    # Resized renditions of image uploads, plus ready-made srcset strings
+    # keyed by MIME type (for <picture><source type=... srcset=...>)
+    variants: List[MediaVariant] = []
+    srcset: Dict[str, str] = {}
\ No newline at end of file
@@ -0,0 +1,122 @@
+# backend/scripts/bench_concurrency.py
+#
+# Concurrent throughput benchmark for a running backend (needs `pip install httpx`).
+# Run it against a disposable environment: the upload phase creates applications.
+#
+#   python -m backend.scripts.bench_concurrency --base-url http://localhost:8000
+#
+# Phases:
+#   content  - GET /api/content only
+#   upload   - POST /api/careers/apply only
+#   mixed    - both at once; content p99 shows how much uploads stall the loop
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _report(
+    name: str,
+    latencies: List[float],
+    elapsed: float,
+    errors: int,
+    bytes_per_request: int = 0,
+) -> None:
+    count = len(latencies)
+    line = (
+        f"{name:<16} {count:>6} req  {count / elapsed:>9.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000 if latencies else 0:>8.2f} ms  "
+        f"p99 {_percentile(latencies, 99) * 1000:>8.2f} ms  errors {errors}"
+    )
+    if bytes_per_request:
+        line += f"  {count * bytes_per_request / (1024 * 1024) / elapsed:>7.1f} MB/s"
+    print(line)
+
+
+async def _drive(
+    total: int,
+    concurrency: int,
+    call: Callable[[int], Awaitable[httpx.Response]],
+) -> tuple[List[float], int]:
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                response = await call(i)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent throughput benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--uploads", type=int, default=50)
+    parser.add_argument("--upload-kb", type=int, default=2048)
+    args = parser.parse_args()
+
+    payload = b"%PDF-1.4\n" + b"0" * (args.upload_kb * 1024)
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=120) as client:
+
+        async def get_content(_: int) -> httpx.Response:
+            return await client.get("/api/content")
+
+        async def upload(i: int) -> httpx.Response:
+            return await client.post(
+                "/api/careers/apply",
+                data={
+                    "full_name": f"Bench {i}",
+                    "email": f"bench{i}@example.com",
+                    "position": "Benchmark",
+                },
+                files={"resume": (f"bench-{i}.pdf", payload, "application/pdf")},
+            )
+
+        await get_content(0)  # warm caches
+
+        start = time.perf_counter()
+        latencies, errors = await _drive(args.requests, args.concurrency, get_content)
+        _report("content", latencies, time.perf_counter() - start, errors)
+
+        start = time.perf_counter()
+        latencies, errors = await _drive(args.uploads, max(1, args.concurrency // 4), upload)
+        _report("upload", latencies, time.perf_counter() - start, errors, len(payload))
+
+        start = time.perf_counter()
+        (content_lat, content_err), (upload_lat, upload_err) = await asyncio.gather(
+            _drive(args.requests, args.concurrency, get_content),
+            _drive(args.uploads, max(1, args.concurrency // 4), upload),
+        )
+        elapsed = time.perf_counter() - start
+        _report("mixed/content", content_lat, elapsed, content_err)
+        _report("mixed/upload", upload_lat, elapsed, upload_err, len(payload))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+# backend/scripts/bench_metrics.py
+#
+# Overhead of the /metrics instrumentation (needs `pip install httpx`). Each
+# round starts two fresh interpreters, one with METRICS_ENABLED=true and one
+# with false, that serve the same requests in-process (/health and cached
+# /api/content reads, which include a DB query per request on the versions
+# endpoint). Rounds alternate which side runs first, and the overhead is the
+# median of the per-round on/off ratios, so machine drift cancels out.
+#
+#   python -m backend.scripts.bench_metrics --rounds 15 --requests 2000
+#   python -m backend.scripts.bench_metrics --max-overhead-pct 2
+#
+# Run it on a quiet machine: on a shared single vCPU, run-to-run noise is
+# larger than the budget and more rounds are needed.
+#
+# The database must already be migrated (python -m backend.scripts.migrate).
+# Exits 1 if the median overhead exceeds --max-overhead-pct.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CHILD = r"""
+import asyncio, json, sys, time
+import httpx
+from backend.app.main import create_app
+
+REQUESTS = int(sys.argv[1])
+PATHS = ["/health", "/api/content", "/api/content/hero", "/api/content/versions"]
+app = create_app()
+
+async def run():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in PATHS * 50:
+                await client.get(path)
+            started = time.perf_counter()
+            for i in range(REQUESTS):
+                response = await client.get(PATHS[i % len(PATHS)])
+                if response.status_code != 200:
+                    raise SystemExit(f"{response.request.url.path}: {response.status_code}")
+            return time.perf_counter() - started
+
+elapsed = asyncio.run(run())
+print(json.dumps({"per_request": elapsed / REQUESTS}))
+"""
+
+
+def _run_once(enabled: bool, requests: int) -> float:
+    env = {**os.environ, "METRICS_ENABLED": "true" if enabled else "false"}
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, str(requests)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit("Benchmark run failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])["per_request"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark metrics instrumentation overhead")
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run")
+    parser.add_argument("--max-overhead-pct", type=float, default=2.0, help="Budget (0 = none)")
+    args = parser.parse_args()
+
+    off: list[float] = []
+    on: list[float] = []
+    for i in range(max(1, args.rounds)):
+        # Alternate which side runs first
+        for enabled in ((False, True) if i % 2 == 0 else (True, False)):
+            (on if enabled else off).append(_run_once(enabled, args.requests))
+
+    off_median = statistics.median(off) * 1e6
+    on_median = statistics.median(on) * 1e6
+    overhead = (statistics.median(a / b for a, b in zip(on, off)) - 1) * 100
+
+    print(f"metrics off  median {off_median:>8.1f} us/request   ({', '.join(f'{s * 1e6:.1f}' for s in off)})")
+    print(f"metrics on   median {on_median:>8.1f} us/request   ({', '.join(f'{s * 1e6:.1f}' for s in on)})")
+    print(f"overhead     {overhead:+.2f}%")
+
+    if args.max_overhead_pct and overhead > args.max_overhead_pct:
+        print(f"FAIL: overhead {overhead:.2f}% > {args.max_overhead_pct:.1f}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
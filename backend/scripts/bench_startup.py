@@ -0,0 +1,125 @@
+# backend/scripts/bench_startup.py
+#
+# Worker startup benchmark (needs `pip install httpx`). Each run is a fresh
+# interpreter that imports the app, builds it with create_app(), runs the
+# lifespan startup and serves its first requests in-process, so the numbers
+# are what a new uvicorn worker pays before it can answer.
+#
+#   python -m backend.scripts.bench_startup --runs 5
+#   python -m backend.scripts.bench_startup --max-import-ms 1500 --max-first-request-ms 500
+#
+# The database must already be migrated (python -m backend.scripts.migrate).
+# Exits 1 if a median exceeds its --max-* budget, or if importing/building
+# the app or running its startup opened a database connection or created the
+# sync engine (the DB is first touched by the first /api/content request).
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = r"""
+import asyncio, json, time
+t0 = time.perf_counter()
+import backend.app.main as main
+t1 = time.perf_counter()
+app = main.create_app()
+t2 = time.perf_counter()
+
+import httpx
+from backend import database
+
+from sqlalchemy import event
+
+touched_db = (
+    database._sync_engine is not None
+    or database.async_engine.sync_engine.pool.checkedin() > 0
+    or database.async_engine.sync_engine.pool.checkedout() > 0
+)
+# Every connection checkout from here on, to catch DB work in the lifespan
+checkouts = []
+event.listen(database.async_engine.sync_engine, "checkout", lambda *args: checkouts.append(1))
+
+async def run():
+    global startup_touched_db
+    async with app.router.lifespan_context(app):
+        t3 = time.perf_counter()
+        startup_touched_db = bool(checkouts) or database._sync_engine is not None
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            health = await client.get("/health")
+            t4 = time.perf_counter()
+            content = await client.get("/api/content")
+            t5 = time.perf_counter()
+    return t3, t4, t5, health.status_code, content.status_code
+
+t3, t4, t5, health_status, content_status = asyncio.run(run())
+print(json.dumps({
+    "import": t1 - t0,
+    "create_app": t2 - t1,
+    "lifespan": t3 - t2,
+    "first_health": t4 - t3,
+    "first_content": t5 - t4,
+    "total": t5 - t0,
+    "touched_db": touched_db,
+    "startup_touched_db": startup_touched_db,
+    "status": [health_status, content_status],
+}))
+"""
+
+PHASES = ["import", "create_app", "lifespan", "first_health", "first_content", "total"]
+
+
+def _run_once() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit("Startup run failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark worker startup")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=0, help="Budget for the import (0 = none)")
+    parser.add_argument(
+        "--max-first-request-ms",
+        type=float,
+        default=0,
+        help="Budget for import through the first /api/content response (0 = none)",
+    )
+    args = parser.parse_args()
+
+    runs = [_run_once() for _ in range(max(1, args.runs))]
+    medians = {phase: statistics.median(r[phase] for r in runs) * 1000 for phase in PHASES}
+
+    for phase in PHASES:
+        samples = ", ".join(f"{r[phase] * 1000:.1f}" for r in runs)
+        print(f"{phase:<14} median {medians[phase]:>8.1f} ms   ({samples})")
+
+    failures = []
+    if any(r["touched_db"] for r in runs):
+        failures.append("importing or building the app touched the database")
+    if any(r["startup_touched_db"] for r in runs):
+        failures.append("lifespan startup touched the database (is MIGRATE_ON_STARTUP set?)")
+    if any(r["status"] != [200, 200] for r in runs):
+        failures.append(f"unexpected status codes: {[r['status'] for r in runs]}")
+    if args.max_import_ms and medians["import"] > args.max_import_ms:
+        failures.append(f"import {medians['import']:.1f} ms > {args.max_import_ms:.0f} ms")
+    if args.max_first_request_ms and medians["total"] > args.max_first_request_ms:
+        failures.append(f"first request {medians['total']:.1f} ms > {args.max_first_request_ms:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
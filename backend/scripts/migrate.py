@@ -0,0 +1,35 @@
+# backend/scripts/migrate.py
+#
+# Apply schema migrations and prepare storage; run once per deployment,
+# before starting the app (docker-compose runs it as the `migrate` service).
+#   python -m backend.scripts.migrate
+
+import asyncio
+import sys
+
+from backend.database import async_engine, get_sync_engine
+from backend.migrations import MigrationError, run_migrations
+from backend.storage import ensure_media_roots
+from backend.app.services.content_snapshot import ensure_snapshot
+
+
+async def _write_snapshot() -> None:
+    await ensure_snapshot()
+    await async_engine.dispose()
+
+
+def main() -> None:
+    try:
+        changes = run_migrations(get_sync_engine())
+    except MigrationError as exc:
+        print(f"Migration failed: {exc}")
+        sys.exit(1)
+    print(f"Schema up to date ({changes} change{'s' if changes != 1 else ''} applied).")
+
+    ensure_media_roots()
+    # First deploy: nginx serves the content document from this snapshot
+    asyncio.run(_write_snapshot())
+
+
+if __name__ == "__main__":
+    main()
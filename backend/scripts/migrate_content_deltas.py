@@ -0,0 +1,73 @@
+# backend/scripts/migrate_content_deltas.py
+#
+# Re-encode existing full content copies as deltas (the is_keyframe column
+# itself is added by `python -m backend.scripts.migrate`):
+#   python -m backend.scripts.migrate_content_deltas --compact
+
+import json
+import sys
+
+from backend.database import SessionLocal, engine
+from backend.migrations import add_content_keyframe_column
+from backend.models import ContentVersion
+from backend.settings import CONTENT_KEYFRAME_INTERVAL
+from backend.app.services.json_patch import apply_patch, make_patch
+
+
+def compact_history() -> None:
+    """
+    Rewrite existing full copies as deltas, keeping a keyframe every
+    CONTENT_KEYFRAME_INTERVAL versions.
+    """
+    db = SessionLocal()
+    try:
+        rows = db.query(ContentVersion).order_by(ContentVersion.version.asc()).all()
+        previous = None
+        last_keyframe = None
+        before = after = 0
+
+        for row in rows:
+            stored = json.loads(row.content_json)
+            before += len(row.content_json)
+            if row.is_keyframe is False:
+                doc = apply_patch(previous, stored)
+            else:
+                doc = stored
+
+            full = json.dumps(doc)
+            keyframe = (
+                previous is None
+                or last_keyframe is None
+                or row.version - last_keyframe >= CONTENT_KEYFRAME_INTERVAL
+            )
+            payload = full
+            if not keyframe:
+                delta = json.dumps(make_patch(previous, doc))
+                if len(delta) < len(full):
+                    payload = delta
+                else:
+                    keyframe = True
+
+            row.content_json = payload
+            row.is_keyframe = keyframe
+            if keyframe:
+                last_keyframe = row.version
+            after += len(payload)
+            previous = doc
+
+        db.commit()
+        print(f"Re-encoded {len(rows)} versions: {before} -> {after} bytes of content_json.")
+    finally:
+        db.close()
+
+
+def main() -> None:
+    for message in add_content_keyframe_column(engine):
+        print(message)
+
+    if "--compact" in sys.argv[1:]:
+        compact_history()
+
+
+if __name__ == "__main__":
+    main()
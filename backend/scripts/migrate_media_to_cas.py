@@ -0,0 +1,118 @@
+# backend/scripts/migrate_media_to_cas.py
+#
+# Move existing media files into the content-addressed layout
+# (blobs/ab/cd/<sha256><ext>) and build media_blobs reference counts.
+#
+#   python -m backend.scripts.migrate_media_to_cas            # dry run
+#   python -m backend.scripts.migrate_media_to_cas --apply
+#
+# Public files keep a hard link at their old path so URLs already embedded
+# in site content continue to resolve; private files are moved.
+#
+# The media_blobs table is created by `python -m backend.scripts.migrate`;
+# run that first.
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+from backend.database import SessionLocal
+from backend.models import MediaAsset, MediaBlob
+from backend.storage import blob_storage_path, media_root
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def main() -> None:
+    apply = "--apply" in sys.argv[1:]
+
+    db = SessionLocal()
+    moved = deduplicated = missing = 0
+    saved_bytes = 0
+    # (old file, blob file, is_public) to clean up after committing
+    retired = []
+    try:
+        blobs = {
+            (b.sha256_hash, b.is_public): b for b in db.query(MediaBlob).all()
+        }
+        assets = db.query(MediaAsset).order_by(MediaAsset.id.asc()).all()
+
+        for asset in assets:
+            if asset.storage_path.startswith("blobs/"):
+                continue
+            visibility = "public" if asset.is_public else "private"
+            root = media_root(visibility)
+            source = root / asset.storage_path
+            if not source.exists():
+                missing += 1
+                print(f"asset {asset.id}: missing on disk ({source})")
+                continue
+
+            sha256_hex = _sha256_file(source)
+            if asset.sha256_hash and asset.sha256_hash != sha256_hex:
+                print(f"asset {asset.id}: hash mismatch, skipped")
+                continue
+
+            target_path = blob_storage_path(sha256_hex, source.suffix.lower() or ".bin")
+            target = root / target_path
+            blob = blobs.get((sha256_hex, asset.is_public))
+
+            if blob is None:
+                moved += 1
+                blob = MediaBlob(
+                    sha256_hash=sha256_hex,
+                    is_public=asset.is_public,
+                    storage_path=target_path,
+                    size_bytes=source.stat().st_size,
+                    ref_count=0,
+                )
+                blobs[(sha256_hex, asset.is_public)] = blob
+                if apply:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    if not target.exists():
+                        os.link(source, target)
+                    db.add(blob)
+            else:
+                deduplicated += 1
+                saved_bytes += source.stat().st_size
+                target_path = blob.storage_path
+                target = root / target_path
+
+            print(f"asset {asset.id}: {asset.storage_path} -> {target_path}")
+            if not apply:
+                continue
+
+            blob.ref_count += 1
+            asset.storage_path = target_path
+            asset.sha256_hash = sha256_hex
+            retired.append((source, target, asset.is_public))
+
+        if apply:
+            db.commit()
+            # Old files go only once the rows pointing at the blobs are
+            # committed; a failed run leaves them in place
+            for source, target, is_public in retired:
+                if is_public:
+                    # Keep old URLs working without a second copy on disk
+                    if not os.path.samefile(source, target):
+                        source.unlink()
+                        os.link(target, source)
+                else:
+                    source.unlink(missing_ok=True)
+        print(
+            f"{'Migrated' if apply else 'Would migrate'}: {moved} new blobs, "
+            f"{deduplicated} duplicates ({saved_bytes} bytes reclaimable), {missing} missing."
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
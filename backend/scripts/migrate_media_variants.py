@@ -0,0 +1,66 @@
+# backend/scripts/migrate_media_variants.py
+#
+# Render variants for public images uploaded before responsive renditions
+# existed (the rendition columns are added by `python -m backend.scripts.migrate`).
+#   python -m backend.scripts.migrate_media_variants --backfill
+
+import sys
+
+from sqlalchemy import insert
+
+from backend.database import SessionLocal, engine
+from backend.imaging import render_variants
+from backend.migrations import add_media_variant_columns
+from backend.models import MediaAsset
+from backend.settings import MEDIA_IMAGE_FORMATS, MEDIA_IMAGE_QUALITY, MEDIA_IMAGE_WIDTHS
+from backend.storage import media_root
+from backend.app.services.image_variants import VARIANT_SOURCE_TYPES, variant_dir, variant_rows
+
+
+def backfill() -> None:
+    root = media_root("public")
+    db = SessionLocal()
+    try:
+        with_children = {
+            pid for (pid,) in db.query(MediaAsset.parent_id).filter(MediaAsset.parent_id.isnot(None))
+        }
+        parents = (
+            db.query(MediaAsset)
+            .filter(
+                MediaAsset.is_public.is_(True),
+                MediaAsset.parent_id.is_(None),
+                MediaAsset.mime_type.in_(VARIANT_SOURCE_TYPES),
+            )
+            .order_by(MediaAsset.id)
+            .all()
+        )
+        for parent in parents:
+            if parent.id in with_children:
+                continue
+            source = root / parent.storage_path
+            if not source.exists():
+                print(f"asset {parent.id}: missing on disk, skipped")
+                continue
+            rendered = render_variants(
+                str(source), str(root / variant_dir(parent.id)),
+                MEDIA_IMAGE_WIDTHS, MEDIA_IMAGE_FORMATS, MEDIA_IMAGE_QUALITY,
+            )
+            parent.width, parent.height = rendered["width"], rendered["height"]
+            rows = variant_rows(parent, rendered)
+            if rows:
+                db.execute(insert(MediaAsset).values(rows))
+            db.commit()
+            print(f"asset {parent.id}: {len(rendered['variants'])} variants")
+    finally:
+        db.close()
+
+
+def main() -> None:
+    for message in add_media_variant_columns(engine):
+        print(message)
+    if "--backfill" in sys.argv[1:]:
+        backfill()
+
+
+if __name__ == "__main__":
+    main()
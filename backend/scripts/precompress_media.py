@@ -0,0 +1,56 @@
+# backend/scripts/precompress_media.py
+#
+# Write .br / .gz siblings for every compressible file already under the
+# public media root (uploads and hand-placed static files such as SVGs).
+#   python -m backend.scripts.precompress_media           # missing siblings only
+#   python -m backend.scripts.precompress_media --force   # rewrite all
+
+import mimetypes
+import sys
+
+from backend.precompress import (
+    ENCODING_SUFFIXES,
+    available_encodings,
+    is_compressible,
+    sibling_path,
+    write_precompressed,
+)
+from backend.settings import PUBLIC_MEDIA_ROOT
+
+SKIP_SUFFIXES = set(ENCODING_SUFFIXES.values()) | {".tmp"}
+
+
+def main() -> None:
+    force = "--force" in sys.argv[1:]
+    encodings = available_encodings()
+    if not encodings:
+        print("No precompression encodings enabled (MEDIA_PRECOMPRESS_ENCODINGS).")
+        return
+
+    files = compressed = 0
+    original_bytes = saved_bytes = 0
+    for path in sorted(PUBLIC_MEDIA_ROOT.rglob("*")):
+        if not path.is_file() or path.suffix in SKIP_SUFFIXES:
+            continue
+        mime_type, _ = mimetypes.guess_type(path.name)
+        if not is_compressible(mime_type):
+            continue
+        files += 1
+        written = write_precompressed(path, force=force)
+        if not written:
+            continue
+        compressed += 1
+        size = path.stat().st_size
+        smallest = min(sibling_path(path, e).stat().st_size for e in written)
+        original_bytes += size
+        saved_bytes += size - smallest
+        print(f"{path.relative_to(PUBLIC_MEDIA_ROOT)}: {', '.join(written)} ({size} -> {smallest} bytes)")
+
+    print(
+        f"{compressed} of {files} compressible files have siblings "
+        f"({saved_bytes} of {original_bytes} bytes saved with the best encoding)."
+    )
+
+
+if __name__ == "__main__":
+    main()
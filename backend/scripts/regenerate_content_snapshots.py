@@ -0,0 +1,61 @@
+# backend/scripts/regenerate_content_snapshots.py
+#
+# Rebuild the static snapshot of the latest content version under
+# CONTENT_SNAPSHOT_DIR (e.g. after changing compression settings, or when
+# the directory was lost). --versions N also rewrites the N-1 versions
+# before it (up to CONTENT_SNAPSHOT_KEEP are kept on disk).
+#
+#   python -m backend.scripts.regenerate_content_snapshots [--versions 1]
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from backend.database import AsyncSessionLocal, async_engine
+from backend.models import ContentVersion
+from backend.app.services.content_cache import CachedContent, serialize_content
+from backend.app.services.content_service import load_version_content
+from backend.app.services.content_snapshot import (
+    current_snapshot_version,
+    publish_snapshot,
+    snapshot_root,
+    write_snapshot,
+)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild static content snapshots")
+    parser.add_argument("--versions", type=int, default=1, help="How many recent versions to write")
+    args = parser.parse_args()
+
+    root = snapshot_root()
+    if root is None:
+        print("Content snapshots are disabled (CONTENT_SNAPSHOT_DIR is empty).")
+        return
+
+    async with AsyncSessionLocal() as db:
+        latest = await publish_snapshot(db, force=True)
+        print(f"Wrote version {latest} to {root / 'versions' / str(latest)}")
+        for version in range(latest - 1, max(0, latest - args.versions), -1):
+            content = await load_version_content(db, version)
+            if content is None:
+                continue
+            cached = CachedContent(
+                version=version,
+                created_at=await db.scalar(
+                    select(ContentVersion.created_at).where(ContentVersion.version == version)
+                ),
+                content=content,
+                body=serialize_content(content),
+                sections={key: serialize_content(value) for key, value in content.items()},
+            )
+            await asyncio.to_thread(write_snapshot, root, cached)
+            print(f"Wrote version {version}")
+
+    print(f"current -> version {current_snapshot_version(root)}")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,37 @@
+# backend/scripts/scrub_media.py
+#
+# Re-verify every media asset's SHA-256 once and flag corrupt/missing files
+# in media_integrity_checks. Suitable for cron instead of the in-app scrubber;
+# skips the run if a worker (or another run) is already scrubbing.
+#
+#   python -m backend.scripts.scrub_media [--max-mb-per-second 20]
+
+import argparse
+import asyncio
+
+from backend.database import async_engine
+from backend.settings import MEDIA_SCRUB_MAX_BYTES_PER_SECOND
+from backend.app.services.integrity import scrub_lock, scrub_media_once
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify stored media hashes")
+    parser.add_argument(
+        "--max-mb-per-second",
+        type=float,
+        default=MEDIA_SCRUB_MAX_BYTES_PER_SECOND / (1024 * 1024),
+        help="I/O rate limit (0 = unlimited)",
+    )
+    args = parser.parse_args()
+
+    with scrub_lock() as acquired:
+        if not acquired:
+            print("Another scrubber is running; skipped.")
+            return
+        counts = await scrub_media_once(int(args.max_mb_per_second * 1024 * 1024))
+    print(f"Scrub finished: {counts['ok']} ok, {counts['corrupt']} corrupt, {counts['missing']} missing.")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
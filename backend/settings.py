@@ -10,10 +10,80 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL",
     f"sqlite:///{BASE_DIR / 'app.db'}",  # fallback for local dev
 )
+# Request handling uses the async driver; derived from DATABASE_URL
+# (psycopg2 -> asyncpg, pysqlite -> aiosqlite) unless set explicitly
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", "")
+
+# --- Connection pool (per worker process) ---
+# Each uvicorn worker holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections,
+# so keep WEB_CONCURRENCY x that below Postgres max_connections (see
+# GET /api/admin/db/pool). Requests wait up to DB_POOL_TIMEOUT seconds for a
+# connection. Connections are replaced after DB_POOL_RECYCLE seconds (-1 =
+# never); with a recycle shorter than the server's idle timeout,
+# DB_POOL_PRE_PING=false saves a round trip on every checkout.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# uvicorn's worker count (it reads the same variable), for pool sizing
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# --- Metrics ---
+# Per-route latency, in-flight requests, uploads, DB queries and cache
+# ratios at GET /metrics (Prometheus text format; not proxied by nginx)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# --- Query profiling (opt-in; dev/staging) ---
+# Counts and times the SQL each request runs, returns X-DB-Queries and
+# Server-Timing headers, and logs statements that repeat at least
+# DB_N_PLUS_ONE_THRESHOLD times in one request (likely N+1) and statements
+# slower than DB_SLOW_QUERY_MS (0 = off). Logged SQL has no bind values.
+DB_PROFILE_QUERIES = os.getenv("DB_PROFILE_QUERIES", "false").lower() in ("1", "true", "yes")
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "100"))
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "5"))
+
+# Schema changes are applied by `python -m backend.scripts.migrate`, once per
+# deployment. Set to true to run them at startup instead (local dev).
+MIGRATE_ON_STARTUP = os.getenv("MIGRATE_ON_STARTUP", "false").lower() in ("1", "true", "yes")
 
 # --- Admin key (zero-trust style gateway for write access) ---
 ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "changeme-admin-key")
 
+# --- HTTP caching for the public content document ---
+# max-age=0 keeps admins' publishes visible on the next load; browsers and
+# nginx revalidate with If-None-Match and usually get a body-less 304.
+CONTENT_CACHE_MAX_AGE = int(os.getenv("CONTENT_CACHE_MAX_AGE", "0"))
+CONTENT_STALE_WHILE_REVALIDATE = int(os.getenv("CONTENT_STALE_WHILE_REVALIDATE", "60"))
+
+# --- Response compression ---
+# JSON responses of at least MIN_BYTES are brotli/gzip-compressed for
+# clients that accept it ("" disables). Dynamic responses use fast levels;
+# the content document is compressed once per version, so it gets the best.
+RESPONSE_COMPRESSION_ENCODINGS = [
+    e.strip().lower() for e in os.getenv("RESPONSE_COMPRESSION_ENCODINGS", "br,gzip").split(",") if e.strip()
+]
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+RESPONSE_BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY", "5"))
+CONTENT_GZIP_LEVEL = int(os.getenv("CONTENT_GZIP_LEVEL", "9"))
+CONTENT_BROTLI_QUALITY = int(os.getenv("CONTENT_BROTLI_QUALITY", "11"))
+
+# --- Static content snapshots ---
+# Each publish writes the content document (and its sections) as static
+# JSON with .gz/.br siblings under this directory for nginx to serve
+# ("" disables); the newest KEEP versions are kept on disk.
+CONTENT_SNAPSHOT_DIR = os.getenv("CONTENT_SNAPSHOT_DIR", str(BASE_DIR / "content_snapshots"))
+CONTENT_SNAPSHOT_KEEP = int(os.getenv("CONTENT_SNAPSHOT_KEEP", "10"))
+
+# --- Content version storage ---
+# Versions are stored as JSON Patch deltas with a full keyframe every N versions
+CONTENT_KEYFRAME_INTERVAL = int(os.getenv("CONTENT_KEYFRAME_INTERVAL", "20"))
+# Number of reconstructed versions kept in memory
+CONTENT_RECONSTRUCTION_CACHE_SIZE = int(os.getenv("CONTENT_RECONSTRUCTION_CACHE_SIZE", "16"))
+# Rebuild attempts for writes without If-Match that lose a version race
+CONTENT_WRITE_RETRIES = int(os.getenv("CONTENT_WRITE_RETRIES", "3"))
+
 # --- CORS / frontend origins ---
 FRONTEND_ORIGINS = [
     "http://localhost:5173",
@@ -23,13 +93,68 @@ FRONTEND_ORIGINS = [
 ]
 
 # --- Media / file storage ---
+# Both roots are created at startup (storage.ensure_media_roots), not on import.
 # Keep using your existing uploads/ folder as private storage
 PRIVATE_MEDIA_ROOT = BASE_DIR / "uploads"
-PRIVATE_MEDIA_ROOT.mkdir(parents=True, exist_ok=True)
 
 # Public media root for hero images, icons, etc.
 PUBLIC_MEDIA_ROOT = BASE_DIR / "media_public"
-PUBLIC_MEDIA_ROOT.mkdir(parents=True, exist_ok=True)
+
+# Store uploads by SHA-256 (blobs/ab/cd/<sha256>) and deduplicate repeats
+MEDIA_CONTENT_ADDRESSED = os.getenv("MEDIA_CONTENT_ADDRESSED", "false").lower() in ("1", "true", "yes")
+
+# Integrity checks: verified-file cache size for downloads, and the
+# background scrubber (0 disables it; a lock file in the private media root
+# keeps it to one worker at a time)
+MEDIA_VERIFY_CACHE_SIZE = int(os.getenv("MEDIA_VERIFY_CACHE_SIZE", "4096"))
+MEDIA_SCRUB_INTERVAL_SECONDS = int(os.getenv("MEDIA_SCRUB_INTERVAL_SECONDS", "0"))
+MEDIA_SCRUB_MAX_BYTES_PER_SECOND = int(os.getenv("MEDIA_SCRUB_MAX_BYTES_PER_SECOND", str(20 * 1024 * 1024)))
+
+# Responsive images: public JPEG/PNG/WebP uploads get resized renditions at
+# these widths in these formats ("" disables), rendered in a process pool
+MEDIA_IMAGE_WIDTHS = [
+    int(w) for w in os.getenv("MEDIA_IMAGE_WIDTHS", "480,960,1440").split(",") if w.strip()
+]
+MEDIA_IMAGE_FORMATS = [
+    f.strip().lower() for f in os.getenv("MEDIA_IMAGE_FORMATS", "avif,webp,jpeg").split(",") if f.strip()
+]
+MEDIA_IMAGE_QUALITY = int(os.getenv("MEDIA_IMAGE_QUALITY", "80"))
+MEDIA_IMAGE_WORKERS = int(os.getenv("MEDIA_IMAGE_WORKERS", "2"))
+
+# Precompressed .br/.gz siblings for compressible public uploads
+# ("" disables); files smaller than MIN_BYTES are left alone
+MEDIA_PRECOMPRESS_ENCODINGS = [
+    e.strip().lower() for e in os.getenv("MEDIA_PRECOMPRESS_ENCODINGS", "br,gzip").split(",") if e.strip()
+]
+MEDIA_PRECOMPRESS_MIN_BYTES = int(os.getenv("MEDIA_PRECOMPRESS_MIN_BYTES", "1024"))
+
+# Upload pipeline: read size per chunk, worker threads for hashing/disk
+# writes, and fsync policy ("never", "file", or "full" = file + directory)
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+UPLOAD_IO_THREADS = int(os.getenv("UPLOAD_IO_THREADS", "4"))
+UPLOAD_FSYNC = os.getenv("UPLOAD_FSYNC", "never")
+
+# Internal nginx location mapped to PRIVATE_MEDIA_ROOT (e.g. "/_private_media/").
+# When set, private downloads are handed to nginx via X-Accel-Redirect.
+PRIVATE_MEDIA_ACCEL_PREFIX = os.getenv("PRIVATE_MEDIA_ACCEL_PREFIX", "")
+
+# Download audits are buffered and written in batches of up to
+# DOWNLOAD_AUDIT_BATCH_SIZE rows, at least every FLUSH_SECONDS. Rows that
+# cannot be written at shutdown go to the spill file ("" disables it) and
+# are replayed on the next start.
+DOWNLOAD_AUDIT_BATCH_SIZE = int(os.getenv("DOWNLOAD_AUDIT_BATCH_SIZE", "200"))
+DOWNLOAD_AUDIT_FLUSH_SECONDS = float(os.getenv("DOWNLOAD_AUDIT_FLUSH_SECONDS", "1.0"))
+DOWNLOAD_AUDIT_QUEUE_SIZE = int(os.getenv("DOWNLOAD_AUDIT_QUEUE_SIZE", "10000"))
+DOWNLOAD_AUDIT_SPILL_PATH = os.getenv(
+    "DOWNLOAD_AUDIT_SPILL_PATH", str(BASE_DIR / "download_audits.spill.ndjson")
+)
+
+# Admin applications listing: default and maximum rows per page
+ADMIN_APPLICATIONS_PAGE_SIZE = int(os.getenv("ADMIN_APPLICATIONS_PAGE_SIZE", "50"))
+ADMIN_APPLICATIONS_MAX_PAGE_SIZE = int(os.getenv("ADMIN_APPLICATIONS_MAX_PAGE_SIZE", "500"))
+
+# Most resumes one ZIP bundle may contain
+RESUME_BUNDLE_MAX_FILES = int(os.getenv("RESUME_BUNDLE_MAX_FILES", "2000"))
 
 # URL prefix for static public files (we mount this in main.py)
 PUBLIC_MEDIA_BASE_URL = "/media"
\ No newline at end of file
@@ -1,15 +1,36 @@
+import asyncio
+import logging
 import os
 import secrets
 import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Tuple
+from typing import Literal, Optional, Tuple
 
 from fastapi import UploadFile
 
-from .settings import PUBLIC_MEDIA_ROOT, PRIVATE_MEDIA_ROOT, PUBLIC_MEDIA_BASE_URL
+from .metrics import UPLOAD_BYTES, UPLOAD_DURATION
+from .precompress import is_compressible, remove_precompressed, write_precompressed
+from .settings import (
+    MEDIA_CONTENT_ADDRESSED,
+    PUBLIC_MEDIA_ROOT,
+    PRIVATE_MEDIA_ROOT,
+    PUBLIC_MEDIA_BASE_URL,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_FSYNC,
+    UPLOAD_IO_THREADS,
+)
+
+logger = logging.getLogger(__name__)
 
 StorageVisibility = Literal["public", "private"]
 
+# Directory (under each media root) holding content-addressed blobs
+BLOB_DIR = "blobs"
+
 
 def _safe_ext(filename: str) -> str:
     _, ext = os.path.splitext(filename)
@@ -22,57 +43,267 @@ def _safe_ext(filename: str) -> str:
     return ext or ".bin"
 
 
-def _write_and_hash(src_file, dest: Path) -> tuple[int, str]:
+# Dedicated pool so large uploads cannot starve the default executor
+_io_pool = ThreadPoolExecutor(
+    max_workers=max(2, UPLOAD_IO_THREADS),
+    thread_name_prefix="upload-io",
+)
+
+
+@dataclass
+class UploadStats:
+    size_bytes: int
+    seconds: float
+
+    @property
+    def mb_per_second(self) -> float:
+        return (self.size_bytes / (1024 * 1024)) / self.seconds if self.seconds else 0.0
+
+
+class UploadMetrics:
     """
-    Copy bytes from src_file → dest and compute size + SHA256.
-    src_file must be a binary file-like object.
+    Running totals for uploads handled by this worker.
     """
-    hasher = hashlib.sha256()
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def record(self, stats: UploadStats) -> None:
+        with self._lock:
+            self.count += 1
+            self.bytes += stats.size_bytes
+            self.seconds += stats.seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "count": self.count,
+                "bytes": self.bytes,
+                "seconds": self.seconds,
+            }
+
+
+upload_metrics = UploadMetrics()
+
+
+def _fsync(out, dest: Path) -> None:
+    if UPLOAD_FSYNC in ("file", "full"):
+        out.flush()
+        os.fsync(out.fileno())
+    if UPLOAD_FSYNC == "full":
+        dir_fd = os.open(dest.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+async def _stream_upload(file: UploadFile, dest: Optional[Path], hasher=None) -> int:
+    """
+    Stream an upload into dest (if given) and/or a hasher without blocking
+    the event loop. Returns the number of bytes read.
+
+    Pipelined: while chunk N is hashed and written (in parallel, on the
+    I/O pool; hashlib and file writes release the GIL), chunk N+1 is
+    already being read from the request body.
+    """
+    loop = asyncio.get_running_loop()
     size = 0
 
-    with dest.open("wb") as out:
+    out = await loop.run_in_executor(_io_pool, dest.open, "wb") if dest else None
+    pending: Optional[asyncio.Future] = None
+    try:
         while True:
-            chunk = src_file.read(1024 * 1024)
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if pending is not None:
+                await pending
+                pending = None
             if not chunk:
                 break
             size += len(chunk)
-            hasher.update(chunk)
-            out.write(chunk)
+            steps = []
+            if hasher is not None:
+                steps.append(loop.run_in_executor(_io_pool, hasher.update, chunk))
+            if out is not None:
+                steps.append(loop.run_in_executor(_io_pool, out.write, chunk))
+            pending = asyncio.gather(*steps)
+        if out is not None:
+            await loop.run_in_executor(_io_pool, _fsync, out, dest)
+    except BaseException:
+        if pending is not None:
+            await asyncio.gather(pending, return_exceptions=True)
+        if out is not None:
+            await loop.run_in_executor(_io_pool, out.close)
+            dest.unlink(missing_ok=True)
+        raise
+    if out is not None:
+        await loop.run_in_executor(_io_pool, out.close)
+
+    return size
 
+
+async def _write_and_hash(file: UploadFile, dest: Path) -> tuple[int, str]:
+    """
+    Copy bytes from the upload → dest and compute size + SHA256.
+    """
+    hasher = hashlib.sha256()
+    size = await _stream_upload(file, dest, hasher)
     return size, hasher.hexdigest()
 
 
+def blob_storage_path(sha256_hex: str, ext: str) -> str:
+    """
+    Content-addressed location of a blob, relative to its media root:
+    blobs/ab/cd/<sha256><ext>. The extension is kept so StaticFiles can
+    still infer the content type of public blobs. MediaBlob.storage_path
+    records the first upload's path, and later uploads of the same bytes
+    under another extension reuse it (see app.services.media_service).
+    """
+    return f"{BLOB_DIR}/{sha256_hex[:2]}/{sha256_hex[2:4]}/{sha256_hex}{ext}"
+
+
+def media_root(visibility: StorageVisibility) -> Path:
+    return PUBLIC_MEDIA_ROOT if visibility == "public" else PRIVATE_MEDIA_ROOT
+
+
+def ensure_media_roots() -> None:
+    """
+    Create the public and private media roots (app startup and migrations).
+    """
+    for root in (PUBLIC_MEDIA_ROOT, PRIVATE_MEDIA_ROOT):
+        root.mkdir(parents=True, exist_ok=True)
+
+
+def _public_url(visibility: StorageVisibility, storage_path: str) -> str:
+    return f"{PUBLIC_MEDIA_BASE_URL}/{storage_path}" if visibility == "public" else ""
+
+
+async def _save_content_addressed(
+    file: UploadFile,
+    visibility: StorageVisibility,
+    ext: str,
+) -> Tuple[str, str, int, str, bool]:
+    """
+    Hash the (already spooled) upload first; only write it if no blob with
+    that hash exists yet. Returns the save_file_local tuple plus whether
+    the blob was new.
+    """
+    loop = asyncio.get_running_loop()
+    root = media_root(visibility)
+
+    hasher = hashlib.sha256()
+    size_bytes = await _stream_upload(file, None, hasher)
+    sha256_hex = hasher.hexdigest()
+
+    storage_path = blob_storage_path(sha256_hex, ext)
+    dest = root / storage_path
+    created = not await loop.run_in_executor(_io_pool, dest.exists)
+    if created:
+        await _write_blob(file, dest)
+
+    return storage_path, _public_url(visibility, storage_path), size_bytes, sha256_hex, created
+
+
+async def _write_blob(file: UploadFile, dest: Path) -> None:
+    loop = asyncio.get_running_loop()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.parent / f".{secrets.token_hex(8)}.tmp"
+    await file.seek(0)
+    await _stream_upload(file, tmp)
+    # Atomic: a concurrent upload of the same bytes just replaces it
+    await loop.run_in_executor(_io_pool, os.replace, tmp, dest)
+    await file.seek(0)
+
+
+async def restore_blob_file(
+    file: UploadFile,
+    storage_path: str,
+    visibility: StorageVisibility,
+) -> bool:
+    """
+    Re-write a content-addressed blob from its upload if it is missing.
+    Call once the upload's blob reference has committed: an upload that
+    found the file already there skipped writing it, and a delete dropping
+    the blob's last reference at the same time may have unlinked it since.
+    Returns True if the file had to be restored.
+    """
+    if not storage_path.startswith(f"{BLOB_DIR}/"):
+        return False
+    loop = asyncio.get_running_loop()
+    dest = media_root(visibility) / storage_path
+    if await loop.run_in_executor(_io_pool, dest.exists):
+        return False
+    await _write_blob(file, dest)
+    if visibility == "public" and is_compressible(file.content_type):
+        await loop.run_in_executor(_io_pool, write_precompressed, dest)
+    logger.warning("Restored %s blob %s removed by a concurrent delete", visibility, storage_path)
+    return True
+
+
 async def save_file_local(
     file: UploadFile,
     *,
     visibility: StorageVisibility,
     kind: str,
+    content_addressed: bool = MEDIA_CONTENT_ADDRESSED,
 ) -> Tuple[str, str, int, str]:
     """
     Save file to local storage.
     Returns (storage_path, public_url, size_bytes, sha256_hex).
+
+    With content_addressed, files live under blobs/ab/cd/<sha256><ext>
+    shared by every asset with the same bytes; callers must track
+    references (see app.services.media_service).
     """
     ext = _safe_ext(file.filename or "")
-    token = secrets.token_hex(16)
-    filename = f"{token}{ext}"
 
-    if visibility == "public":
-        base_dir: Path = PUBLIC_MEDIA_ROOT / kind
-        base_dir.mkdir(parents=True, exist_ok=True)
-        dest = base_dir / filename
-        storage_path = f"{kind}/{filename}"
-        public_url = f"{PUBLIC_MEDIA_BASE_URL}/{storage_path}"
+    # Make sure we're at the start of the upload stream
+    await file.seek(0)
+    started = time.perf_counter()
+
+    if content_addressed:
+        storage_path, public_url, size_bytes, sha256_hex, created = (
+            await _save_content_addressed(file, visibility, ext)
+        )
     else:
-        base_dir = PRIVATE_MEDIA_ROOT / kind
+        token = secrets.token_hex(16)
+        filename = f"{token}{ext}"
+        base_dir: Path = media_root(visibility) / kind
         base_dir.mkdir(parents=True, exist_ok=True)
         dest = base_dir / filename
         storage_path = f"{kind}/{filename}"
-        public_url = ""
+        public_url = _public_url(visibility, storage_path)
+        size_bytes, sha256_hex = await _write_and_hash(file, dest)
+        created = True
 
-    # Make sure we're at the start of the upload stream
-    await file.seek(0)
-    size_bytes, sha256_hex = _write_and_hash(file.file, dest)
+    if visibility == "public" and is_compressible(file.content_type):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            _io_pool, write_precompressed, media_root(visibility) / storage_path
+        )
+
+    stats = UploadStats(size_bytes=size_bytes, seconds=time.perf_counter() - started)
+    upload_metrics.record(stats)
+    UPLOAD_BYTES.observe(size_bytes, visibility)
+    UPLOAD_DURATION.observe(stats.seconds, visibility)
+    logger.info(
+        "Stored %s upload %s: %d bytes in %.3fs (%.1f MB/s)%s",
+        visibility, storage_path, size_bytes, stats.seconds, stats.mb_per_second,
+        "" if created else " (deduplicated)",
+    )
     # Reset again if caller wants to re-read
     await file.seek(0)
 
-    return storage_path, public_url, size_bytes, sha256_hex
\ No newline at end of file
+    return storage_path, public_url, size_bytes, sha256_hex
+
+
+def delete_stored_file(storage_path: str, visibility: StorageVisibility) -> None:
+    """
+    Remove a stored file (or blob) from disk, if it is still there.
+    """
+    path = media_root(visibility) / storage_path
+    path.unlink(missing_ok=True)
+    remove_precompressed(path)
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from backend.app.services.json_patch import apply_patch, json_equal, make_patch
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1, "b": [0]}, {"a": True, "b": [False]}),
+        ({"a": True}, {"a": 1}),
+        ({"a": 1}, {"a": 1.0}),
+        ({"a": [1, 2, 3]}, {"a": [1, 2.0, 3]}),
+        ({"a": {"b": 0}}, {"a": {"b": False}}),
+        ([0, 1], [False, True]),
+    ],
+)
+def test_round_trip_keeps_types(old, new):
+    patch = make_patch(old, new)
+    assert patch
+    result = apply_patch(old, patch)
+    assert json_equal(result, new)
+    # What is stored is the JSON text, so that has to match too
+    assert json.dumps(result) == json.dumps(new)
+
+
+def test_unchanged_document_gives_empty_patch():
+    doc = {"a": 1, "b": [True, 1.5, {"c": None}]}
+    assert make_patch(doc, json.loads(json.dumps(doc))) == []
+
+
+def test_in_place_reuses_document():
+    doc = {"a": [1]}
+    assert apply_patch(doc, [{"op": "add", "path": "/a/-", "value": 2}], in_place=True) is doc
+    assert doc == {"a": [1, 2]}
+
+    original = {"a": [1]}
+    apply_patch(original, [{"op": "add", "path": "/a/-", "value": 2}])
+    assert original == {"a": [1]}
@@ -17,19 +17,61 @@ function getAdminApiKey(): string {
   return key;
 }
 
+export interface AdminApplicationPage {
+  items: AdminApplication[];
+  next_cursor: string | null;
+}
+
 /**
- * Fetch career applications (optionally filtered by role).
+ * Fetch one page of career applications, newest first (optionally filtered
+ * by role). Pass the previous page's next_cursor to continue.
  */
-export async function fetchAdminApplications(roleFilter?: string) {
+export async function fetchAdminApplications(
+  roleFilter?: string,
+  cursor?: string | null
+) {
   const apiKey = getAdminApiKey();
   if (!apiKey) {
     throw new Error("Missing admin API key; please log in again.");
   }
 
-  const res = await apiClient.get<AdminApplication[]>(
+  const params: Record<string, string> = {};
+  if (roleFilter) params.role = roleFilter;
+  if (cursor) params.cursor = cursor;
+
+  const res = await apiClient.get<AdminApplicationPage>(
     "/api/admin/applications",
     {
-      params: roleFilter ? { role: roleFilter } : {},
+      params,
+      headers: {
+        "X-API-Key": apiKey,
+      },
+    }
+  );
+
+  return res.data;
+}
+
+export interface AdminApplicationSearchResult {
+  total: number;
+  page: number;
+  page_size: number;
+  items: (AdminApplication & { rank: number })[];
+}
+
+/**
+ * Relevance-ranked search over name, email, position and message.
+ */
+export async function searchAdminApplications(query: string, page = 1) {
+  const apiKey = getAdminApiKey();
+  if (!apiKey) {
+    throw new Error("Missing admin API key; please log in again.");
+  }
+
+  const res = await apiClient.get<AdminApplicationSearchResult>(
+    "/api/admin/applications/search",
+    {
+      params: { q: query, page },
       headers: {
         "X-API-Key": apiKey,
       },
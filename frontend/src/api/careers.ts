@@ -1,6 +1,7 @@
 // src/api/careers.ts
 
 import { apiClient } from "./client";
+import type { CareerPosition } from "./content";
 
 export interface CareerApplicationPayload {
   fullName: string;
@@ -41,4 +42,38 @@ export async function submitApplication(payload: CareerApplicationPayload) {
 
     throw new Error(error.message || "Failed to submit application");
   }
-}
\ No newline at end of file
+}
+
+export interface PositionSearchParams {
+  q?: string;
+  team?: string[];
+  // Matched case-insensitively, so older spellings like "on-site" work too
+  workMode?: string[];
+  level?: string[];
+  tags?: string[];
+  page?: number;
+  pageSize?: number;
+}
+
+export interface PositionSearchResult {
+  version: number;
+  total: number;
+  page: number;
+  pageSize: number;
+  positions: CareerPosition[];
+  facets: Record<"team" | "workMode" | "level" | "tags", Record<string, number>>;
+}
+
+export async function searchPositions(
+  params: PositionSearchParams = {}
+): Promise<PositionSearchResult> {
+  const res = await apiClient.get<PositionSearchResult>(
+    "/api/careers/positions",
+    {
+      params,
+      // team=a&team=b rather than team[]=a&team[]=b
+      paramsSerializer: { indexes: null },
+    }
+  );
+  return res.data;
+}
@@ -93,6 +93,17 @@ export async function fetchContent(): Promise<SiteContent> {
   return res.data;
 }
 
+// Fetch a single section (e.g. just the hero) without pulling the careers catalogue.
+export async function fetchContentSection<K extends keyof SiteContent>(
+  section: K,
+  fields?: string[]
+): Promise<SiteContent[K]> {
+  const res = await apiClient.get<SiteContent[K]>(`/api/content/${section}`, {
+    params: fields?.length ? { fields: fields.join(",") } : undefined,
+  });
+  return res.data;
+}
+
 export async function updateContent(
   newContent: SiteContent,
   apiKey: string
@@ -107,4 +118,54 @@ export async function updateContent(
     }
   );
   return res.data;
-}
\ No newline at end of file
+}
+
+function isPlainObject(value: unknown): value is Record<string, unknown> {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+// RFC 7386 merge patch turning `original` into `updated`: only changed keys,
+// objects diffed recursively, arrays and other values replaced whole, removed
+// keys set to null. Empty when nothing changed.
+export function contentMergePatch(
+  original: object,
+  updated: object
+): Record<string, unknown> {
+  const before = original as Record<string, unknown>;
+  const after = updated as Record<string, unknown>;
+  const patch: Record<string, unknown> = {};
+  for (const key of Object.keys(before)) {
+    if (before[key] !== undefined && after[key] === undefined) {
+      patch[key] = null;
+    }
+  }
+  for (const [key, value] of Object.entries(after)) {
+    if (value === undefined) continue;
+    const previous = before[key];
+    if (isPlainObject(previous) && isPlainObject(value)) {
+      const nested = contentMergePatch(previous, value);
+      if (Object.keys(nested).length > 0) patch[key] = nested;
+    } else if (JSON.stringify(previous) !== JSON.stringify(value)) {
+      patch[key] = value;
+    }
+  }
+  return patch;
+}
+
+// Partial update applied server-side to the latest version (RFC 7386 merge patch).
+export async function patchContent(
+  mergePatch: Record<string, unknown>,
+  apiKey: string
+): Promise<{ detail: string; version: number }> {
+  const res = await apiClient.patch<{ detail: string; version: number }>(
+    "/api/content",
+    mergePatch,
+    {
+      headers: {
+        "X-API-Key": apiKey,
+        "Content-Type": "application/merge-patch+json",
+      },
+    }
+  );
+  return res.data;
+}
@@ -3,7 +3,7 @@ import { useContent } from "../contexts/ContentContext";
 import type { HomeLayoutVariant } from "../types/content";
 
 export default function Footer() {
-  const { content } = useContent();
+  const { content } = useContent(["hero"]);
 
   const layoutVariant = (content?.hero as any)
     ?.layoutVariant as HomeLayoutVariant | undefined;
@@ -11,7 +11,7 @@ interface LayoutProps {
 }
 
 export default function Layout({ children, noContainer }: LayoutProps) {
-  const { content } = useContent();
+  const { content } = useContent(["hero"]);
 
   const layoutVariant = (content?.hero as any)?.layoutVariant as
     | HomeLayoutVariant
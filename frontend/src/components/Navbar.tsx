@@ -56,7 +56,7 @@ export default function Navbar() {
   const location = useLocation();
   const isHome = location.pathname === "/";
 
-  const { content } = useContent();
+  const { content } = useContent(["hero"]);
   const layoutVariant = (content?.hero as any)
     ?.layoutVariant as HomeLayoutVariant | undefined;
 
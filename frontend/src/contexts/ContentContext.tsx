@@ -1,19 +1,41 @@
 // src/contexts/ContentContext.tsx
 import {
   createContext,
+  useCallback,
   useContext,
   useEffect,
+  useMemo,
+  useRef,
   useState,
   type ReactNode,
 } from "react";
 
-import { fetchContent, type SiteContent, type CareerPosition } from "../api/content";
+import {
+  fetchContent,
+  fetchContentSection,
+  type SiteContent,
+  type CareerPosition,
+} from "../api/content";
+
+export type ContentSection = keyof SiteContent;
+
+const ALL_SECTIONS: ContentSection[] = [
+  "hero",
+  "about",
+  "services",
+  "careers",
+  "contact",
+];
 
 export interface ContentContextValue {
   content: SiteContent | null;
   loading: boolean;
   error: string | null;
   reload: () => void;
+  // Set by ContentProvider, which fetches sections on demand. Providers that
+  // already hold the whole document (e.g. the admin preview) leave them out.
+  requireSections?: (sections: ContentSection[]) => void;
+  isSectionLoaded?: (section: ContentSection) => boolean;
 }
 
 export const ContentContext = createContext<ContentContextValue | undefined>(
@@ -183,43 +205,113 @@ function normalizeContent(raw: any): SiteContent {
 }
 
 export const ContentProvider = ({ children }: { children: ReactNode }) => {
-  const [content, setContent] = useState<SiteContent | null>(null);
-  const [loading, setLoading] = useState(true);
+  // Raw sections as the backend sent them; missing ones are filled from
+  // FALLBACK_CONTENT by normalizeContent
+  const [raw, setRaw] = useState<Partial<Record<ContentSection, unknown>>>({});
+  // Sections whose fetch has finished, successfully or not
+  const [settled, setSettled] = useState<Partial<Record<ContentSection, true>>>({});
+  const [reloading, setReloading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const requested = useRef(new Set<ContentSection>());
 
-  const load = () => {
-    setLoading(true);
-    setError(null);
-    fetchContent()
-      .then((data) => {
-        setContent(normalizeContent(data));
-      })
-      .catch((err: any) => {
-        setError(err?.message || "Failed to load content");
-        setContent(FALLBACK_CONTENT);
-      })
-      .finally(() => {
-        setLoading(false);
+  const fetchSections = useCallback((sections: ContentSection[]) => {
+    const settle = (keys: ContentSection[]) =>
+      setSettled((prev) => {
+        const next = { ...prev };
+        keys.forEach((key) => (next[key] = true));
+        return next;
       });
-  };
+    const fail = (keys: ContentSection[], err: any) => {
+      setError(err?.message || "Failed to load content");
+      settle(keys);
+    };
 
-  useEffect(() => {
-    load();
+    // Admin screens want everything: one request for the whole document.
+    // Public pages fetch just their sections (served from the static
+    // snapshots), so e.g. the home page never downloads the careers list.
+    if (sections.length === ALL_SECTIONS.length) {
+      return fetchContent()
+        .then((data) => {
+          setRaw({ ...data });
+          settle(ALL_SECTIONS);
+        })
+        .catch((err: any) => fail(ALL_SECTIONS, err));
+    }
+    return Promise.all(
+      sections.map((section) =>
+        fetchContentSection(section)
+          .then((data) => {
+            setRaw((prev) => ({ ...prev, [section]: data }));
+            settle([section]);
+          })
+          .catch((err: any) => fail([section], err))
+      )
+    ).then(() => undefined);
   }, []);
 
+  const requireSections = useCallback(
+    (sections: ContentSection[]) => {
+      const missing = sections.filter((s) => !requested.current.has(s));
+      if (missing.length === 0) return;
+      missing.forEach((s) => requested.current.add(s));
+      fetchSections(missing);
+    },
+    [fetchSections]
+  );
+
+  // Refetch every section loaded so far
+  const reload = useCallback(() => {
+    const sections = ALL_SECTIONS.filter((s) => requested.current.has(s));
+    if (sections.length === 0) return;
+    setReloading(true);
+    setError(null);
+    fetchSections(sections).finally(() => setReloading(false));
+  }, [fetchSections]);
+
+  const isSectionLoaded = useCallback(
+    (section: ContentSection) => settled[section] === true,
+    [settled]
+  );
+
+  const content = useMemo(() => normalizeContent(raw), [raw]);
+
   return (
     <ContentContext.Provider
-      value={{ content, loading, error, reload: load }}
+      value={{
+        content,
+        loading: reloading,
+        error,
+        reload,
+        requireSections,
+        isSectionLoaded,
+      }}
     >
       {children}
     </ContentContext.Provider>
   );
 };
 
-export const useContent = () => {
+/**
+ * Site content for the sections a component renders. `content` stays null
+ * until all of them have loaded; with no argument the whole document is
+ * loaded (admin screens edit and save all of it).
+ */
+export const useContent = (sections: ContentSection[] = ALL_SECTIONS) => {
   const ctx = useContext(ContentContext);
   if (!ctx) {
     throw new Error("useContent must be used within a ContentProvider");
   }
-  return ctx;
-};
\ No newline at end of file
+  const { requireSections, isSectionLoaded } = ctx;
+  const key = sections.join(",");
+
+  useEffect(() => {
+    requireSections?.(key.split(",") as ContentSection[]);
+  }, [requireSections, key]);
+
+  const ready = !isSectionLoaded || sections.every(isSectionLoaded);
+  return {
+    ...ctx,
+    content: ready ? ctx.content : null,
+    loading: ctx.loading || !ready,
+  };
+};
@@ -7,7 +7,7 @@ const BUSINESS_TAGLINE =
 const BUSINESS_ORIGIN = `${BUSINESS_NAME} was founded on the belief that great outcomes come from a blend of expertise, integrity, and hands-on service.`;
 
 export default function AboutPage() {
-  const { content, loading, error } = useContent();
+  const { content, loading, error } = useContent(["about"]);
 
   if (loading && !content) {
     return (
@@ -4,7 +4,7 @@ import { useContent } from "../contexts/ContentContext";
 import { submitContactForm } from "../api/contact";
 
 export default function ContactPage() {
-  const { content, loading, error } = useContent();
+  const { content, loading, error } = useContent(["contact"]);
 
   const [name, setName] = useState("");
   const [email, setEmail] = useState("");
@@ -4,11 +4,14 @@ import HomeShowcaseLayout from "../components/home/showcase/HomeShowcaseLayout";
 import RiverHomeLayout from "../components/home/RiverHomeLayout";
 import SleekHomeLayout from "../components/home/SleekHomeLayout";
 import StudioHomeLayout from "../components/home/StudioHomeLayout";
-import { useContent } from "../contexts/ContentContext";
+import { useContent, type ContentSection } from "../contexts/ContentContext";
 import type { HeroContent, ServiceItem } from "../types/content";
 
+// Everything the layouts render; the careers list stays on the careers page
+const HOME_SECTIONS: ContentSection[] = ["hero", "about", "services", "contact"];
+
 export default function HomePage() {
-  const { content, loading, error } = useContent();
+  const { content, loading, error } = useContent(HOME_SECTIONS);
 
   if (loading && !content) {
     return (
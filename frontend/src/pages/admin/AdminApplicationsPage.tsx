@@ -3,6 +3,7 @@ import { useEffect, useState } from "react";
 import type { AdminApplication } from "../../api/adminApplications";
 import {
   fetchAdminApplications,
+  searchAdminApplications,
   downloadResume,
 } from "../../api/adminApplications";
 
@@ -11,13 +12,30 @@ export default function AdminApplicationsPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [roleFilter, setRoleFilter] = useState("");
+  const [searchQuery, setSearchQuery] = useState("");
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [searchPage, setSearchPage] = useState<number | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const load = () => {
     setLoading(true);
     setError(null);
 
-    fetchAdminApplications(roleFilter)
-      .then(setData)
+    const request = searchQuery.trim()
+      ? searchAdminApplications(searchQuery.trim()).then((result) => {
+          setData(result.items);
+          setNextCursor(null);
+          setSearchPage(
+            result.page * result.page_size < result.total ? result.page + 1 : null
+          );
+        })
+      : fetchAdminApplications(roleFilter).then((page) => {
+          setData(page.items);
+          setNextCursor(page.next_cursor);
+          setSearchPage(null);
+        });
+
+    request
       .catch((err: any) => {
         const msg =
           err?.response?.data?.detail ||
@@ -33,6 +51,33 @@ export default function AdminApplicationsPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []); // initial load
 
+  const loadMore = () => {
+    if (!nextCursor && !searchPage) return;
+    setLoadingMore(true);
+
+    const request = searchPage
+      ? searchAdminApplications(searchQuery.trim(), searchPage).then((result) => {
+          setData((prev) => [...prev, ...result.items]);
+          setSearchPage(
+            result.page * result.page_size < result.total ? result.page + 1 : null
+          );
+        })
+      : fetchAdminApplications(roleFilter, nextCursor).then((page) => {
+          setData((prev) => [...prev, ...page.items]);
+          setNextCursor(page.next_cursor);
+        });
+
+    request
+      .catch((err: any) => {
+        const msg =
+          err?.response?.data?.detail ||
+          err?.message ||
+          "Failed to load applications";
+        setError(msg);
+      })
+      .finally(() => setLoadingMore(false));
+  };
+
   const handleDownload = async (resumeFileId: number) => {
     try {
       await downloadResume(resumeFileId);
@@ -58,6 +103,12 @@ export default function AdminApplicationsPage() {
           </p>
         </div>
         <div className="flex items-center gap-2">
+          <input
+            className="rounded-md border border-slate-300 bg-white px-2 py-1 text-xs text-slate-900 dark:border-slate-700 dark:bg-slate-900 dark:text-slate-100"
+            placeholder="Search name, email, message…"
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+          />
           <input
             className="rounded-md border border-slate-300 bg-white px-2 py-1 text-xs text-slate-900 dark:border-slate-700 dark:bg-slate-900 dark:text-slate-100"
             placeholder="Filter by role…"
@@ -132,6 +183,17 @@ export default function AdminApplicationsPage() {
               )}
             </tbody>
           </table>
+          {(nextCursor || searchPage) && (
+            <div className="border-t border-slate-100 px-3 py-2 text-center dark:border-slate-800">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="rounded-md bg-slate-900 px-3 py-1 text-xs font-medium text-white hover:bg-slate-800 disabled:opacity-60 dark:bg-slate-800 dark:hover:bg-slate-700"
+              >
+                {loadingMore ? "Loading…" : "Load more"}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
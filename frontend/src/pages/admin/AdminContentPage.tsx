@@ -3,7 +3,7 @@
 import { useEffect, useState, type FormEvent } from "react";
 import { useNavigate } from "react-router-dom";
 import { useContent } from "../../contexts/ContentContext";
-import { updateContent } from "../../api/content";
+import { contentMergePatch, patchContent } from "../../api/content";
 import type {
   SiteContent,
   ServiceItem,
@@ -196,7 +196,7 @@ export default function AdminContentPage() {
 
   const handleSave = async (e: FormEvent) => {
     e.preventDefault();
-    if (!draft) return;
+    if (!draft || !content) return;
 
     const apiKey = localStorage.getItem(ADMIN_STORAGE_KEY);
     if (!apiKey) {
@@ -205,10 +205,17 @@ export default function AdminContentPage() {
       return;
     }
 
+    // Send only what changed rather than the whole document
+    const patch = contentMergePatch(content, draft);
+    if (Object.keys(patch).length === 0) {
+      setStatus("No changes to save.");
+      return;
+    }
+
     try {
       setSaving(true);
       setStatus(null);
-      await updateContent(draft, apiKey);
+      await patchContent(patch, apiKey);
       setStatus("Content saved successfully.");
       reload();
     } catch (err: unknown) {
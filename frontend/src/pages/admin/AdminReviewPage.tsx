@@ -13,7 +13,11 @@ import {
   ContentContext,
   type ContentContextValue,
 } from "../../contexts/ContentContext";
-import { updateContent, type HomeLayoutVariant } from "../../api/content";
+import {
+  contentMergePatch,
+  patchContent,
+  type HomeLayoutVariant,
+} from "../../api/content";
 import HomeLayoutSelector from "./components/HomeLayoutSelector";
 
 type PreviewTab = "home" | "about" | "services" | "careers" | "contact";
@@ -29,7 +33,8 @@ const TABS: { id: PreviewTab; label: string }[] = [
 const DEFAULT_LAYOUT: HomeLayoutVariant = "classic";
 
 export default function AdminReviewPage() {
-  const { draft, loading, error, updateDraftField } = useAdminDraft();
+  const { original, draft, loading, error, updateDraftField, reloadContent } =
+    useAdminDraft();
   const [activeTab, setActiveTab] = useState<PreviewTab>("home");
 
   const [publishing, setPublishing] = useState(false);
@@ -78,7 +83,7 @@ export default function AdminReviewPage() {
       case "services":
         return <ServicesPage />;
       case "careers":
-        return <CareersPage />;
+        return <CareersPage draft={draft.careers} />;
       case "contact":
         return <ContactPage />;
       default:
@@ -87,7 +92,15 @@ export default function AdminReviewPage() {
   };
 
   const handlePublish = async () => {
-    if (!draft) return;
+    if (!draft || !original) return;
+
+    // Send only the edits rather than the whole document
+    const patch = contentMergePatch(original, draft);
+    if (Object.keys(patch).length === 0) {
+      setPublishStatus("No changes to publish.");
+      setPublishError(null);
+      return;
+    }
 
     const confirmed = window.confirm(
       "Are you sure you want to publish these changes to the live site?"
@@ -106,9 +119,11 @@ export default function AdminReviewPage() {
       setPublishError(null);
       setPublishStatus(null);
 
-      await updateContent(draft, apiKey);
+      await patchContent(patch, apiKey);
 
       setPublishStatus("Changes published successfully.");
+      // Re-seed `original` so the next publish diffs against this one
+      reloadContent();
     } catch (err: unknown) {
       const msg =
         err instanceof Error ? err.message : "Failed to publish changes.";
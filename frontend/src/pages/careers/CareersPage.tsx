@@ -1,57 +1,43 @@
 // src/pages/careers/CareersPage.tsx
-import { useContent } from "../../contexts/ContentContext";
-import type { CareerPosition } from "../../api/content";
+import { useEffect, useState } from "react";
+import {
+  fetchContentSection,
+  type CareersContent,
+  type CareersIntro,
+} from "../../api/content";
 import HeaderSection from "./components/HeaderSection";
 import RolesSection from "./components/RolesSection";
 import ProcessCard from "./components/ProcessCard";
 import ApplicationForm from "./components/ApplicationForm";
 import { useCareersForm } from "./useCareersForm";
 
-export default function CareersPage() {
-  const { content, loading, error } = useContent();
+type CareersPageProps = {
+  // Unpublished careers content to show instead (admin preview)
+  draft?: CareersContent;
+};
 
-  // We may not have content yet on the first render
-  const careers = content?.careers;
+export default function CareersPage({ draft }: CareersPageProps) {
+  // The live page never downloads the whole roles list: it fetches only the
+  // intro, and RolesSection pages through GET /api/careers/positions.
+  const [intro, setIntro] = useState<CareersIntro | undefined>(undefined);
+  const [introError, setIntroError] = useState<string | null>(null);
 
-  const rawPositions = careers?.positions ?? [];
+  useEffect(() => {
+    if (draft) return;
+    fetchContentSection("careers", ["intro"])
+      .then((data) => {
+        const raw: any = data?.intro;
+        // Older content stored the intro as a plain string
+        setIntro(typeof raw === "string" ? { headline: raw } : raw);
+      })
+      .catch((err: any) => {
+        setIntroError(err?.message || "Failed to load careers content");
+      });
+  }, [draft]);
 
-  const positions: CareerPosition[] = rawPositions.map((p: any, index) => {
-    const slug = (p.title || "role")
-      .toLowerCase()
-      .replace(/[^a-z0-9]+/gi, "-")
-      .replace(/(^-|-$)/g, "");
+  const form = useCareersForm(draft?.positions);
 
-    return {
-      // id: existing or generated
-      id: p.id ?? `role-${index}-${slug}`,
-
-      // base fields
-      title: p.title,
-      summary: p.summary,
-      tags: p.tags ?? [],
-
-      // metadata – pass through if present, fall back to safe defaults
-      team: p.team ?? "General",
-      location: p.location ?? "Remote (US)",
-      workMode: p.workMode ?? "remote",
-
-      level: p.level,
-      tagline: p.tagline,
-      salaryRange: p.salaryRange,
-    };
-  });
-
-  const form = useCareersForm(positions);
-
-  if (loading && !content) {
-    return (
-      <p className="text-center text-slate-500 dark:text-slate-400">
-        Loading careers…
-      </p>
-    );
-  }
-
-  if (error && !content) {
+  if (introError && !draft) {
     return (
       <p className="text-center text-red-600">
         Failed to load careers content.
@@ -59,16 +45,14 @@ export default function CareersPage() {
     );
   }
 
-  if (!content || !careers) return null;
-
   return (
     <div className="w-full bg-slate-50 text-slate-900 dark:bg-slate-950 dark:text-slate-50">
-      <HeaderSection intro={careers.intro} />
+      <HeaderSection intro={draft ? draft.intro : intro} />
 
       <section className="mx-auto max-w-6xl px-4 py-10 sm:px-6 lg:px-8 lg:py-14 space-y-8">
         <div className="grid gap-8 lg:grid-cols-[minmax(0,1.7fr),minmax(0,0.9fr)]">
           <section className="space-y-6">
-            <RolesSection positions={positions} form={form} />
+            <RolesSection form={form} />
             <ProcessCard />
           </section>
 
@@ -77,4 +61,4 @@ export default function CareersPage() {
       </section>
     </div>
   );
-}
\ No newline at end of file
+}
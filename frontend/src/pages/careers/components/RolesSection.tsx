@@ -4,7 +4,6 @@ import type { CareerPosition } from "../../../api/content";
 import type { CareersFormState, WorkMode } from "../useCareersForm";
 
 type RolesSectionProps = {
-  positions: CareerPosition[];
   form: CareersFormState;
 };
 
@@ -16,8 +15,7 @@ const WORK_MODES: { label: string; value: WorkMode | "all" }[] = [
   { label: "Other", value: "other" },
 ];
 
-const RolesSection: FC<RolesSectionProps> = ({ positions, form }) => {
-  console.log(positions);
+const RolesSection: FC<RolesSectionProps> = ({ form }) => {
   const {
     search,
     teamFilter,
@@ -29,7 +27,10 @@ const RolesSection: FC<RolesSectionProps> = ({ positions, form }) => {
     totalPages,
     setCurrentPage,
 
+    teams,
     paginatedPositions,
+    searching,
+    searchError,
     selectedRoleIds,
     activeApplyRoleId,
     toggleRole,
@@ -39,12 +40,6 @@ const RolesSection: FC<RolesSectionProps> = ({ positions, form }) => {
 
   const [detailsRole, setDetailsRole] = useState<CareerPosition | null>(null);
 
-  // Derive teams from positions so admin can change them over time
-  const allTeams = Array.from(new Set(positions.map((p) => p.team))).sort(
-    (a, b) => a.localeCompare(b)
-  );
-  const TEAMS: string[] = ["All teams", ...allTeams];
-
   return (
     <section className="space-y-6">
       {/* Filters */}
@@ -86,7 +81,7 @@ const RolesSection: FC<RolesSectionProps> = ({ positions, form }) => {
               onChange={(e) => setTeamFilter(e.target.value)}
               className="w-full rounded-xl border border-slate-300 bg-white px-3 py-2 text-xs text-slate-900 focus:border-sky-500 focus:outline-none focus:ring-1 focus:ring-sky-500 dark:border-slate-700 dark:bg-slate-950 dark:text-slate-50"
             >
-              {TEAMS.map((team, index) => (
+              {teams.map((team, index) => (
                 <option key={`${team || "team"}-${index}`} value={team}>
                   {team}
                 </option>
@@ -120,7 +115,11 @@ const RolesSection: FC<RolesSectionProps> = ({ positions, form }) => {
       <div className="space-y-4">
         {paginatedPositions.length === 0 ? (
           <div className="rounded-2xl border border-slate-200 bg-white/90 p-6 text-sm text-slate-600 shadow-sm dark:border-slate-800 dark:bg-slate-900/80 dark:text-slate-300">
-            No roles match those filters yet. Try adjusting the search or team.
+            {searchError
+              ? "Failed to load roles. Please try again later."
+              : searching
+              ? "Loading roles…"
+              : "No roles match those filters yet. Try adjusting the search or team."}
           </div>
         ) : (
           paginatedPositions.map((role) => {
@@ -1,13 +1,16 @@
 // src/pages/careers/useCareersForm.ts
-import { useMemo, useState, type FormEvent } from "react";
+import { useEffect, useMemo, useState, type FormEvent } from "react";
 import type { CareerPosition } from "../../api/content";
-import { submitApplication } from "../../api/careers";
+import {
+  searchPositions,
+  submitApplication,
+  type PositionSearchResult,
+} from "../../api/careers";
 
 export type WorkMode = "remote" | "hybrid" | "onsite" | "other" | "";
 
 export type CareersFormState = {
   // data
-  positions: CareerPosition[];
   search: string;
   teamFilter: string;
   workModeFilter: WorkMode | "all";
@@ -15,9 +18,11 @@ export type CareersFormState = {
   pageSize: number;
 
   // derived
-  filteredPositions: CareerPosition[];
+  teams: string[];
   totalPages: number;
   paginatedPositions: CareerPosition[];
+  searching: boolean;
+  searchError: string | null;
 
   // selection
   selectedRoleIds: string[];
@@ -59,14 +64,51 @@ export type CareersFormState = {
 };
 
 const PAGE_SIZE = 6;
+const ALL_TEAMS = "All teams";
+// Wait for a pause in typing before asking the server
+const SEARCH_DEBOUNCE_MS = 250;
+
+// Fill in what older content leaves out; positions without an id get one
+// from their title
+export function toCareerPosition(p: any): CareerPosition {
+  const slug = (p.title || "role")
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/gi, "-")
+    .replace(/(^-|-$)/g, "");
 
-export function useCareersForm(positions: CareerPosition[]): CareersFormState {
+  return {
+    id: p.id ?? `role-${slug}`,
+    title: p.title,
+    summary: p.summary,
+    tags: p.tags ?? [],
+    team: p.team ?? "General",
+    location: p.location ?? "Remote (US)",
+    workMode: p.workMode ?? "remote",
+    level: p.level,
+    tagline: p.tagline,
+    salaryRange: p.salaryRange,
+  };
+}
+
+/**
+ * Roles list state plus the application form. The published roles are
+ * searched, filtered and paged server-side (GET /api/careers/positions);
+ * pass `draftPositions` to filter an unpublished list in the browser
+ * instead (admin preview).
+ */
+export function useCareersForm(draftPositions?: CareerPosition[]): CareersFormState {
   const [search, setSearch] = useState("");
-  const [teamFilter, setTeamFilter] = useState<string>("All teams");
+  const [debouncedSearch, setDebouncedSearch] = useState("");
+  const [teamFilter, setTeamFilter] = useState<string>(ALL_TEAMS);
   const [workModeFilter, setWorkModeFilter] = useState<WorkMode | "all">("all");
   const [currentPage, setCurrentPage] = useState(1);
 
-  const [selectedRoleIds, setSelectedRoleIds] = useState<string[]>([]);
+  const [result, setResult] = useState<PositionSearchResult | null>(null);
+  const [searching, setSearching] = useState(false);
+  const [searchError, setSearchError] = useState<string | null>(null);
+
+  // Whole roles, so selections survive paging and filtering
+  const [selectedRoles, setSelectedRoles] = useState<CareerPosition[]>([]);
   const [sidebarOpen, setSidebarOpen] = useState(true);
   const [activeApplyRoleId, setActiveApplyRoleId] = useState<string | null>(null);
 
@@ -81,9 +123,52 @@ export function useCareersForm(positions: CareerPosition[]): CareersFormState {
   const [submitError, setSubmitError] = useState<string | null>(null);
   const [submitSuccess, setSubmitSuccess] = useState(false);
 
-  const filteredPositions = useMemo(() => {
+  useEffect(() => {
+    const timer = setTimeout(
+      () => setDebouncedSearch(search.trim()),
+      SEARCH_DEBOUNCE_MS
+    );
+    return () => clearTimeout(timer);
+  }, [search]);
+
+  const isDraft = draftPositions !== undefined;
+
+  useEffect(() => {
+    if (isDraft) return;
+    let cancelled = false;
+    setSearching(true);
+    searchPositions({
+      q: debouncedSearch || undefined,
+      team: teamFilter === ALL_TEAMS ? undefined : [teamFilter],
+      workMode:
+        workModeFilter === "all"
+          ? undefined
+          : workModeFilter === "onsite"
+          ? ["onsite", "on-site"]
+          : [workModeFilter],
+      page: currentPage,
+      pageSize: PAGE_SIZE,
+    })
+      .then((data) => {
+        if (cancelled) return;
+        setResult(data);
+        setSearchError(null);
+      })
+      .catch((err: any) => {
+        if (!cancelled) setSearchError(err?.message || "Failed to load roles");
+      })
+      .finally(() => {
+        if (!cancelled) setSearching(false);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [isDraft, debouncedSearch, teamFilter, workModeFilter, currentPage]);
+
+  const filteredDraft = useMemo(() => {
+    if (!draftPositions) return null;
     const q = search.toLowerCase();
-    return positions.filter((p) => {
+    return draftPositions.filter((p) => {
       const title = p.title?.toLowerCase() ?? "";
       const team = p.team?.toLowerCase() ?? "";
       const location = p.location?.toLowerCase() ?? "";
@@ -93,7 +178,7 @@ export function useCareersForm(positions: CareerPosition[]): CareersFormState {
         !q || title.includes(q) || team.includes(q) || location.includes(q);
 
       const matchesTeam =
-        teamFilter === "All teams" || p.team === teamFilter;
+        teamFilter === ALL_TEAMS || p.team === teamFilter;
 
       const matchesMode =
         workModeFilter === "all" ||
@@ -102,33 +187,52 @@ export function useCareersForm(positions: CareerPosition[]): CareersFormState {
 
       return matchesSearch && matchesTeam && matchesMode;
     });
-  }, [positions, search, teamFilter, workModeFilter]);
-
-  const totalPages = Math.max(1, Math.ceil(filteredPositions.length / PAGE_SIZE));
-  const paginatedPositions = filteredPositions.slice(
-    (currentPage - 1) * PAGE_SIZE,
-    currentPage * PAGE_SIZE
+  }, [draftPositions, search, teamFilter, workModeFilter]);
+
+  const paginatedPositions = useMemo(
+    () =>
+      filteredDraft
+        ? filteredDraft.slice(
+            (currentPage - 1) * PAGE_SIZE,
+            currentPage * PAGE_SIZE
+          )
+        : (result?.positions ?? []).map(toCareerPosition),
+    [filteredDraft, result, currentPage]
   );
-
-  const selectedRoles = useMemo(
-    () => positions.filter((p) => selectedRoleIds.includes(p.id)),
-    [positions, selectedRoleIds]
+  const total = filteredDraft ? filteredDraft.length : result?.total ?? 0;
+  const totalPages = Math.max(1, Math.ceil(total / PAGE_SIZE));
+
+  // Teams come from the roles themselves so admins can change them over time
+  const teams = useMemo(() => {
+    const names = draftPositions
+      ? draftPositions.map((p) => p.team)
+      : Object.keys(result?.facets.team ?? {});
+    if (teamFilter !== ALL_TEAMS) names.push(teamFilter);
+    const unique = Array.from(new Set(names)).sort((a, b) => a.localeCompare(b));
+    return [ALL_TEAMS, ...unique];
+  }, [draftPositions, result, teamFilter]);
+
+  const selectedRoleIds = useMemo(
+    () => selectedRoles.map((r) => r.id),
+    [selectedRoles]
   );
 
   const toggleRole = (id: string) => {
-    setSelectedRoleIds((prev) =>
-      prev.includes(id) ? prev.filter((r) => r !== id) : [...prev, id]
-    );
+    setSelectedRoles((prev) => {
+      if (prev.some((r) => r.id === id)) return prev.filter((r) => r.id !== id);
+      const role = paginatedPositions.find((p) => p.id === id);
+      return role ? [...prev, role] : prev;
+    });
   };
 
   const clearSelection = () => {
-    setSelectedRoleIds([]);
+    setSelectedRoles([]);
     setActiveApplyRoleId(null);
   };
 
   const openQuickApply = (id: string) => {
     if (!selectedRoleIds.includes(id)) {
-      setSelectedRoleIds((prev) => [...prev, id]);
+      toggleRole(id);
     }
     setActiveApplyRoleId(id);
     setSidebarOpen(true); // ensure the right panel is visible
@@ -198,16 +302,17 @@ export function useCareersForm(positions: CareerPosition[]): CareersFormState {
   };
 
   return {
-    positions,
     search,
     teamFilter,
     workModeFilter,
     currentPage,
     pageSize: PAGE_SIZE,
 
-    filteredPositions,
+    teams,
     totalPages,
     paginatedPositions,
+    searching,
+    searchError,
 
     selectedRoleIds,
     selectedRoles,
@@ -5,7 +5,7 @@ import DeliveryApproachSection from "./components/DeliveryApproachSection";
 import EngagementModelsSection from "./components/EngagementModelsSection";
 
 export default function ServicesPage() {
-  const { content, loading, error } = useContent();
+  const { content, loading, error } = useContent(["services"]);
 
   if (loading && !content) {
     return (